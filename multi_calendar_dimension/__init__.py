@@ -10,16 +10,16 @@ __version__ = "1.0.5"
 __author__ = "Pouya Kia"
 __email__ = "kiaa.pouya@gmail.com"
 
-# Main classes
-from .generator.dimension import DateDimensionGenerator, DateDimensionConfig
-from .generator.range_generator import DateRangeGenerator, DateRangeConfig, CalendarType
-from .current.now import CurrentDate
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 # Converter functions (these don't require pandas)
 from .converters.jalali import (
     jalali_to_gregorian,
     gregorian_to_jalali,
-    is_leap_year_persian
+    is_leap_year_persian,
+    jalali_to_gregorian_array,
+    gregorian_to_jalali_array
 )
 
 from .converters.hijri import (
@@ -28,23 +28,79 @@ from .converters.hijri import (
     is_hijri_leap,
     get_hijri_month_name,
     HIJRI_MONTH_NAMES,
-    HIJRI_MONTH_NAMES_EN
+    HIJRI_MONTH_NAMES_EN,
+    gregorian_to_hijri_array,
+    hijri_to_gregorian_array
 )
 
 from .converters.cross import (
     jalali_to_hijri,
-    hijri_to_jalali
+    hijri_to_jalali,
+    jalali_to_hijri_array,
+    hijri_to_jalali_array
 )
 
-# Events (these don't require pandas)
-from .events import (
-    persian_events, persian_events_en, persian_holidays, hijri_official_holidays,
-    gregorian_events_en, gregorian_events_fa, gregorian_holidays,
-    hijri_events, hijri_events_en, hijri_holidays
-)
+from .converters.table import ConversionTable, get_conversion_table
+
+# Everything else is imported on first access (PEP 562), so that the converters
+# load without pandas and without materializing the event tables
+_LAZY_IMPORTS = {
+    # Main classes
+    'DateDimensionGenerator': '.generator.dimension',
+    'DateDimensionConfig': '.generator.dimension',
+    'DateRangeGenerator': '.generator.range_generator',
+    'DateRangeConfig': '.generator.range_generator',
+    'CalendarType': '.generator.range_generator',
+    'CurrentDate': '.current.now',
+    
+    # Events
+    'persian_events': '.events',
+    'persian_events_en': '.events',
+    'persian_holidays': '.events',
+    'hijri_official_holidays': '.events',
+    'gregorian_events_en': '.events',
+    'gregorian_events_fa': '.events',
+    'gregorian_holidays': '.events',
+    'hijri_events': '.events',
+    'hijri_events_en': '.events',
+    'hijri_holidays': '.events',
+    
+    # Utilities
+    'is_iranian_holiday': '.utils',
+    'get_all_holidays_for_jalali_date': '.utils',
+    'is_iranian_holiday_batch': '.utils',
+    'BusinessCalendar': '.utils',
+    'get_business_calendar': '.utils',
+}
+
+if TYPE_CHECKING:
+    from .generator.dimension import DateDimensionGenerator, DateDimensionConfig
+    from .generator.range_generator import DateRangeGenerator, DateRangeConfig, CalendarType
+    from .current.now import CurrentDate
+    from .events import (
+        persian_events, persian_events_en, persian_holidays, hijri_official_holidays,
+        gregorian_events_en, gregorian_events_fa, gregorian_holidays,
+        hijri_events, hijri_events_en, hijri_holidays
+    )
+    from .utils import (
+        is_iranian_holiday, get_all_holidays_for_jalali_date, is_iranian_holiday_batch,
+        BusinessCalendar, get_business_calendar
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Later lookups find the name directly
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Utilities
-from .utils import is_iranian_holiday, get_all_holidays_for_jalali_date
 
 __all__ = [
     # Main classes
@@ -59,6 +115,8 @@ __all__ = [
     'jalali_to_gregorian',
     'gregorian_to_jalali',
     'is_leap_year_persian',
+    'jalali_to_gregorian_array',
+    'gregorian_to_jalali_array',
     
     # Hijri converters
     'gregorian_to_hijri',
@@ -67,10 +125,18 @@ __all__ = [
     'get_hijri_month_name',
     'HIJRI_MONTH_NAMES',
     'HIJRI_MONTH_NAMES_EN',
+    'gregorian_to_hijri_array',
+    'hijri_to_gregorian_array',
     
     # Cross converters
     'jalali_to_hijri',
     'hijri_to_jalali',
+    'jalali_to_hijri_array',
+    'hijri_to_jalali_array',
+    
+    # Lookup table
+    'ConversionTable',
+    'get_conversion_table',
     
     # Events
     'persian_events',
@@ -87,4 +153,7 @@ __all__ = [
     # Utilities
     'is_iranian_holiday',
     'get_all_holidays_for_jalali_date',
+    'is_iranian_holiday_batch',
+    'BusinessCalendar',
+    'get_business_calendar',
 ]
@@ -6,13 +6,10 @@ Command Line Interface for multi-calendar-dimension
 import argparse
 import sys
 from datetime import datetime
-from multi_calendar_dimension import (
-    DateDimensionGenerator, DateRangeGenerator, CurrentDate,
-    jalali_to_gregorian, gregorian_to_jalali, gregorian_to_hijri,
-    CalendarType
-)
-from multi_calendar_dimension.generator.dimension import DateDimensionConfig
-from multi_calendar_dimension.generator.range_generator import DateRangeConfig
+from multi_calendar_dimension import jalali_to_gregorian, gregorian_to_jalali, gregorian_to_hijri
+
+# The generators, CurrentDate and the cache are imported by the commands that
+# use them, so that 'convert' starts without loading pandas
 
 
 def convert_date(args):
@@ -40,7 +37,9 @@ def convert_date(args):
 
 def current_date(args):
     """Show current date in all calendars"""
-    current = CurrentDate()
+    from multi_calendar_dimension.current.now import CurrentDate
+    
+    current = CurrentDate(tz=args.tz)
     today = current.now(language=args.language)
     
     print(f"Current Date Information:")
@@ -58,21 +57,32 @@ def current_date(args):
 
 def generate_dimension(args):
     """Generate date dimension table"""
+    from multi_calendar_dimension.generator.dimension import DateDimensionGenerator, DateDimensionConfig
+    
     config = DateDimensionConfig(
         start_year=args.start_year,
         end_year=args.end_year,
         include_events=args.include_events,
-        include_holidays=args.include_holidays
+        include_holidays=args.include_holidays,
+        workers=args.workers,
+        cache=args.cache,
+        cache_dir=args.cache_dir
     )
     
     generator = DateDimensionGenerator(config)
     
     if args.output_format == 'excel':
-        filename = generator.to_excel(args.output_file)
+        filename = generator.to_excel(args.output_file, streaming=args.streaming_excel)
         print(f"Generated Excel file: {filename}")
     elif args.output_format == 'csv':
         filename = generator.to_csv(args.output_file)
         print(f"Generated CSV file: {filename}")
+    elif args.output_format == 'parquet':
+        filename = generator.to_parquet(args.output_file)
+        print(f"Generated Parquet file: {filename}")
+    elif args.output_format == 'arrow':
+        filename = generator.to_arrow(args.output_file)
+        print(f"Generated Arrow file: {filename}")
     else:
         df = generator.to_dataframe()
         print(f"Generated DataFrame with {len(df):,} rows and {len(df.columns)} columns")
@@ -81,6 +91,8 @@ def generate_dimension(args):
 
 def generate_range(args):
     """Generate date range table"""
+    from multi_calendar_dimension.generator.range_generator import DateRangeGenerator, DateRangeConfig, CalendarType
+    
     calendar_type = CalendarType.JALALI if args.calendar == 'jalali' else \
                    CalendarType.GREGORIAN if args.calendar == 'gregorian' else \
                    CalendarType.HIJRI
@@ -92,17 +104,26 @@ def generate_range(args):
         end_year=args.end_year,
         end_month=args.end_month,
         include_events=args.include_events,
-        include_holidays=args.include_holidays
+        include_holidays=args.include_holidays,
+        workers=args.workers,
+        cache=args.cache,
+        cache_dir=args.cache_dir
     )
     
     generator = DateRangeGenerator(config)
     
     if args.output_format == 'excel':
-        filename = generator.to_excel(args.output_file)
+        filename = generator.to_excel(args.output_file, streaming=args.streaming_excel)
         print(f"Generated Excel file: {filename}")
     elif args.output_format == 'csv':
         filename = generator.to_csv(args.output_file)
         print(f"Generated CSV file: {filename}")
+    elif args.output_format == 'parquet':
+        filename = generator.to_parquet(args.output_file)
+        print(f"Generated Parquet file: {filename}")
+    elif args.output_format == 'arrow':
+        filename = generator.to_arrow(args.output_file)
+        print(f"Generated Arrow file: {filename}")
     else:
         df = generator.to_dataframe()
         summary = generator.get_summary()
@@ -110,6 +131,22 @@ def generate_range(args):
         print(f"Date range: {summary['start_date']} to {summary['end_date']}")
 
 
+def manage_cache(args: argparse.Namespace) -> None:
+    """Show or clear the on-disk dimension cache"""
+    from multi_calendar_dimension.generator.cache import DimensionCache
+    
+    cache = DimensionCache(args.cache_dir)
+    
+    if args.action == 'clear':
+        removed = cache.clear()
+        print(f"Removed {removed} cached tables from {cache.directory}")
+    else:
+        stats = cache.stats()
+        print(f"Cache directory: {stats['directory']}")
+        print(f"Entries: {stats['entries']}")
+        print(f"Size: {stats['total_bytes'] / 1024**2:,.1f} MB of {stats['max_bytes'] / 1024**2:,.0f} MB")
+
+
 def main():
     """Main CLI function"""
     parser = argparse.ArgumentParser(
@@ -128,6 +165,9 @@ Examples:
   
   # Generate monthly range
   multi-calendar generate-range --calendar jalali --start-year 1403 --start-month 1 --end-year 1403 --end-month 6
+  
+  # Show or clear the on-disk cache
+  multi-calendar cache stats
         """
     )
     
@@ -146,6 +186,8 @@ Examples:
     current_parser = subparsers.add_parser('current', help='Show current date in all calendars')
     current_parser.add_argument('--language', choices=['fa', 'en'], default='fa', 
                                help='Language for events (default: fa)')
+    current_parser.add_argument('--tz', default=None,
+                               help='Time zone that decides the current day (default: Asia/Tehran)')
     
     # Generate dimension command
     dim_parser = subparsers.add_parser('generate-dimension', help='Generate date dimension table')
@@ -155,9 +197,16 @@ Examples:
                            help='Include events')
     dim_parser.add_argument('--include-holidays', action='store_true', default=True, 
                            help='Include holidays')
-    dim_parser.add_argument('--output-format', choices=['excel', 'csv', 'dataframe'], 
+    dim_parser.add_argument('--output-format', choices=['excel', 'csv', 'parquet', 'arrow', 'dataframe'], 
                            default='dataframe', help='Output format')
     dim_parser.add_argument('--output-file', help='Output filename')
+    dim_parser.add_argument('--streaming-excel', action='store_true',
+                           help='Write Excel output with a constant-memory writer, splitting sheets past 1,048,576 rows')
+    dim_parser.add_argument('--workers', type=int, default=1,
+                           help='Processes used to build year shards in parallel (default: 1)')
+    dim_parser.add_argument('--cache', action='store_true',
+                           help='Reuse tables stored in the on-disk cache')
+    dim_parser.add_argument('--cache-dir', help='Cache directory (default: ~/.cache/multi_calendar_dimension)')
     
     # Generate range command
     range_parser = subparsers.add_parser('generate-range', help='Generate date range table')
@@ -171,9 +220,21 @@ Examples:
                              help='Include events')
     range_parser.add_argument('--include-holidays', action='store_true', default=True, 
                              help='Include holidays')
-    range_parser.add_argument('--output-format', choices=['excel', 'csv', 'dataframe'], 
+    range_parser.add_argument('--output-format', choices=['excel', 'csv', 'parquet', 'arrow', 'dataframe'], 
                              default='dataframe', help='Output format')
     range_parser.add_argument('--output-file', help='Output filename')
+    range_parser.add_argument('--streaming-excel', action='store_true',
+                             help='Write Excel output with a constant-memory writer, splitting sheets past 1,048,576 rows')
+    range_parser.add_argument('--workers', type=int, default=1,
+                             help='Processes used to build year shards in parallel (default: 1)')
+    range_parser.add_argument('--cache', action='store_true',
+                             help='Reuse tables stored in the on-disk cache')
+    range_parser.add_argument('--cache-dir', help='Cache directory (default: ~/.cache/multi_calendar_dimension)')
+    
+    # Cache command
+    cache_parser = subparsers.add_parser('cache', help='Manage the on-disk dimension cache')
+    cache_parser.add_argument('action', choices=['stats', 'clear'], help='Show statistics or remove every entry')
+    cache_parser.add_argument('--cache-dir', help='Cache directory (default: ~/.cache/multi_calendar_dimension)')
     
     args = parser.parse_args()
     
@@ -190,6 +251,8 @@ Examples:
             generate_dimension(args)
         elif args.command == 'generate-range':
             generate_range(args)
+        elif args.command == 'cache':
+            manage_cache(args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
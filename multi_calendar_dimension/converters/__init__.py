@@ -2,20 +2,53 @@
 Converters package for multi-calendar operations
 """
 
-from .jalali import jalali_to_gregorian, gregorian_to_jalali, is_leap_year_persian
-from .hijri import gregorian_to_hijri, hijri_to_gregorian, is_hijri_leap, get_hijri_month_name, HIJRI_MONTH_NAMES, HIJRI_MONTH_NAMES_EN
-from .cross import jalali_to_hijri, hijri_to_jalali
+from .jalali import (
+    jalali_to_gregorian, gregorian_to_jalali, is_leap_year_persian,
+    jalali_to_gregorian_array, gregorian_to_jalali_array
+)
+from .hijri import (
+    gregorian_to_hijri, hijri_to_gregorian, is_hijri_leap, get_hijri_month_name,
+    HIJRI_MONTH_NAMES, HIJRI_MONTH_NAMES_EN,
+    gregorian_to_hijri_array, hijri_to_gregorian_array
+)
+from .cross import jalali_to_hijri, hijri_to_jalali, jalali_to_hijri_array, hijri_to_jalali_array
+from .jdn import (
+    gregorian_to_jdn, jdn_to_gregorian, jalali_to_jdn, jdn_to_jalali, hijri_to_jdn, jdn_to_hijri,
+    gregorian_to_jdn_array, jdn_to_gregorian_array, jalali_to_jdn_array, jdn_to_jalali_array,
+    hijri_to_jdn_array, jdn_to_hijri_array
+)
+from .table import ConversionTable, get_conversion_table
 
 __all__ = [
     'jalali_to_gregorian',
     'gregorian_to_jalali', 
     'is_leap_year_persian',
+    'jalali_to_gregorian_array',
+    'gregorian_to_jalali_array',
     'gregorian_to_hijri',
     'hijri_to_gregorian',
+    'gregorian_to_hijri_array',
+    'hijri_to_gregorian_array',
     'is_hijri_leap',
     'get_hijri_month_name',
     'HIJRI_MONTH_NAMES',
     'HIJRI_MONTH_NAMES_EN',
     'jalali_to_hijri',
-    'hijri_to_jalali'
+    'hijri_to_jalali',
+    'jalali_to_hijri_array',
+    'hijri_to_jalali_array',
+    'gregorian_to_jdn',
+    'jdn_to_gregorian',
+    'jalali_to_jdn',
+    'jdn_to_jalali',
+    'hijri_to_jdn',
+    'jdn_to_hijri',
+    'gregorian_to_jdn_array',
+    'jdn_to_gregorian_array',
+    'jalali_to_jdn_array',
+    'jdn_to_jalali_array',
+    'hijri_to_jdn_array',
+    'jdn_to_hijri_array',
+    'ConversionTable',
+    'get_conversion_table'
 ]
@@ -3,9 +3,15 @@ Cross-calendar conversion functions
 تبدیل مستقیم بین تقویم‌های شمسی و قمری
 """
 
-from typing import Tuple
-from .jalali import jalali_to_gregorian, gregorian_to_jalali
-from .hijri import gregorian_to_hijri, hijri_to_gregorian
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .jdn import (
+    jalali_to_jdn, jdn_to_jalali, hijri_to_jdn, jdn_to_hijri,
+    jalali_to_jdn_array, jdn_to_jalali_array, hijri_to_jdn_array, jdn_to_hijri_array
+)
 
 
 def jalali_to_hijri(jy: int, jm: int, jd: int) -> Tuple[int, int, int]:
@@ -24,13 +30,7 @@ def jalali_to_hijri(jy: int, jm: int, jd: int) -> Tuple[int, int, int]:
         >>> jalali_to_hijri(1403, 1, 1)
         (1445, 9, 10)
     """
-    # Convert Jalali to Gregorian first
-    gy, gm, gd = jalali_to_gregorian(jy, jm, jd)
-    
-    # Convert Gregorian to Hijri
-    hy, hm, hd = gregorian_to_hijri(gy, gm, gd)
-    
-    return hy, hm, hd
+    return jdn_to_hijri(jalali_to_jdn(int(jy), int(jm), int(jd)))
 
 
 def hijri_to_jalali(hy: int, hm: int, hd: int) -> Tuple[int, int, int]:
@@ -49,10 +49,36 @@ def hijri_to_jalali(hy: int, hm: int, hd: int) -> Tuple[int, int, int]:
         >>> hijri_to_jalali(1445, 9, 10)
         (1403, 1, 1)
     """
-    # Convert Hijri to Gregorian first
-    gy, gm, gd = hijri_to_gregorian(hy, hm, hd)
+    return jdn_to_jalali(hijri_to_jdn(int(hy), int(hm), int(hd)))
+
+
+def jalali_to_hijri_array(jy: ArrayLike, jm: Optional[ArrayLike] = None,
+                          jd: Optional[ArrayLike] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert arrays of Jalali (Persian) dates to Hijri dates
     
-    # Convert Gregorian to Jalali
-    jy, jm, jd = gregorian_to_jalali(gy, gm, gd)
+    Args:
+        jy: Jalali years, or packed YYYYMMDD dates when jm and jd are omitted
+        jm: Jalali months (1-12)
+        jd: Jalali days (1-31)
+        
+    Returns:
+        Tuple of int64 arrays (Hijri years, Hijri months, Hijri days)
+    """
+    return jdn_to_hijri_array(jalali_to_jdn_array(jy, jm, jd))
+
+
+def hijri_to_jalali_array(hy: ArrayLike, hm: Optional[ArrayLike] = None,
+                          hd: Optional[ArrayLike] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert arrays of Hijri dates to Jalali (Persian) dates
     
-    return jy, jm, jd
+    Args:
+        hy: Hijri years, or packed YYYYMMDD dates when hm and hd are omitted
+        hm: Hijri months (1-12)
+        hd: Hijri days (1-30)
+        
+    Returns:
+        Tuple of int64 arrays (Jalali years, Jalali months, Jalali days)
+    """
+    return jdn_to_jalali_array(hijri_to_jdn_array(hy, hm, hd))
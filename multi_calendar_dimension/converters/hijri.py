@@ -3,8 +3,15 @@ Hijri (Islamic) calendar conversion functions using Umm al-Qura algorithm
 """
 
 import math
-from typing import Tuple
-from .ummalqura_data import UMMALQURA_DATA, get_index
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .jdn import (
+    gregorian_to_jdn, jdn_to_gregorian, hijri_to_jdn, jdn_to_hijri,
+    gregorian_to_jdn_array, jdn_to_gregorian_array, hijri_to_jdn_array, jdn_to_hijri_array
+)
 
 
 HIJRI_MONTH_NAMES = {
@@ -68,30 +75,7 @@ def gregorian_to_hijri(year: int, month: int, day: int) -> Tuple[int, int, int]:
         >>> gregorian_to_hijri(2023, 7, 19)
         (1445, 1, 1)
     """
-    day = int(day)
-    m = int(month)
-    y = int(year)
-
-    if m < 3:
-        y -= 1
-        m += 12
-
-    a = math.floor(y / 100.)
-    jgc = a - math.floor(a / 4.) - 2
-
-    cjdn = math.floor(365.25 * (y + 4716)) + math.floor(30.6001 * (m + 1)) + day - jgc - 1524
-
-    mcjdn = cjdn - 2400000
-
-    index = get_index(mcjdn)
-
-    iln = index + 16260
-    ii = math.floor((iln - 1) / 12)
-    iy = ii + 1
-    im = iln - 12 * ii
-    id_ = mcjdn - UMMALQURA_DATA[index - 1] + 1
-    
-    return int(iy), int(im), int(id_)
+    return jdn_to_hijri(gregorian_to_jdn(int(year), int(month), int(day)))
 
 
 def hijri_to_gregorian(year: int, month: int, day: int) -> Tuple[int, int, int]:
@@ -110,20 +94,62 @@ def hijri_to_gregorian(year: int, month: int, day: int) -> Tuple[int, int, int]:
         >>> hijri_to_gregorian(1445, 1, 1)
         (2023, 7, 19)
     """
-    year = int(year)
-    month = int(month)
-    day = int(day)
+    return jdn_to_gregorian(hijri_to_jdn(int(year), int(month), int(day)))
+
+
+def gregorian_to_hijri_array(gy: ArrayLike, gm: Optional[ArrayLike] = None,
+                             gd: Optional[ArrayLike] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert arrays of Gregorian dates to Hijri dates using Umm al-Qura algorithm.
     
-    iy = year
-    im = month
-    id_ = day
-    ii = iy - 1
-    iln = (ii * 12) + 1 + (im - 1)
-    i = iln - 16260
-    mcjdn = id_ + UMMALQURA_DATA[i - 1] - 1
-    cjdn = mcjdn + 2400000
+    Vectorized counterpart of :func:`gregorian_to_hijri`. The day number is
+    computed with integer arithmetic and months are found with
+    ``np.searchsorted`` over the Umm al-Qura table.
     
-    return julian_to_gregorian(cjdn)
+    Args:
+        gy: Gregorian years, or packed YYYYMMDD dates when gm and gd are omitted
+        gm: Gregorian months (1-12)
+        gd: Gregorian days (1-31)
+        
+    Returns:
+        Tuple of int64 arrays (Hijri years, Hijri months, Hijri days)
+        
+    Raises:
+        ValueError: If a date falls outside the Umm al-Qura table
+        
+    Example:
+        >>> hy, hm, hd = gregorian_to_hijri_array(np.array([20230719]))
+        >>> hy.tolist(), hm.tolist(), hd.tolist()
+        ([1445], [1], [1])
+    """
+    return jdn_to_hijri_array(gregorian_to_jdn_array(gy, gm, gd))
+
+
+def hijri_to_gregorian_array(hy: ArrayLike, hm: Optional[ArrayLike] = None,
+                             hd: Optional[ArrayLike] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert arrays of Hijri dates to Gregorian dates using Umm al-Qura algorithm.
+    
+    Vectorized counterpart of :func:`hijri_to_gregorian` using integer
+    arithmetic only.
+    
+    Args:
+        hy: Hijri years, or packed YYYYMMDD dates when hm and hd are omitted
+        hm: Hijri months (1-12)
+        hd: Hijri days (1-30)
+        
+    Returns:
+        Tuple of int64 arrays (Gregorian years, Gregorian months, Gregorian days)
+        
+    Raises:
+        ValueError: If a date falls outside the Umm al-Qura table
+        
+    Example:
+        >>> gy, gm, gd = hijri_to_gregorian_array(np.array([14450101]))
+        >>> gy.tolist(), gm.tolist(), gd.tolist()
+        ([2023], [7], [19])
+    """
+    return jdn_to_gregorian_array(hijri_to_jdn_array(hy, hm, hd))
 
 
 def julian_to_gregorian(julian_date: float) -> Tuple[int, int, int]:
@@ -3,7 +3,15 @@ Jalali (Persian) calendar conversion functions
 تبدیل تاریخ شمسی به میلادی و برعکس
 """
 
-from typing import Tuple
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .jdn import (
+    gregorian_to_jdn, jdn_to_gregorian, jalali_to_jdn, jdn_to_jalali,
+    gregorian_to_jdn_array, jdn_to_gregorian_array, jalali_to_jdn_array, jdn_to_jalali_array
+)
 
 
 def is_leap_year_persian(year: int) -> bool:
@@ -41,29 +49,7 @@ def jalali_to_gregorian(jy: int, jm: int, jd: int) -> Tuple[int, int, int]:
         >>> jalali_to_gregorian(1403, 1, 1)
         (2024, 3, 20)
     """
-    jy += 1595
-    days = -355668 + (365*jy) + ((jy//33)*8) + (((jy%33)+3)//4) + (31*(jm-1) if jm < 7 else (186 + (jm-7)*30)) + jd
-    gy = 400 * (days // 146097)
-    days %= 146097
-    leap = True
-    if days > 36524:
-        gy += 100*(days//36524)
-        days %= 36524
-        if days >= 365:
-            days += 1
-        else:
-            leap = False
-    gy += 4*(days//1461)
-    days %= 1461
-    if days > 365:
-        gy += (days-1)//365
-        days = (days-1)%365
-        leap = False
-    gd_m = [0,31,59,90,120,151,181,212,243,273,304,334]
-    for i in range(1,13):
-        v = gd_m[i-1] + (1 if i > 2 and leap else 0)
-        if i == 12 or days < gd_m[i] + (1 if i+1 > 2 and leap else 0):
-            return gy, i, days - v + 1
+    return jdn_to_gregorian(jalali_to_jdn(jy, jm, jd))
 
 
 def gregorian_to_jalali(gy: int, gm: int, gd: int) -> Tuple[int, int, int]:
@@ -82,32 +68,52 @@ def gregorian_to_jalali(gy: int, gm: int, gd: int) -> Tuple[int, int, int]:
         >>> gregorian_to_jalali(2024, 3, 20)
         (1403, 1, 1)
     """
-    gy -= 1600
-    gm -= 1
-    gd -= 1
-    
-    g_day_no = 365*gy + (gy+3)//4 - (gy+99)//100 + (gy+399)//400
-    g_day_no += [0,31,59,90,120,151,181,212,243,273,304,334][gm]
-    if gm > 1 and ((gy%4 == 0 and gy%100 != 0) or (gy%400 == 0)):
-        g_day_no += 1
-    g_day_no += gd
-    
-    j_day_no = g_day_no - 79
-    j_np = j_day_no // 12053
-    j_day_no %= 12053
+    return jdn_to_jalali(gregorian_to_jdn(gy, gm, gd))
+
+
+def jalali_to_gregorian_array(jy: ArrayLike, jm: Optional[ArrayLike] = None,
+                              jd: Optional[ArrayLike] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert arrays of Jalali (Persian) dates to Gregorian dates
     
-    jy = 979 + 33*j_np + 4*(j_day_no//1461)
-    j_day_no %= 1461
+    Vectorized counterpart of :func:`jalali_to_gregorian` using integer
+    arithmetic only, with no per-element Python calls.
     
-    if j_day_no >= 366:
-        jy += (j_day_no-1)//365
-        j_day_no = (j_day_no-1)%365
+    Args:
+        jy: Jalali years, or packed YYYYMMDD dates when jm and jd are omitted
+        jm: Jalali months (1-12)
+        jd: Jalali days (1-31)
+        
+    Returns:
+        Tuple of int64 arrays (Gregorian years, Gregorian months, Gregorian days)
+        
+    Example:
+        >>> gy, gm, gd = jalali_to_gregorian_array(np.array([14030101, 14030231]))
+        >>> gy.tolist(), gm.tolist(), gd.tolist()
+        ([2024, 2024], [3, 5], [20, 21])
+    """
+    return jdn_to_gregorian_array(jalali_to_jdn_array(jy, jm, jd))
+
+
+def gregorian_to_jalali_array(gy: ArrayLike, gm: Optional[ArrayLike] = None,
+                              gd: Optional[ArrayLike] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert arrays of Gregorian dates to Jalali (Persian) dates
     
-    if j_day_no < 186:
-        jm = 1 + j_day_no//31
-        jd = 1 + j_day_no%31
-    else:
-        jm = 7 + (j_day_no-186)//30
-        jd = 1 + (j_day_no-186)%30
+    Vectorized counterpart of :func:`gregorian_to_jalali` using integer
+    arithmetic only, with no per-element Python calls.
     
-    return jy, jm, jd
+    Args:
+        gy: Gregorian years, or packed YYYYMMDD dates when gm and gd are omitted
+        gm: Gregorian months (1-12)
+        gd: Gregorian days (1-31)
+        
+    Returns:
+        Tuple of int64 arrays (Jalali years, Jalali months, Jalali days)
+        
+    Example:
+        >>> jy, jm, jd = gregorian_to_jalali_array(np.array([20240320, 20240521]))
+        >>> jy.tolist(), jm.tolist(), jd.tolist()
+        ([1403, 1403], [1, 2], [1, 31])
+    """
+    return jdn_to_jalali_array(gregorian_to_jdn_array(gy, gm, gd))
@@ -0,0 +1,309 @@
+"""
+Julian Day Number (JDN) kernel for calendar conversions
+هسته روز ژولینی برای تبدیل تقویم‌ها
+
+Every calendar is converted to and from an integer day number, so a
+conversion between any two calendars is two integer transforms and date
+arithmetic is plain integer addition. Each transform has a scalar form
+and a vectorized NumPy form that share the same arithmetic.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .ummalqura_data import UMMALQURA_DATA, UMMALQURA_ARRAY, get_index, get_index_array
+
+
+# JDN of 1600-01-01, the epoch of the Gregorian day count used for Jalali dates
+GREGORIAN_1600_JDN = 2305448
+
+# JDN of 0000-03-01 in the proleptic Gregorian calendar
+GREGORIAN_MARCH_0_JDN = 1721120
+
+# Offset between the Umm al-Qura table (MCJDN) and JDN
+MCJDN_OFFSET = 2400000
+
+# Cumulative day counts before each Gregorian month in a common year
+_GREGORIAN_MONTH_OFFSETS = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+_GREGORIAN_MONTH_OFFSETS_ARRAY = np.array(_GREGORIAN_MONTH_OFFSETS, dtype=np.int64)
+
+DateArrays = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _date_arrays(year: ArrayLike, month: Optional[ArrayLike] = None,
+                 day: Optional[ArrayLike] = None) -> DateArrays:
+    """
+    Normalise (year, month, day) inputs to three broadcast int64 arrays.
+
+    When only ``year`` is given it is treated as packed YYYYMMDD integers.
+    """
+    if month is None and day is None:
+        packed = np.asarray(year, dtype=np.int64)
+        return packed // 10000, packed // 100 % 100, packed % 100
+    if month is None or day is None:
+        raise ValueError("Pass either packed YYYYMMDD dates or year, month and day arrays")
+    y, m, d = np.broadcast_arrays(
+        np.asarray(year, dtype=np.int64),
+        np.asarray(month, dtype=np.int64),
+        np.asarray(day, dtype=np.int64),
+    )
+    return y, m, d
+
+
+# ---------------------------------------------------------------------------
+# Gregorian
+# ---------------------------------------------------------------------------
+
+def _is_gregorian_leap(year: int) -> bool:
+    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+
+
+def gregorian_to_jdn(gy: int, gm: int, gd: int) -> int:
+    """
+    Convert a Gregorian date to Julian Day Number
+
+    Example:
+        >>> gregorian_to_jdn(2024, 3, 20)
+        2460390
+    """
+    gy -= 1600
+    g_day_no = 365*gy + (gy+3)//4 - (gy+99)//100 + (gy+399)//400
+    g_day_no += _GREGORIAN_MONTH_OFFSETS[gm-1]
+    if gm > 2 and _is_gregorian_leap(gy):
+        g_day_no += 1
+    return g_day_no + gd - 1 + GREGORIAN_1600_JDN
+
+
+def jdn_to_gregorian(jdn: int) -> Tuple[int, int, int]:
+    """
+    Convert a Julian Day Number to Gregorian date
+
+    Example:
+        >>> jdn_to_gregorian(2460390)
+        (2024, 3, 20)
+    """
+    # Count days from 0000-03-01 so the leap day falls at the end of each
+    # computed year and months follow from a single linear formula
+    days = jdn - GREGORIAN_MARCH_0_JDN
+    era = days // 146097
+    doe = days - era*146097
+    yoe = (doe - doe//1460 + doe//36524 - doe//146096) // 365
+    doy = doe - (365*yoe + yoe//4 - yoe//100)
+    mp = (5*doy + 2) // 153
+    gd = doy - (153*mp + 2)//5 + 1
+    gm = mp + 3 if mp < 10 else mp - 9
+    gy = yoe + era*400 + (1 if gm <= 2 else 0)
+    return gy, gm, gd
+
+
+def gregorian_to_jdn_array(gy: ArrayLike, gm: Optional[ArrayLike] = None,
+                           gd: Optional[ArrayLike] = None) -> np.ndarray:
+    """
+    Vectorized :func:`gregorian_to_jdn`
+
+    Args:
+        gy: Gregorian years, or packed YYYYMMDD dates when gm and gd are omitted
+        gm: Gregorian months (1-12)
+        gd: Gregorian days (1-31)
+
+    Returns:
+        int64 array of Julian Day Numbers
+    """
+    gy, gm, gd = _date_arrays(gy, gm, gd)
+    gy = gy - 1600
+    g_day_no: np.ndarray = 365*gy + (gy+3)//4 - (gy+99)//100 + (gy+399)//400
+    g_day_no = g_day_no + _GREGORIAN_MONTH_OFFSETS_ARRAY[gm-1]
+    g_day_no = g_day_no + ((gm > 2) & (((gy%4 == 0) & (gy%100 != 0)) | (gy%400 == 0)))
+    return g_day_no + gd - 1 + GREGORIAN_1600_JDN
+
+
+def jdn_to_gregorian_array(jdn: ArrayLike) -> DateArrays:
+    """
+    Vectorized :func:`jdn_to_gregorian`
+
+    Returns:
+        Tuple of int64 arrays (Gregorian years, Gregorian months, Gregorian days)
+    """
+    days = np.asarray(jdn, dtype=np.int64) - GREGORIAN_MARCH_0_JDN
+    era = days // 146097
+    doe = days - era*146097
+    yoe = (doe - doe//1460 + doe//36524 - doe//146096) // 365
+    doy = doe - (365*yoe + yoe//4 - yoe//100)
+    mp = (5*doy + 2) // 153
+    gd = doy - (153*mp + 2)//5 + 1
+    gm = np.where(mp < 10, mp + 3, mp - 9)
+    gy = yoe + era*400 + (gm <= 2)
+    return gy, gm, gd
+
+
+# ---------------------------------------------------------------------------
+# Jalali
+# ---------------------------------------------------------------------------
+
+def jalali_to_jdn(jy: int, jm: int, jd: int) -> int:
+    """
+    Convert a Jalali (Persian) date to Julian Day Number
+
+    Example:
+        >>> jalali_to_jdn(1403, 1, 1)
+        2460390
+    """
+    jy += 1595
+    days = -355668 + (365*jy) + ((jy//33)*8) + (((jy%33)+3)//4) + (31*(jm-1) if jm < 7 else (186 + (jm-7)*30)) + jd
+    # `days` counts from 0000-01-01 (day 0)
+    return days + GREGORIAN_MARCH_0_JDN - 60
+
+
+def jdn_to_jalali(jdn: int) -> Tuple[int, int, int]:
+    """
+    Convert a Julian Day Number to Jalali (Persian) date
+
+    Example:
+        >>> jdn_to_jalali(2460390)
+        (1403, 1, 1)
+    """
+    # Days since 1 Farvardin 979
+    j_day_no = jdn - GREGORIAN_1600_JDN - 79
+    j_np = j_day_no // 12053
+    j_day_no %= 12053
+
+    jy = 979 + 33*j_np + 4*(j_day_no//1461)
+    j_day_no %= 1461
+
+    if j_day_no >= 366:
+        jy += (j_day_no-1)//365
+        j_day_no = (j_day_no-1)%365
+
+    if j_day_no < 186:
+        jm = 1 + j_day_no//31
+        jd = 1 + j_day_no%31
+    else:
+        jm = 7 + (j_day_no-186)//30
+        jd = 1 + (j_day_no-186)%30
+
+    return jy, jm, jd
+
+
+def jalali_to_jdn_array(jy: ArrayLike, jm: Optional[ArrayLike] = None,
+                        jd: Optional[ArrayLike] = None) -> np.ndarray:
+    """
+    Vectorized :func:`jalali_to_jdn`
+
+    Args:
+        jy: Jalali years, or packed YYYYMMDD dates when jm and jd are omitted
+        jm: Jalali months (1-12)
+        jd: Jalali days (1-31)
+
+    Returns:
+        int64 array of Julian Day Numbers
+    """
+    jy, jm, jd = _date_arrays(jy, jm, jd)
+    jy = jy + 1595
+    days: np.ndarray = (-355668 + 365*jy + (jy//33)*8 + ((jy%33)+3)//4
+                        + np.where(jm < 7, 31*(jm-1), 186 + (jm-7)*30) + jd)
+    return days + GREGORIAN_MARCH_0_JDN - 60
+
+
+def jdn_to_jalali_array(jdn: ArrayLike) -> DateArrays:
+    """
+    Vectorized :func:`jdn_to_jalali`
+
+    Returns:
+        Tuple of int64 arrays (Jalali years, Jalali months, Jalali days)
+    """
+    j_day_no = np.asarray(jdn, dtype=np.int64) - GREGORIAN_1600_JDN - 79
+    j_np = j_day_no // 12053
+    j_day_no = j_day_no % 12053
+
+    jy = 979 + 33*j_np + 4*(j_day_no//1461)
+    j_day_no = j_day_no % 1461
+
+    long_year = j_day_no >= 366
+    jy = jy + np.where(long_year, (j_day_no-1)//365, 0)
+    j_day_no = np.where(long_year, (j_day_no-1)%365, j_day_no)
+
+    first_half = j_day_no < 186
+    jm = np.where(first_half, 1 + j_day_no//31, 7 + (j_day_no-186)//30)
+    jd = np.where(first_half, 1 + j_day_no%31, 1 + (j_day_no-186)%30)
+    return jy, jm, jd
+
+
+# ---------------------------------------------------------------------------
+# Hijri (Umm al-Qura)
+# ---------------------------------------------------------------------------
+
+def hijri_to_jdn(hy: int, hm: int, hd: int) -> int:
+    """
+    Convert a Hijri (Umm al-Qura) date to Julian Day Number
+
+    Example:
+        >>> hijri_to_jdn(1445, 1, 1)
+        2460145
+    """
+    i = (hy - 1)*12 + hm - 16260
+    return hd + UMMALQURA_DATA[i - 1] - 1 + MCJDN_OFFSET
+
+
+def jdn_to_hijri(jdn: int) -> Tuple[int, int, int]:
+    """
+    Convert a Julian Day Number to Hijri (Umm al-Qura) date
+
+    Example:
+        >>> jdn_to_hijri(2460145)
+        (1445, 1, 1)
+    """
+    mcjdn = jdn - MCJDN_OFFSET
+    index = get_index(mcjdn)
+
+    iln = index + 16260
+    ii = (iln - 1)//12
+    return ii + 1, iln - 12*ii, mcjdn - UMMALQURA_DATA[index - 1] + 1
+
+
+def hijri_to_jdn_array(hy: ArrayLike, hm: Optional[ArrayLike] = None,
+                       hd: Optional[ArrayLike] = None) -> np.ndarray:
+    """
+    Vectorized :func:`hijri_to_jdn`
+
+    Args:
+        hy: Hijri years, or packed YYYYMMDD dates when hm and hd are omitted
+        hm: Hijri months (1-12)
+        hd: Hijri days (1-30)
+
+    Returns:
+        int64 array of Julian Day Numbers
+
+    Raises:
+        ValueError: If a date falls outside the Umm al-Qura table
+    """
+    hy, hm, hd = _date_arrays(hy, hm, hd)
+
+    i = (hy - 1)*12 + hm - 16260
+    if np.any((i < 1) | (i > len(UMMALQURA_ARRAY))):
+        raise ValueError("Date is outside the supported Umm al-Qura range")
+
+    jdn: np.ndarray = hd + UMMALQURA_ARRAY[i - 1] - 1 + MCJDN_OFFSET
+    return jdn
+
+
+def jdn_to_hijri_array(jdn: ArrayLike) -> DateArrays:
+    """
+    Vectorized :func:`jdn_to_hijri`
+
+    Returns:
+        Tuple of int64 arrays (Hijri years, Hijri months, Hijri days)
+
+    Raises:
+        ValueError: If a day falls outside the Umm al-Qura table
+    """
+    mcjdn = np.asarray(jdn, dtype=np.int64) - MCJDN_OFFSET
+
+    index = get_index_array(mcjdn)
+    if np.any((index < 1) | (index >= len(UMMALQURA_ARRAY))):
+        raise ValueError("Date is outside the supported Umm al-Qura range")
+
+    iln = index + 16260
+    ii = (iln - 1)//12
+    return ii + 1, iln - 12*ii, mcjdn - UMMALQURA_ARRAY[index - 1] + 1
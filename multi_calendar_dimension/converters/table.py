@@ -0,0 +1,226 @@
+"""
+Precomputed conversion table for constant-time calendar conversion
+جدول از پیش محاسبه شده برای تبدیل سریع تاریخ
+
+The Umm al-Qura data bounds the supported window (Gregorian 1937-2077), which
+is only about 51,000 days. :class:`ConversionTable` stores the Gregorian,
+Jalali and Hijri components and the weekday of every day in that window, so
+conversions are answered by indexing and batch conversions by fancy indexing.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .jdn import (
+    MCJDN_OFFSET, _date_arrays,
+    jdn_to_gregorian_array, jdn_to_jalali_array, jdn_to_hijri_array
+)
+from .ummalqura_data import UMMALQURA_ARRAY
+
+
+CALENDARS = ('gregorian', 'jalali', 'hijri')
+
+DateArrays = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class ConversionTable:
+    """
+    Day-by-day lookup table over the supported date window
+
+    Building the table takes a few milliseconds; use
+    :func:`get_conversion_table` to share a single lazily built instance.
+
+    Example:
+        >>> table = get_conversion_table()
+        >>> table.gregorian_to_jalali(2024, 3, 20)
+        (1403, 1, 1)
+    """
+
+    def __init__(self) -> None:
+        """Build the table for every day covered by the Umm al-Qura data"""
+        self.first_jdn = int(UMMALQURA_ARRAY[0]) + MCJDN_OFFSET
+        self.last_jdn = int(UMMALQURA_ARRAY[-1]) + MCJDN_OFFSET - 1
+        jdn = np.arange(self.first_jdn, self.last_jdn + 1, dtype=np.int64)
+        self.size = len(jdn)
+
+        self.columns: Dict[str, DateArrays] = {}
+        for calendar, from_jdn in (('gregorian', jdn_to_gregorian_array),
+                                   ('jalali', jdn_to_jalali_array),
+                                   ('hijri', jdn_to_hijri_array)):
+            y, m, d = from_jdn(jdn)
+            self.columns[calendar] = (y.astype(np.int16), m.astype(np.int8), d.astype(np.int8))
+
+        # 1 = Saturday ... 7 = Friday, as used throughout the library
+        self.day_of_week_ids = ((jdn + 2) % 7 + 1).astype(np.int8)
+
+        self._month_starts: Dict[str, Tuple[int, np.ndarray]] = {}
+        for calendar, (y, m, d) in self.columns.items():
+            self._month_starts[calendar] = self._build_month_starts(y, m, d)
+
+        # Plain Python structures for scalar lookups, built on first use
+        self._scalar_lookups: Dict[str, Tuple[int, List[int], List[Tuple[int, int, int]]]] = {}
+
+    @staticmethod
+    def _build_month_starts(y: np.ndarray, m: np.ndarray, d: np.ndarray) -> Tuple[int, np.ndarray]:
+        """
+        Map every (year, month) to the table row of its first day
+
+        The first and last months may be partially covered, so their start
+        rows can fall outside the table; lookups check the final row instead.
+        """
+        first_year = int(y[0])
+        key = (y.astype(np.int64) - first_year)*12 + m - 1
+        keys, first_rows = np.unique(key, return_index=True)
+        starts = np.zeros(int(keys[-1]) + 1, dtype=np.int64)
+        starts[keys] = first_rows - (d[first_rows] - 1)
+        return first_year, starts
+
+    def _check_calendar(self, calendar: str) -> None:
+        if calendar not in self.columns:
+            raise ValueError(f"Unsupported calendar type: {calendar}")
+
+    def _scalar_lookup(self, calendar: str) -> Tuple[int, List[int], List[Tuple[int, int, int]]]:
+        """
+        Month starts and per-row date tuples as Python lists
+
+        Scalar lookups index these directly, so they allocate nothing.
+        """
+        lookup = self._scalar_lookups.get(calendar)
+        if lookup is None:
+            self._check_calendar(calendar)
+            first_year, starts = self._month_starts[calendar]
+            y, m, d = self.columns[calendar]
+            years = {year: year for year in range(int(y.min()), int(y.max()) + 1)}
+            tuples = [(years[a], b, c) for a, b, c in zip(y.tolist(), m.tolist(), d.tolist())]
+            lookup = (first_year, starts.tolist(), tuples)
+            self._scalar_lookups[calendar] = lookup
+        return lookup
+
+    def index(self, calendar: str, year: int, month: int, day: int) -> int:
+        """
+        Get the table row of a date
+
+        Args:
+            calendar: 'gregorian', 'jalali', or 'hijri'
+            year: Year
+            month: Month (1-12)
+            day: Day of month
+
+        Returns:
+            Row index into the table arrays
+
+        Raises:
+            ValueError: If the date is invalid or outside the table
+        """
+        first_year, starts, tuples = self._scalar_lookup(calendar)
+        key = (year - first_year)*12 + month - 1
+        if 0 <= key < len(starts) and 1 <= month <= 12:
+            row = starts[key] + day - 1
+            # A day past the end of the month lands on a different day number
+            if 0 <= row < self.size and tuples[row][2] == day:
+                return row
+        raise ValueError(f"Date {year}/{month}/{day} is invalid or outside the conversion table")
+
+    def index_array(self, calendar: str, year: ArrayLike, month: Optional[ArrayLike] = None,
+                    day: Optional[ArrayLike] = None) -> np.ndarray:
+        """
+        Vectorized :meth:`index`
+
+        Args:
+            calendar: 'gregorian', 'jalali', or 'hijri'
+            year: Years, or packed YYYYMMDD dates when month and day are omitted
+            month: Months (1-12)
+            day: Days of month
+
+        Returns:
+            int64 array of row indices
+        """
+        self._check_calendar(calendar)
+        year, month, day = _date_arrays(year, month, day)
+        first_year, starts = self._month_starts[calendar]
+        key = (year - first_year)*12 + month - 1
+        valid = (key >= 0) & (key < len(starts)) & (month >= 1) & (month <= 12)
+        row = np.where(valid, starts[np.where(valid, key, 0)] + day - 1, -1)
+        valid &= (row >= 0) & (row < self.size)
+        row = np.where(valid, row, 0)
+        y, m, d = self.columns[calendar]
+        valid &= (m[row] == month) & (d[row] == day)
+        if not valid.all():
+            raise ValueError("Dates are invalid or outside the conversion table")
+        return row
+
+    def convert(self, from_calendar: str, to_calendar: str,
+                year: int, month: int, day: int) -> Tuple[int, int, int]:
+        """
+        Convert a date between calendars by table lookup
+
+        Args:
+            from_calendar: Source calendar ('gregorian', 'jalali', or 'hijri')
+            to_calendar: Target calendar ('gregorian', 'jalali', or 'hijri')
+            year: Year
+            month: Month (1-12)
+            day: Day of month
+
+        Returns:
+            Tuple of (year, month, day) in the target calendar
+        """
+        row = self.index(from_calendar, year, month, day)
+        return self._scalar_lookup(to_calendar)[2][row]
+
+    def convert_array(self, from_calendar: str, to_calendar: str,
+                      year: ArrayLike, month: Optional[ArrayLike] = None,
+                      day: Optional[ArrayLike] = None) -> DateArrays:
+        """
+        Vectorized :meth:`convert`
+
+        Returns:
+            Tuple of arrays (years, months, days) in the target calendar
+        """
+        self._check_calendar(to_calendar)
+        row = self.index_array(from_calendar, year, month, day)
+        y, m, d = self.columns[to_calendar]
+        return y[row], m[row], d[row]
+
+    def jalali_to_gregorian(self, jy: int, jm: int, jd: int) -> Tuple[int, int, int]:
+        """Table-based :func:`~multi_calendar_dimension.converters.jalali.jalali_to_gregorian`"""
+        return self.convert('jalali', 'gregorian', jy, jm, jd)
+
+    def gregorian_to_jalali(self, gy: int, gm: int, gd: int) -> Tuple[int, int, int]:
+        """Table-based :func:`~multi_calendar_dimension.converters.jalali.gregorian_to_jalali`"""
+        return self.convert('gregorian', 'jalali', gy, gm, gd)
+
+    def gregorian_to_hijri(self, gy: int, gm: int, gd: int) -> Tuple[int, int, int]:
+        """Table-based :func:`~multi_calendar_dimension.converters.hijri.gregorian_to_hijri`"""
+        return self.convert('gregorian', 'hijri', gy, gm, gd)
+
+    def hijri_to_gregorian(self, hy: int, hm: int, hd: int) -> Tuple[int, int, int]:
+        """Table-based :func:`~multi_calendar_dimension.converters.hijri.hijri_to_gregorian`"""
+        return self.convert('hijri', 'gregorian', hy, hm, hd)
+
+    def jalali_to_hijri(self, jy: int, jm: int, jd: int) -> Tuple[int, int, int]:
+        """Table-based :func:`~multi_calendar_dimension.converters.cross.jalali_to_hijri`"""
+        return self.convert('jalali', 'hijri', jy, jm, jd)
+
+    def hijri_to_jalali(self, hy: int, hm: int, hd: int) -> Tuple[int, int, int]:
+        """Table-based :func:`~multi_calendar_dimension.converters.cross.hijri_to_jalali`"""
+        return self.convert('hijri', 'jalali', hy, hm, hd)
+
+    def day_of_week_id(self, calendar: str, year: int, month: int, day: int) -> int:
+        """
+        Get the day of week ID (1 = Saturday ... 7 = Friday) of a date
+        """
+        return int(self.day_of_week_ids[self.index(calendar, year, month, day)])
+
+
+@lru_cache(maxsize=None)
+def get_conversion_table() -> ConversionTable:
+    """
+    Get the shared :class:`ConversionTable`, building it on first use
+
+    Returns:
+        The process-wide conversion table
+    """
+    return ConversionTable()
@@ -1,9 +1,17 @@
 """
 Umm al-Qura calendar data for Hijri date conversion.
 Contains lunar month data for accurate Islamic calendar calculations.
+
+Each entry is the modified chronological Julian day number (MCJDN) of the
+first day of a lunar month. The table is sorted, so lookups use binary search.
 """
 
-UMMALQURA_DATA = [
+from array import array
+from bisect import bisect_right
+
+import numpy as np
+
+UMMALQURA_DATA = array('i', [
     28607, 28636, 28665, 28695, 28724, 28754, 28783, 28813, 28843, 28872, 28901, 28931, 28960, 28990,
     29019, 29049, 29078, 29108, 29137, 29167,
     29196, 29226, 29255, 29285, 29315, 29345, 29375, 29404, 29434, 29463, 29492, 29522, 29551, 29580,
@@ -179,15 +187,29 @@ UMMALQURA_DATA = [
     79399, 79428, 79458, 79487, 79517, 79546, 79576, 79606, 79635, 79665, 79695, 79724, 79753, 79783,
     79812, 79841, 79871, 79900, 79930, 79960,
     79990
-]
+])
+
+# Read-only NumPy view over the same buffer for batch lookups
+UMMALQURA_ARRAY = np.frombuffer(UMMALQURA_DATA, dtype=np.intc)
+UMMALQURA_ARRAY.flags.writeable = False
 
 
 def get_index(mcjdn):
     """
     Find the index of the first element greater than mcjdn.
     """
-    for index, ummalqura in enumerate(UMMALQURA_DATA):
-        if ummalqura > mcjdn:
-            return index
-    return None
+    index = bisect_right(UMMALQURA_DATA, mcjdn)
+    if index == len(UMMALQURA_DATA):
+        return None
+    return index
+
+
+def get_index_array(mcjdn: np.ndarray) -> np.ndarray:
+    """
+    Vectorized :func:`get_index` for an array of MCJDN values.
+    
+    Values past the end of the table map to ``len(UMMALQURA_DATA)``
+    instead of ``None``.
+    """
+    return np.searchsorted(UMMALQURA_ARRAY, mcjdn, side='right')
 
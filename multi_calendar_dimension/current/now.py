@@ -3,23 +3,93 @@ Current Date Information
 اطلاعات تاریخ امروز در همه تقویم‌ها
 """
 
-from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple
+import time
+from datetime import datetime, date, timedelta, timezone, tzinfo
+from typing import TYPE_CHECKING, Callable, ClassVar, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
-from ..converters.jalali import gregorian_to_jalali, is_leap_year_persian
-from ..converters.hijri import gregorian_to_hijri, is_hijri_leap
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ..converters.jdn import (
+    _date_arrays, gregorian_to_jdn_array, jdn_to_gregorian_array, jalali_to_jdn_array,
+    jdn_to_jalali_array, hijri_to_jdn_array, jdn_to_hijri_array
+)
+from ..converters.jalali import gregorian_to_jalali, jalali_to_gregorian, is_leap_year_persian
+from ..converters.hijri import gregorian_to_hijri, hijri_to_gregorian, is_hijri_leap
 from ..converters.cross import jalali_to_hijri, hijri_to_jalali
 from ..events import (
     persian_events, persian_holidays, hijri_official_holidays,
     gregorian_events_en, gregorian_events_fa, gregorian_holidays,
     hijri_events, hijri_events_en, hijri_holidays
 )
+from ..events.index import get_event_index
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-@dataclass
-class DateInfo:
-    """Information about a specific date"""
+
+DEFAULT_TIMEZONE = 'Asia/Tehran'
+
+# Iran has kept standard time all year since 2022; used when no tz database is available
+TEHRAN_STANDARD_TIME = timezone(timedelta(hours=3, minutes=30), 'Asia/Tehran')
+
+
+def resolve_timezone(tz: Union[str, tzinfo, None] = None) -> tzinfo:
+    """
+    Resolve a time zone name or object
+    
+    Args:
+        tz: IANA time zone name, tzinfo object, or None for Asia/Tehran
+        
+    Returns:
+        tzinfo object
+        
+    Raises:
+        ValueError: If the time zone name is unknown
+    """
+    if tz is None:
+        tz = DEFAULT_TIMEZONE
+    if isinstance(tz, tzinfo):
+        return tz
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(tz)
+    except (ImportError, KeyError, ValueError):
+        # zoneinfo needs Python 3.9+ and, on Windows, the tzdata package
+        if tz == DEFAULT_TIMEZONE:
+            return TEHRAN_STANDARD_TIME
+        raise ValueError(f"Unknown time zone: {tz}")
+
+
+class _SlottedRecord:
+    """
+    Base of the frozen, slotted date records
+    
+    Pickling restores the slots directly, as the frozen dataclass
+    ``__setattr__`` refuses the default slot-by-slot restore.
+    """
+    __slots__: Tuple[str, ...] = ()
+    
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class DateInfo(_SlottedRecord):
+    """
+    Information about a specific date
+    
+    Instances are immutable and hashable, and have no per-instance
+    ``__dict__``; ``events`` is always a tuple.
+    """
+    __slots__ = ('year', 'month', 'day', 'date_string', 'month_name', 'day_of_week',
+                 'day_of_week_en', 'is_leap_year', 'is_holiday', 'is_weekend', 'events')
+    
     year: int
     month: int
     day: int
@@ -30,52 +100,147 @@ class DateInfo:
     is_leap_year: bool
     is_holiday: bool
     is_weekend: bool
-    events: List[str]
+    events: Tuple[str, ...]
+    
+    def __post_init__(self) -> None:
+        # Accept any iterable of events, as lists were used before; tuple()
+        # returns a tuple argument itself
+        object.__setattr__(self, 'events', tuple(self.events))
 
 
-@dataclass
-class CurrentDateInfo:
+@dataclass(frozen=True)
+class CurrentDateInfo(_SlottedRecord):
     """Complete information about current date in all calendars"""
+    __slots__ = ('gregorian', 'jalali', 'hijri', 'timestamp')
+    
     gregorian: DateInfo
     jalali: DateInfo
     hijri: DateInfo
     timestamp: datetime
 
 
+@dataclass
+class DateInfoBatch:
+    """
+    Information about many dates of one calendar, as parallel arrays
+    
+    Month names, weekday names and events are stored as codes into shared
+    tables, so :meth:`to_frame` builds categorical columns without creating
+    an object per row. Indexing a batch returns the :class:`DateInfo` of one
+    date.
+    """
+    calendar_type: str
+    year: np.ndarray
+    month: np.ndarray
+    day: np.ndarray
+    day_of_week_id: np.ndarray
+    is_leap_year: np.ndarray
+    is_holiday: np.ndarray
+    is_weekend: np.ndarray
+    event_codes: np.ndarray
+    month_names: Tuple[str, ...]
+    event_pool: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.year)
+    
+    def __getitem__(self, i: int) -> DateInfo:
+        """Get the DateInfo of one date"""
+        year, month, day = int(self.year[i]), int(self.month[i]), int(self.day[i])
+        separator = '-' if self.calendar_type == 'gregorian' else '/'
+        day_index = int(self.day_of_week_id[i]) - 1
+        event = self.event_pool[self.event_codes[i]]
+        return DateInfo(
+            year=year,
+            month=month,
+            day=day,
+            date_string=f"{year:04d}{separator}{month:02d}{separator}{day:02d}",
+            month_name=self.month_names[month - 1],
+            day_of_week=CurrentDate.persian_days[day_index],
+            day_of_week_en=CurrentDate.english_days[day_index],
+            is_leap_year=bool(self.is_leap_year[i]),
+            is_holiday=bool(self.is_holiday[i]),
+            is_weekend=bool(self.is_weekend[i]),
+            events=(event,) if event else ()
+        )
+    
+    def to_frame(self) -> 'pd.DataFrame':
+        """
+        Convert to a pandas DataFrame
+        
+        Returns:
+            DataFrame with one row per date; names and events are categorical
+        """
+        import pandas as pd
+        
+        return pd.DataFrame({
+            'year': self.year,
+            'month': self.month,
+            'day': self.day,
+            'month_name': pd.Categorical.from_codes(self.month - 1, self.month_names),
+            'day_of_week_id': self.day_of_week_id,
+            'day_of_week': pd.Categorical.from_codes(self.day_of_week_id - 1, CurrentDate.persian_days),
+            'day_of_week_en': pd.Categorical.from_codes(self.day_of_week_id - 1, CurrentDate.english_days),
+            'is_leap_year': self.is_leap_year,
+            'is_holiday': self.is_holiday,
+            'is_weekend': self.is_weekend,
+            # Code -1 (no event) becomes a missing value
+            'event': pd.Categorical.from_codes(self.event_codes, self.event_pool[:-1]),
+        })
+
+
 class CurrentDate:
     """
     Get current date information in all supported calendars
     
     Provides comprehensive information about today's date including
     events, holidays, and weekend status in Persian, Gregorian, and Hijri calendars.
+    
+    Example:
+        >>> clock = lambda: 1710880200.0  # 2024-03-20 00:00 in Tehran
+        >>> CurrentDate(clock=clock).now().jalali.date_string
+        '1403/01/01'
+        >>> CurrentDate(tz='UTC', clock=clock).now().jalali.date_string
+        '1402/12/29'
     """
     
-    def __init__(self):
-        """Initialize the current date handler"""
-        self._setup_constants()
+    persian_months: ClassVar[Dict[int, str]] = {
+        1: "فروردین", 2: "اردیبهشت", 3: "خرداد", 4: "تیر",
+        5: "مرداد", 6: "شهریور", 7: "مهر", 8: "آبان",
+        9: "آذر", 10: "دی", 11: "بهمن", 12: "اسفند"
+    }
     
-    def _setup_constants(self):
-        """Setup constant dictionaries for month names"""
-        self.persian_months = {
-            1: "فروردین", 2: "اردیبهشت", 3: "خرداد", 4: "تیر",
-            5: "مرداد", 6: "شهریور", 7: "مهر", 8: "آبان",
-            9: "آذر", 10: "دی", 11: "بهمن", 12: "اسفند"
-        }
-        
-        self.gregorian_months = {
-            1: "January", 2: "February", 3: "March", 4: "April",
-            5: "May", 6: "June", 7: "July", 8: "August",
-            9: "September", 10: "October", 11: "November", 12: "December"
-        }
-        
-        self.hijri_months = {
-            1: "محرم", 2: "صفر", 3: "ربیع الاول", 4: "ربیع الثانی",
-            5: "جمادی الاول", 6: "جمادی الثانی", 7: "رجب", 8: "شعبان",
-            9: "رمضان", 10: "شوال", 11: "ذی القعده", 12: "ذی حجه"
-        }
+    gregorian_months: ClassVar[Dict[int, str]] = {
+        1: "January", 2: "February", 3: "March", 4: "April",
+        5: "May", 6: "June", 7: "July", 8: "August",
+        9: "September", 10: "October", 11: "November", 12: "December"
+    }
+    
+    hijri_months: ClassVar[Dict[int, str]] = {
+        1: "محرم", 2: "صفر", 3: "ربیع الاول", 4: "ربیع الثانی",
+        5: "جمادی الاول", 6: "جمادی الثانی", 7: "رجب", 8: "شعبان",
+        9: "رمضان", 10: "شوال", 11: "ذی القعده", 12: "ذی حجه"
+    }
+    
+    persian_days: ClassVar[List[str]] = ["شنبه", "یکشنبه", "دوشنبه", "سه‌شنبه", "چهارشنبه", "پنج‌شنبه", "جمعه"]
+    english_days: ClassVar[List[str]] = ["Saturday", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+    
+    # Today's DateInfo objects per (time zone, language):
+    # (first and past-the-end POSIX timestamps of the day, gregorian, jalali, hijri)
+    _today_cache: ClassVar[Dict[Tuple[tzinfo, str], Tuple[float, float, DateInfo, DateInfo, DateInfo]]] = {}
+    
+    def __init__(self, tz: Union[str, tzinfo, None] = None, clock: Optional[Callable[[], float]] = None):
+        """
+        Initialize the current date handler
         
-        self.persian_days = ["شنبه", "یکشنبه", "دوشنبه", "سه‌شنبه", "چهارشنبه", "پنج‌شنبه", "جمعه"]
-        self.english_days = ["Saturday", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+        Args:
+            tz: Time zone that decides the current day, as an IANA name or
+                tzinfo object (default: Asia/Tehran)
+            clock: Function returning the current POSIX timestamp
+                (default: time.time), e.g. a fixed clock in tests
+        """
+        self.tz = resolve_timezone(tz)
+        self.clock = clock or time.time
     
     def _day_of_week(self, gy: int, gm: int, gd: int) -> Tuple[str, str, int]:
         """
@@ -97,7 +262,7 @@ class CurrentDate:
         
         return self.persian_days[h], self.english_days[h], h + 1
     
-    def _get_events(self, calendar_type: str, month: int, day: int, language: str = 'fa') -> List[str]:
+    def _get_events(self, calendar_type: str, month: int, day: int, language: str = 'fa') -> Tuple[str, ...]:
         """
         Get events for a specific date
         
@@ -108,7 +273,7 @@ class CurrentDate:
             language: 'fa' for Persian, 'en' for English
             
         Returns:
-            List of event names
+            Tuple of event names
         """
         events = []
         
@@ -133,7 +298,7 @@ class CurrentDate:
             if event:
                 events.append(event)
         
-        return events
+        return tuple(events)
     
     def _is_holiday(self, calendar_type: str, month: int, day: int, day_of_week_id: int) -> bool:
         """
@@ -196,16 +361,67 @@ class CurrentDate:
         """
         Get current date information in all calendars
         
+        The current day is taken in the handler's time zone. Its calendar
+        information is computed once per day, time zone and language and
+        the immutable DateInfo objects are shared by every ``CurrentDate``
+        instance until the day ends.
+        
         Args:
             language: 'fa' for Persian, 'en' for English
             
         Returns:
             CurrentDateInfo object with complete date information
         """
-        # Get current Gregorian date
-        now = datetime.now()
-        gy, gm, gd = now.year, now.month, now.day
+        timestamp = self.clock()
+        
+        key = (self.tz, language)
+        cached = self._today_cache.get(key)
+        if cached is None or not cached[0] <= timestamp < cached[1]:
+            cached = self._day_bounds(timestamp) + self._calendar_infos(*self._local_date(timestamp), language)
+            self._today_cache[key] = cached
         
+        _, _, gregorian_info, jalali_info, hijri_info = cached
+        return CurrentDateInfo(
+            gregorian=gregorian_info,
+            jalali=jalali_info,
+            hijri=hijri_info,
+            timestamp=datetime.fromtimestamp(timestamp, self.tz)
+        )
+    
+    def _local_date(self, timestamp: float) -> Tuple[int, int, int]:
+        """Gregorian (year, month, day) of a timestamp in the handler's time zone"""
+        local = datetime.fromtimestamp(timestamp, self.tz)
+        return local.year, local.month, local.day
+    
+    def _day_bounds(self, timestamp: float) -> Tuple[float, float]:
+        """
+        POSIX timestamps of the start of the local day and of the next day
+        
+        Args:
+            timestamp: Any POSIX timestamp within the day
+            
+        Returns:
+            Tuple of (start, end) with start <= timestamp < end
+        """
+        day = date(*self._local_date(timestamp))
+        start = datetime(day.year, day.month, day.day, tzinfo=self.tz).timestamp()
+        day += timedelta(days=1)
+        end = datetime(day.year, day.month, day.day, tzinfo=self.tz).timestamp()
+        return start, end
+    
+    def _calendar_infos(self, gy: int, gm: int, gd: int, language: str) -> Tuple[DateInfo, DateInfo, DateInfo]:
+        """
+        Build the DateInfo objects of a Gregorian date in all calendars
+        
+        Args:
+            gy: Gregorian year
+            gm: Gregorian month
+            gd: Gregorian day
+            language: 'fa' for Persian, 'en' for English
+            
+        Returns:
+            Tuple of (Gregorian, Jalali, Hijri) DateInfo objects
+        """
         # Convert to Jalali
         jy, jm, jd = gregorian_to_jalali(gy, gm, gd)
         
@@ -258,12 +474,7 @@ class CurrentDate:
             events=self._get_events('hijri', hm, hd, language)
         )
         
-        return CurrentDateInfo(
-            gregorian=gregorian_info,
-            jalali=jalali_info,
-            hijri=hijri_info,
-            timestamp=now
-        )
+        return gregorian_info, jalali_info, hijri_info
     
     def get_date_info(self, year: int, month: int, day: int, 
                      calendar_type: str = 'gregorian', language: str = 'fa') -> DateInfo:
@@ -326,6 +537,86 @@ class CurrentDate:
             events=self._get_events(calendar_type, month, day, language)
         )
     
+    def get_date_info_batch(self, years: ArrayLike, months: Optional[ArrayLike] = None,
+                            days: Optional[ArrayLike] = None,
+                            calendar_type: str = 'gregorian', language: str = 'fa') -> DateInfoBatch:
+        """
+        Vectorized :meth:`get_date_info` for many dates of one calendar
+        
+        Args:
+            years: Years, or packed YYYYMMDD dates when months and days are omitted
+            months: Months (1-12)
+            days: Days of month
+            calendar_type: 'jalali', 'gregorian', or 'hijri'
+            language: 'fa' for Persian, 'en' for English
+            
+        Returns:
+            DateInfoBatch with one entry per date
+            
+        Raises:
+            ValueError: If the calendar type is unsupported or a date is invalid
+            
+        Example:
+            >>> batch = CurrentDate().get_date_info_batch([14030101, 14030102], calendar_type='jalali')
+            >>> batch.is_holiday
+            array([ True,  True])
+            >>> batch.to_frame()['month_name'].tolist()
+            ['فروردین', 'فروردین']
+        """
+        converters = {
+            'gregorian': (gregorian_to_jdn_array, jdn_to_gregorian_array),
+            'jalali': (jalali_to_jdn_array, jdn_to_jalali_array),
+            'hijri': (hijri_to_jdn_array, jdn_to_hijri_array),
+        }
+        if calendar_type not in converters:
+            raise ValueError(f"Unsupported calendar type: {calendar_type}")
+        to_jdn, from_jdn = converters[calendar_type]
+        
+        year, month, day = _date_arrays(years, months, days)
+        jdn = to_jdn(year, month, day)
+        # A date past the end of its month lands on a different day
+        for given, converted in zip((year, month, day), from_jdn(jdn)):
+            if not np.array_equal(given, converted):
+                raise ValueError("Dates are invalid in the given calendar")
+        
+        # 1 = Saturday ... 7 = Friday, as in _day_of_week
+        day_id = (jdn + 2) % 7 + 1
+        event_index = get_event_index()
+        
+        if calendar_type == 'jalali':
+            month_names = self.persian_months
+            is_leap = np.isin(year % 33, [1, 5, 9, 13, 17, 21, 25, 29])
+            is_holiday = event_index.is_holiday('persian_holidays', month, day) | (day_id == 7)
+            is_weekend = (day_id == 6) | (day_id == 7)
+            event_table = 'persian_events'
+        elif calendar_type == 'gregorian':
+            month_names = self.gregorian_months
+            is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+            is_holiday = event_index.is_holiday('gregorian_holidays', month, day)
+            is_weekend = (day_id == 1) | (day_id == 2)
+            event_table = 'gregorian_events_fa' if language == 'fa' else 'gregorian_events_en'
+        else:
+            month_names = self.hijri_months
+            is_leap = (11*year + 14) % 30 < 11
+            is_holiday = (event_index.is_holiday('hijri_holidays', month, day)
+                          | event_index.is_holiday('hijri_official_holidays', month, day))
+            is_weekend = day_id == 7
+            event_table = 'hijri_events' if language == 'fa' else 'hijri_events_en'
+        
+        return DateInfoBatch(
+            calendar_type=calendar_type,
+            year=year,
+            month=month,
+            day=day,
+            day_of_week_id=day_id,
+            is_leap_year=is_leap,
+            is_holiday=is_holiday,
+            is_weekend=is_weekend,
+            event_codes=event_index.event_codes(event_table, month, day),
+            month_names=tuple(month_names[number] for number in range(1, 13)),
+            event_pool=event_index.pool
+        )
+    
     def format_date(self, date_info: DateInfo, format_type: str = 'full') -> str:
         """
         Format date information as string
@@ -4,6 +4,8 @@
 from .persian_events import persian_events, persian_events_en, persian_holidays, hijri_official_holidays
 from .gregorian_events import gregorian_events_en, gregorian_events_fa, gregorian_holidays
 from .hijri_events import hijri_events, hijri_events_en, hijri_holidays
+from .index import EventIndex, get_event_index
+from .variable_holidays import easter_date, easter_dates, get_variable_holidays, variable_holiday_keys
 
 __all__ = [
     'persian_events',
@@ -15,5 +17,11 @@ __all__ = [
     'gregorian_holidays',
     'hijri_events',
     'hijri_events_en',
-    'hijri_holidays'
+    'hijri_holidays',
+    'EventIndex',
+    'get_event_index',
+    'easter_date',
+    'easter_dates',
+    'get_variable_holidays',
+    'variable_holiday_keys'
 ]
@@ -0,0 +1,134 @@
+"""
+Compiled index of the event and holiday tables
+ایندکس فشرده رویدادها و تعطیلات
+
+The tables in this package are dicts keyed by (month, day). The index
+compiles each of them once into a dense array over ``month*32 + day`` so
+that looking up many dates is a single vectorized gather. Event texts are
+kept once in a shared string pool and referenced by int32 codes.
+"""
+
+from functools import lru_cache
+from typing import Dict
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .persian_events import persian_events, persian_events_en, persian_holidays, hijri_official_holidays
+from .gregorian_events import gregorian_events_en, gregorian_events_fa, gregorian_holidays
+from .hijri_events import hijri_events, hijri_events_en, hijri_holidays
+
+
+EVENT_TABLES = {
+    'persian_events': persian_events,
+    'persian_events_en': persian_events_en,
+    'gregorian_events_en': gregorian_events_en,
+    'gregorian_events_fa': gregorian_events_fa,
+    'hijri_events': hijri_events,
+    'hijri_events_en': hijri_events_en,
+}
+
+HOLIDAY_TABLES = {
+    'persian_holidays': persian_holidays,
+    'hijri_official_holidays': hijri_official_holidays,
+    'gregorian_holidays': gregorian_holidays,
+    'hijri_holidays': hijri_holidays,
+}
+
+# Slots per month in the dense arrays; day 0 and month 0 are never used
+DAYS_PER_MONTH_SLOT = 32
+INDEX_SIZE = 13*DAYS_PER_MONTH_SLOT
+
+
+def month_day_key(months: ArrayLike, days: ArrayLike) -> np.ndarray:
+    """Dense index position of (month, day) pairs"""
+    return np.asarray(months, dtype=np.int64)*DAYS_PER_MONTH_SLOT + np.asarray(days, dtype=np.int64)
+
+
+class EventIndex:
+    """
+    Event and holiday tables compiled into dense arrays
+
+    Use :func:`get_event_index` to share one compiled instance.
+
+    Example:
+        >>> index = get_event_index()
+        >>> index.event_names('persian_events', [1], [1])
+        array(['عید نوروز'], dtype=object)
+    """
+
+    def __init__(self) -> None:
+        """Compile every event and holiday table"""
+        pool: Dict[str, int] = {}
+        self.events: Dict[str, np.ndarray] = {}
+        for name, event_table in EVENT_TABLES.items():
+            codes = np.full(INDEX_SIZE, -1, dtype=np.int32)
+            for (month, day), text in event_table.items():
+                codes[month*DAYS_PER_MONTH_SLOT + day] = pool.setdefault(text, len(pool))
+            self.events[name] = codes
+
+        # Code -1 wraps to the trailing None
+        self.pool = np.array(list(pool) + [None], dtype=object)
+
+        self.holidays: Dict[str, np.ndarray] = {}
+        for name, holiday_table in HOLIDAY_TABLES.items():
+            flags = np.zeros(INDEX_SIZE, dtype=bool)
+            for (month, day), value in holiday_table.items():
+                flags[month*DAYS_PER_MONTH_SLOT + day] = value != 0
+            self.holidays[name] = flags
+
+    def event_codes(self, table: str, months: ArrayLike, days: ArrayLike) -> np.ndarray:
+        """
+        Get string pool codes of events (-1 where there is no event)
+
+        Args:
+            table: Event table name, e.g. 'persian_events'
+            months: Months (1-12)
+            days: Days of month
+
+        Returns:
+            int32 array of codes into :attr:`pool`
+        """
+        return self.events[table].take(month_day_key(months, days))
+
+    def event_names(self, table: str, months: ArrayLike, days: ArrayLike) -> np.ndarray:
+        """
+        Get event texts (None where there is no event)
+
+        Args:
+            table: Event table name, e.g. 'persian_events'
+            months: Months (1-12)
+            days: Days of month
+
+        Returns:
+            Object array of event texts
+        """
+        return self.pool.take(self.event_codes(table, months, days))
+
+    def is_holiday(self, table: str, months: ArrayLike, days: ArrayLike) -> np.ndarray:
+        """
+        Check dates against a fixed holiday table
+
+        Args:
+            table: Holiday table name, e.g. 'persian_holidays'
+            months: Months (1-12)
+            days: Days of month
+
+        Returns:
+            Boolean array
+        """
+        return self.holidays[table].take(month_day_key(months, days))
+
+
+@lru_cache(maxsize=None)
+def get_event_index() -> EventIndex:
+    """
+    Get the shared :class:`EventIndex`, compiling it on first use
+
+    The index is not updated if the tables are modified afterwards; call
+    ``get_event_index.cache_clear()`` to recompile it.
+
+    Returns:
+        The process-wide event index
+    """
+    return EventIndex()
@@ -0,0 +1,171 @@
+"""
+Variable-date Gregorian holidays
+تعطیلات میلادی با تاریخ متغیر
+
+Holidays such as Thanksgiving or Easter Monday fall on a different day each
+year. They are described here as rules and evaluated with integer day
+arithmetic, either for many years at once or for one year through a
+memoized lookup.
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ..converters.jdn import gregorian_to_jdn_array, jdn_to_gregorian_array
+from .index import DAYS_PER_MONTH_SLOT
+
+
+# Weekdays as in datetime.weekday()
+MONDAY = 0
+THURSDAY = 3
+
+# (name, month, weekday, n): the nth weekday of the month, or the last one when n is -1
+WEEKDAY_RULES = (
+    ('martin_luther_king_day', 1, MONDAY, 3),
+    ('washingtons_birthday', 2, MONDAY, 3),
+    ('memorial_day', 5, MONDAY, -1),
+    ('labor_day', 9, MONDAY, 1),
+    ('columbus_day', 10, MONDAY, 2),
+    ('thanksgiving_day', 11, THURSDAY, 4),
+    ('early_may_bank_holiday', 5, MONDAY, 1),
+    ('spring_bank_holiday', 5, MONDAY, -1),
+    ('summer_bank_holiday', 8, MONDAY, -1),
+)
+
+# (name, days after Easter Sunday)
+EASTER_RULES = (
+    ('good_friday', -2),
+    ('easter_monday', 1),
+)
+
+DateArrays = Tuple[np.ndarray, np.ndarray]
+
+
+def easter_dates(years: ArrayLike) -> DateArrays:
+    """
+    Vectorized Easter Sunday (anonymous Gregorian algorithm)
+
+    Args:
+        years: Gregorian years
+
+    Returns:
+        Tuple of int64 arrays (months, days)
+
+    Example:
+        >>> easter_dates([2024, 2025])
+        (array([3, 4]), array([31, 20]))
+    """
+    year = np.asarray(years, dtype=np.int64)
+    a = year % 19
+    b = year // 100
+    c = year % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = ((h + l - 7 * m + 114) % 31) + 1
+    return month, day
+
+
+@lru_cache(maxsize=None)
+def easter_date(year: int) -> Tuple[int, int]:
+    """
+    Get Easter Sunday of a year
+
+    Args:
+        year: Gregorian year
+
+    Returns:
+        Tuple of (month, day)
+    """
+    month, day = easter_dates(year)
+    return int(month), int(day)
+
+
+def weekday_of_month(years: ArrayLike, month: int, weekday: int, n: int) -> np.ndarray:
+    """
+    Vectorized day of the nth (or, with n = -1, last) weekday of a month
+
+    Args:
+        years: Gregorian years
+        month: Month (1-12)
+        weekday: Weekday as in datetime.weekday() (0 = Monday)
+        n: Occurrence, starting at 1, or -1 for the last one
+
+    Returns:
+        int64 array of days of month
+    """
+    years = np.asarray(years, dtype=np.int64)
+    first = gregorian_to_jdn_array(years, month, 1)
+    if n == -1:
+        next_year, next_month = (years + 1, 1) if month == 12 else (years, month + 1)
+        last = gregorian_to_jdn_array(next_year, next_month, 1) - 1
+        # The JDN modulo 7 is the datetime weekday
+        days: np.ndarray = last - first + 1 - (last % 7 - weekday) % 7
+        return days
+    return 1 + (weekday - first % 7) % 7 + (n - 1)*7
+
+
+def variable_holiday_dates(years: ArrayLike) -> Dict[str, DateArrays]:
+    """
+    Evaluate every variable holiday rule for many years
+
+    Args:
+        years: Gregorian years
+
+    Returns:
+        Dictionary of holiday name -> (months, days) arrays
+    """
+    years = np.asarray(years, dtype=np.int64)
+    dates = {}
+    for name, month, weekday, n in WEEKDAY_RULES:
+        dates[name] = (np.full(years.shape, month, dtype=np.int64), weekday_of_month(years, month, weekday, n))
+
+    easter = gregorian_to_jdn_array(years, *easter_dates(years))
+    for name, offset in EASTER_RULES:
+        _, months, days = jdn_to_gregorian_array(easter + offset)
+        dates[name] = (months, days)
+    return dates
+
+
+def variable_holiday_keys(years: ArrayLike) -> np.ndarray:
+    """
+    Variable holidays of many years as ``month*32 + day`` keys
+
+    Args:
+        years: Gregorian years
+
+    Returns:
+        int64 array of shape (len(years), number of rules)
+    """
+    dates = variable_holiday_dates(np.atleast_1d(years))
+    return np.stack([months*DAYS_PER_MONTH_SLOT + days for months, days in dates.values()], axis=-1)
+
+
+@lru_cache(maxsize=None)
+def get_variable_holidays(year: int) -> FrozenSet[Tuple[int, int]]:
+    """
+    Get the variable holidays of a year
+
+    Args:
+        year: Gregorian year
+
+    Returns:
+        Frozen set of (month, day) pairs
+
+    Example:
+        >>> (11, 28) in get_variable_holidays(2024)  # Thanksgiving
+        True
+    """
+    return frozenset(
+        (int(month[0]), int(day[0])) for month, day in variable_holiday_dates([year]).values()
+    )
@@ -4,8 +4,10 @@ Generator package for date dimension creation
 
 from .dimension import DateDimensionGenerator
 from .range_generator import DateRangeGenerator
+from .cache import DimensionCache
 
 __all__ = [
     'DateDimensionGenerator',
-    'DateRangeGenerator'
+    'DateRangeGenerator',
+    'DimensionCache'
 ]
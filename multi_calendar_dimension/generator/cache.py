@@ -0,0 +1,270 @@
+"""
+Persistent on-disk cache of generated date dimension tables
+کش دائمی جداول Date Dimension روی دیسک
+
+Each entry is a directory holding one ``.npy`` file per column and a JSON
+manifest. Numeric columns are loaded memory-mapped; text columns are stored
+dictionary-encoded (fixed-width unicode values plus int32 codes). Entries are
+keyed by a hash of the generation settings, the library version and the
+event tables, and the least recently used entries are evicted once the cache
+grows past its size limit.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Settings that change how a table is built or written, but not its contents
+NON_CONTENT_FIELDS = frozenset({'output_format', 'workers', 'cache', 'cache_dir'})
+
+DEFAULT_MAX_BYTES = 1024**3
+
+MANIFEST = 'manifest.json'
+
+
+def default_cache_dir() -> str:
+    """
+    Get the default cache directory
+
+    ``MULTI_CALENDAR_DIMENSION_CACHE_DIR`` overrides it; otherwise it is
+    ``multi_calendar_dimension`` under ``XDG_CACHE_HOME`` or ``~/.cache``.
+    """
+    directory = os.environ.get('MULTI_CALENDAR_DIMENSION_CACHE_DIR')
+    if directory:
+        return directory
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'multi_calendar_dimension')
+
+
+@lru_cache(maxsize=None)
+def _events_fingerprint() -> str:
+    """Hash of every event and holiday table"""
+    from .. import events
+    digest = hashlib.sha256()
+    for name in sorted(events.__all__):
+        table = getattr(events, name)
+        if not isinstance(table, dict):
+            continue
+        digest.update(name.encode())
+        digest.update(repr(sorted(table.items())).encode())
+    return digest.hexdigest()
+
+
+def _text_dtype(dtype: Any) -> bool:
+    return (dtype == object or isinstance(dtype, pd.CategoricalDtype)
+            or pd.api.types.is_string_dtype(dtype))
+
+
+class DimensionCache:
+    """
+    Directory of cached date dimension tables
+
+    Example:
+        >>> cache = DimensionCache()
+        >>> key = cache.key(config)
+        >>> df = cache.load(key)
+        >>> if df is None:
+        ...     cache.store(key, DateDimensionGenerator(config).generate())
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache
+
+        Args:
+            directory: Cache directory (default: :func:`default_cache_dir`)
+            max_bytes: Total size above which least recently used entries are evicted
+        """
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def key(self, config: Any, generator_class: Optional[type] = None) -> str:
+        """
+        Build the cache key of a generator configuration
+
+        Args:
+            config: Generator config dataclass
+            generator_class: Class generating the table, if not the default
+
+        Returns:
+            Hex digest identifying the table contents
+        """
+        from .. import __version__
+        settings = {field.name: getattr(config, field.name) for field in fields(config)
+                    if field.name not in NON_CONTENT_FIELDS}
+        parts = [
+            __version__,
+            _events_fingerprint(),
+            f"{generator_class.__module__}.{generator_class.__qualname__}" if generator_class else '',
+            repr(sorted(settings.items())),
+        ]
+        return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Load a cached table
+
+        Args:
+            key: Cache key from :meth:`key`
+
+        Returns:
+            The cached DataFrame (numeric columns memory-mapped, read-only),
+            or None if the entry does not exist
+        """
+        entry = self._entry(key)
+        try:
+            with open(os.path.join(entry, MANIFEST), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        columns: Dict[str, Any] = {}
+        try:
+            for number, column in enumerate(manifest['columns']):
+                path = os.path.join(entry, f"{number}")
+                if column['kind'] == 'text':
+                    codes = np.load(f"{path}.codes.npy")
+                    values = np.load(f"{path}.values.npy").tolist()
+                    if column['categorical']:
+                        columns[column['name']] = pd.Categorical.from_codes(codes, values)
+                    else:
+                        columns[column['name']] = np.array(values + [None], dtype=object)[codes]
+                else:
+                    columns[column['name']] = np.load(f"{path}.npy", mmap_mode='r')
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # Mark the entry as recently used; a read-only cache still serves hits
+        try:
+            os.utime(os.path.join(entry, MANIFEST))
+        except OSError:
+            pass
+
+        index = pd.RangeIndex(manifest['index_start'], manifest['index_start'] + manifest['rows'])
+        return pd.DataFrame(columns, index=index, copy=False)
+
+    def store(self, key: str, df: pd.DataFrame) -> None:
+        """
+        Store a table, then evict old entries past the size limit
+
+        If another process completes an entry for the same key first, that
+        entry is kept.
+
+        Args:
+            key: Cache key from :meth:`key`
+            df: Table to store; its index must be a RangeIndex
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix='.tmp-', dir=self.directory)
+        try:
+            manifest: Dict[str, Any] = {
+                'rows': len(df), 'index_start': int(df.index[0]) if len(df) else 0, 'columns': []
+            }
+            for number, name in enumerate(df.columns):
+                values = df[name]
+                path = os.path.join(staging, f"{number}")
+                if _text_dtype(values.dtype):
+                    categorical = isinstance(values.dtype, pd.CategoricalDtype)
+                    if categorical:
+                        codes = values.cat.codes.to_numpy().astype(np.int32)
+                        uniques = values.cat.categories.to_numpy(dtype=object)
+                    else:
+                        codes, uniques = pd.factorize(values.to_numpy(dtype=object))
+                        # Missing values (-1) map to the None stored past the last value
+                        codes = np.where(codes < 0, len(uniques), codes).astype(np.int32)
+                    np.save(f"{path}.codes.npy", codes)
+                    np.save(f"{path}.values.npy", np.array([str(value) for value in uniques], dtype=str))
+                    manifest['columns'].append({'name': name, 'kind': 'text', 'categorical': categorical})
+                else:
+                    np.save(f"{path}.npy", values.to_numpy())
+                    manifest['columns'].append({'name': name, 'kind': 'array'})
+
+            # The manifest is written last, so an entry without one is incomplete
+            with open(os.path.join(staging, MANIFEST), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False)
+
+            entry = self._entry(key)
+            shutil.rmtree(entry, ignore_errors=True)
+            try:
+                os.replace(staging, entry)
+            except OSError:
+                # Another process stored the same key in the meantime; its
+                # complete entry holds the same table, so keep it
+                if not os.path.isfile(os.path.join(entry, MANIFEST)):
+                    raise
+                shutil.rmtree(staging, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        self.evict(keep=key)
+
+    def _entries(self) -> Dict[str, Dict[str, float]]:
+        """Size and last use of every complete entry"""
+        entries: Dict[str, Dict[str, float]] = {}
+        if not os.path.isdir(self.directory):
+            return entries
+        for name in os.listdir(self.directory):
+            entry = self._entry(name)
+            manifest = os.path.join(entry, MANIFEST)
+            if name.startswith('.') or not os.path.isfile(manifest):
+                continue
+            size = sum(os.path.getsize(os.path.join(entry, file)) for file in os.listdir(entry))
+            entries[name] = {'bytes': size, 'last_used': os.path.getmtime(manifest)}
+        return entries
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Remove least recently used entries until the cache fits its size limit
+
+        Args:
+            keep: Entry that is never evicted, such as the one just stored
+        """
+        entries = self._entries()
+        total = sum(entry['bytes'] for entry in entries.values())
+        for name in sorted(entries, key=lambda name: entries[name]['last_used']):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            shutil.rmtree(self._entry(name), ignore_errors=True)
+            total -= entries[name]['bytes']
+
+    def clear(self) -> int:
+        """
+        Remove every entry
+
+        Returns:
+            Number of entries removed
+        """
+        entries = self._entries()
+        for name in entries:
+            shutil.rmtree(self._entry(name), ignore_errors=True)
+        return len(entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with the directory, entry count, total size and size limit
+        """
+        entries = self._entries()
+        return {
+            'directory': self.directory,
+            'entries': len(entries),
+            'total_bytes': sum(entry['bytes'] for entry in entries.values()),
+            'max_bytes': self.max_bytes,
+        }
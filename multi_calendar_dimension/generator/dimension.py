@@ -3,20 +3,25 @@ Date Dimension Generator
 تولید کننده جدول Date Dimension برای تقویم‌های شمسی، میلادی و قمری
 """
 
+import warnings
+
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-import calendar
-from typing import Optional, Union, List, Tuple
-from dataclasses import dataclass
+from pandas.api.types import union_categoricals
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterator, Optional, Union, List, Tuple, Type
+from dataclasses import astuple, dataclass
 
-from ..converters.jalali import jalali_to_gregorian, gregorian_to_jalali, is_leap_year_persian
-from ..converters.hijri import gregorian_to_hijri, hijri_to_gregorian
-from ..converters.cross import jalali_to_hijri, hijri_to_jalali
-from ..events import (
-    persian_events, persian_holidays, hijri_official_holidays,
-    gregorian_events_en, gregorian_events_fa, gregorian_holidays,
-    hijri_events, hijri_events_en, hijri_holidays
+from .cache import DimensionCache
+from .export import DATE_STRING_COLUMNS, write_arrow, write_excel, write_parquet
+from ..converters.jalali import is_leap_year_persian
+from ..converters.jdn import (
+    jalali_to_jdn_array, gregorian_to_jdn_array,
+    jdn_to_gregorian_array, jdn_to_hijri_array
 )
+from ..events.index import get_event_index, month_day_key
+from ..events.variable_holidays import easter_date, get_variable_holidays, variable_holiday_keys, weekday_of_month
 
 
 @dataclass
@@ -27,7 +32,34 @@ class DateDimensionConfig:
     include_events: bool = True
     include_holidays: bool = True
     include_week_calculations: bool = True
-    output_format: str = 'dataframe'  # 'dataframe', 'excel', 'csv'
+    output_format: str = 'dataframe'  # 'dataframe', 'excel', 'csv', 'parquet', 'arrow'
+    start_date: Optional[int] = None  # first Jalali day as YYYYMMDD, within start_year
+    end_date: Optional[int] = None  # last Jalali day as YYYYMMDD, within end_year
+    workers: int = 1  # processes used to build year shards in parallel
+    compact: bool = False  # small integer, bool and categorical dtypes
+    cache: bool = False  # reuse tables stored in the on-disk cache
+    cache_dir: Optional[str] = None  # default: ~/.cache/multi_calendar_dimension
+
+
+# Jalali year, month, day and days in month of every row
+DayArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+# Column dtypes of compact frames; flags become bool and text columns
+# other than per-day dates become categorical
+COMPACT_DTYPES = {
+    'shamsi_date': np.int32, 'shamsi_next_date': np.int32, 'hijri_date': np.int32,
+    'shamsi_month_id': np.int32, 'shamsi_season_id': np.int32, 'shamsi_half_year_id': np.int32,
+    'gregorian_month_id': np.int32, 'gregorian_season_id': np.int32, 'gregorian_half_year_id': np.int32,
+    'hijri_month_id': np.int32,
+    'shamsi_year_id': np.int16, 'gregorian_year_id': np.int16, 'hijri_year_id': np.int16,
+    'shamsi_day_of_year_id': np.int16, 'gregorian_day_of_year_id': np.int16,
+    'shamsi_month_of_year_id': np.int8, 'gregorian_month_of_year_id': np.int8, 'hijri_month_of_year_id': np.int8,
+    'shamsi_day_of_month_id': np.int8, 'gregorian_day_of_month_id': np.int8, 'hijri_day_of_month_id': np.int8,
+    'shamsi_day_of_week_id': np.int8, 'gregorian_day_of_week_id': np.int8,
+    'week_num_in_month': np.int8, 'week_num_in_year': np.int8, 'gregorian_week_id': np.int8,
+    'miladi_week_id': np.int8, 'miladi_week_num_in_month': np.int8,
+    'shamsi_week_id': np.int32, 'shamsi_week_of_year_id': np.int32, 'gregorian_week_of_year_id': np.int32,
+}
 
 
 class DateDimensionGenerator:
@@ -47,6 +79,8 @@ class DateDimensionGenerator:
         """
         self.config = config
         self._setup_constants()
+        self._cached_table: Optional[pd.DataFrame] = None
+        self._cached_config: Optional[tuple] = None
     
     def _setup_constants(self):
         """Setup constant dictionaries for month names and seasons"""
@@ -81,6 +115,16 @@ class DateDimensionGenerator:
             7: "نیمسال دوم", 8: "نیمسال دوم", 9: "نیمسال دوم",
             10: "نیمسال دوم", 11: "نیمسال دوم", 12: "نیمسال دوم"
         }
+        
+        self.gregorian_seasons = {
+            12: "Winter", 1: "Winter", 2: "Winter",
+            3: "Spring", 4: "Spring", 5: "Spring",
+            6: "Summer", 7: "Summer", 8: "Summer",
+            9: "Autumn", 10: "Autumn", 11: "Autumn"
+        }
+        
+        self.persian_days = ["شنبه", "یکشنبه", "دوشنبه", "سه‌شنبه", "چهارشنبه", "پنج‌شنبه", "جمعه"]
+        self.english_days = ["Saturday", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
     
     def _day_of_week(self, gy: int, gm: int, gd: int) -> Tuple[str, str, int]:
         """
@@ -100,10 +144,7 @@ class DateDimensionGenerator:
         K, J = gy % 100, gy // 100
         h = (gd + (13*(gm + 1))//5 + K + (K//4) + (J//4) + (5*J)) % 7
         
-        persian_days = ["شنبه", "یکشنبه", "دوشنبه", "سه‌شنبه", "چهارشنبه", "پنج‌شنبه", "جمعه"]
-        english_days = ["Saturday", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-        
-        return persian_days[h], english_days[h], h + 1
+        return self.persian_days[h], self.english_days[h], h + 1
     
     def _get_variable_holidays(self, year: int) -> dict:
         """
@@ -115,280 +156,650 @@ class DateDimensionGenerator:
         Returns:
             Dictionary of (month, day) -> holiday status
         """
-        holidays = {}
-        
-        # Martin Luther King Jr. Day (3rd Monday of January)
-        mlk_day = self._nth_weekday_of_month(year, 1, 0, 3)
-        holidays[(1, mlk_day)] = 1
+        return {month_day: 1 for month_day in get_variable_holidays(year)}
+    
+    def _nth_weekday_of_month(self, year: int, month: int, weekday: int, n: int) -> int:
+        """Find the nth occurrence of a weekday in a month"""
+        return int(weekday_of_month(year, month, weekday, n))
+    
+    def _last_weekday_of_month(self, year: int, month: int, weekday: int) -> int:
+        """Find the last occurrence of a weekday in a month"""
+        return int(weekday_of_month(year, month, weekday, -1))
+    
+    def _calculate_easter(self, year: int) -> datetime:
+        """Calculate Easter date using the algorithm"""
+        return datetime(year, *easter_date(year))
+    
+    def _jalali_days(self, start_year: int, end_year: int) -> DayArrays:
+        """
+        Enumerate every Jalali day of the given years
         
-        # Washington's Birthday (3rd Monday of February)
-        washington_day = self._nth_weekday_of_month(year, 2, 0, 3)
-        holidays[(2, washington_day)] = 1
+        Returns:
+            Tuple of arrays (year, month, day, days in month)
+        """
+        years = np.arange(start_year, end_year + 1, dtype=np.int64)
+        month_lengths = np.tile(np.array([31]*6 + [30]*5 + [29], dtype=np.int64), (len(years), 1))
+        month_lengths[[is_leap_year_persian(year) for year in years.tolist()], 11] = 30
+        month_lengths = month_lengths.ravel()
+        
+        jy = np.repeat(np.repeat(years, 12), month_lengths)
+        jm = np.repeat(np.tile(np.arange(1, 13, dtype=np.int64), len(years)), month_lengths)
+        month_starts = np.cumsum(month_lengths) - month_lengths
+        jd = np.arange(len(jy), dtype=np.int64) - np.repeat(month_starts, month_lengths) + 1
+        return jy, jm, jd, np.repeat(month_lengths, month_lengths)
+    
+    def _variable_holiday_mask(self, years: np.ndarray, months: np.ndarray, days: np.ndarray) -> np.ndarray:
+        """Flag (month, day) pairs that are variable holidays of the matching year"""
+        if len(years) == 0:
+            return np.zeros(0, dtype=bool)
+        unique_years, inverse = np.unique(years, return_inverse=True)
+        holiday_keys = variable_holiday_keys(unique_years)[inverse.ravel()]
+        is_holiday: np.ndarray = (holiday_keys == month_day_key(months, days)[:, None]).any(axis=1)
+        return is_holiday
+    
+    @staticmethod
+    def _format_by_key(keys: np.ndarray, formatter: Callable[[int], str]) -> np.ndarray:
+        """Format each distinct key once and gather the labels for every row"""
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        labels = np.array([formatter(key) for key in unique_keys.tolist()], dtype=object)
+        return labels[inverse.ravel()]
+    
+    @staticmethod
+    def _format_dates(years: np.ndarray, months: np.ndarray, days: np.ndarray, separator: str) -> np.ndarray:
+        """Format zero-padded date strings such as 1403/01/01"""
+        fmt = f"{{:04d}}{separator}{{:02d}}{separator}{{:02d}}".format
+        return np.array([fmt(y, m, d) for y, m, d in zip(years.tolist(), months.tolist(), days.tolist())],
+                        dtype=object)
+    
+    def _span_rows(self, shamsi_date: np.ndarray) -> slice:
+        """
+        Rows of the configured start_date..end_date span
         
-        # Memorial Day (Last Monday of May)
-        memorial_day = self._last_weekday_of_month(year, 5, 0)
-        holidays[(5, memorial_day)] = 1
+        Args:
+            shamsi_date: Sorted YYYYMMDD keys of the enumerated days
+            
+        Returns:
+            Slice selecting the span
+        """
+        start = 0
+        stop = len(shamsi_date)
+        if self.config.start_date is not None:
+            start = int(np.searchsorted(shamsi_date, self.config.start_date, side='left'))
+        if self.config.end_date is not None:
+            stop = int(np.searchsorted(shamsi_date, self.config.end_date, side='right'))
+        return slice(start, max(start, stop))
+    
+    @staticmethod
+    def _iso_weeks(jdn: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """ISO week-numbering year and week of each day"""
+        # ISO weeks belong to the year of their Thursday
+        thursday = jdn - jdn % 7 + 3
+        iso_year = jdn_to_gregorian_array(thursday)[0]
+        return iso_year, (thursday - gregorian_to_jdn_array(iso_year, 1, 1)) // 7 + 1
+    
+    @staticmethod
+    def _dense_rank_within_groups(values: np.ndarray, group_keys: np.ndarray) -> np.ndarray:
+        """Dense rank (starting at 1) of each value among the values of its group"""
+        unique_keys, inverse = np.unique(group_keys*100 + values, return_inverse=True)
+        unique_groups = unique_keys // 100
+        group_starts = np.flatnonzero(np.r_[True, unique_groups[1:] != unique_groups[:-1]])
+        first_positions = np.repeat(group_starts, np.diff(np.r_[group_starts, len(unique_keys)]))
+        ranks = np.arange(len(unique_keys)) - first_positions + 1
+        return ranks[inverse.ravel()]
+    
+    def _week_columns(self, jdn: np.ndarray, jy: np.ndarray, jm: np.ndarray,
+                      gregorian_year_id: np.ndarray, gregorian_month_id: np.ndarray,
+                      bounds: Tuple[int, int]) -> Dict[str, np.ndarray]:
+        """
+        Build the Persian (Saturday-based) and ISO week columns
         
-        # Labor Day (1st Monday of September)
-        labor_day = self._nth_weekday_of_month(year, 9, 0, 1)
-        holidays[(9, labor_day)] = 1
+        Args:
+            jdn: Day numbers of the rows
+            jy: Jalali years of the rows
+            jm: Jalali months of the rows
+            gregorian_year_id: Gregorian years of the rows
+            gregorian_month_id: Gregorian YYYYMM keys of the rows
+            bounds: First and last day number of the whole generated years
+            
+        Returns:
+            Dictionary of column name -> array, in output column order
+        """
+        # Persian weeks start on Saturday and restart with every month and
+        # year, so a week number is the count of Saturday-based weeks begun
+        # since the first day of the month or year
+        saturday_week = (jdn + 2) // 7
+        week_num_in_month = 1 + saturday_week - (jalali_to_jdn_array(jy, jm, 1) + 2) // 7
+        week_num_in_year = 1 + saturday_week - (jalali_to_jdn_array(jy, 1, 1) + 2) // 7
+        
+        iso_week = self._iso_weeks(jdn)[1]
+        
+        # Rank ISO weeks among all generated days of each Gregorian month,
+        # including days of the month outside the requested span
+        miladi_week_num_in_month = np.zeros(len(jdn), dtype=np.int64)
+        if len(jdn):
+            first_gy, first_gm = divmod(int(gregorian_month_id[0]), 100)
+            last_gy, last_gm = divmod(int(gregorian_month_id[-1]) + 1, 100)
+            if last_gm > 12:
+                last_gy, last_gm = last_gy + 1, 1
+            context = np.arange(max(bounds[0], int(gregorian_to_jdn_array(first_gy, first_gm, 1))),
+                                min(bounds[1], int(gregorian_to_jdn_array(last_gy, last_gm, 1)) - 1) + 1)
+            context_gy, context_gm, _ = jdn_to_gregorian_array(context)
+            context_ranks = self._dense_rank_within_groups(self._iso_weeks(context)[1],
+                                                           context_gy*100 + context_gm)
+            miladi_week_num_in_month = context_ranks[jdn - context[0]]
+        
+        shamsi_month_id = jy*100 + jm
+        shamsi_week_key = jy*100 + week_num_in_year
+        gregorian_week_key = gregorian_year_id*100 + iso_week
+        
+        if self.config.compact:
+            # Integer week ids: YYYYMMWW for the month week, YYYYWW otherwise
+            return {
+                'week_num_in_month': week_num_in_month,
+                'shamsi_week_id': shamsi_month_id*100 + week_num_in_month,
+                'week_num_in_year': week_num_in_year,
+                'shamsi_week_title': self._format_by_key(
+                    shamsi_week_key, lambda key: f"هفته {key % 100} سال {key // 100}"),
+                'shamsi_week_of_year_id': shamsi_week_key,
+                'gregorian_week_id': iso_week,
+                'gregorian_week_title': self._format_by_key(
+                    gregorian_week_key, lambda key: f"Week {key % 100} {key // 100}"),
+                'gregorian_week_of_year_id': gregorian_week_key,
+                'miladi_week_id': iso_week,
+                'miladi_week_num_in_month': miladi_week_num_in_month,
+            }
+        
+        return {
+            'week_num_in_month': week_num_in_month,
+            'shamsi_week_id': self._format_by_key(
+                shamsi_month_id*100 + week_num_in_month, lambda key: f"{key // 100}_{key % 100}"),
+            'week_num_in_year': week_num_in_year,
+            'shamsi_week_title': self._format_by_key(
+                shamsi_week_key, lambda key: f"هفته {key % 100} سال {key // 100}"),
+            'shamsi_week_of_year_id': self._format_by_key(
+                shamsi_week_key, lambda key: f"{key // 100:04d}_{key % 100:02d}"),
+            'gregorian_week_id': iso_week,
+            'gregorian_week_title': self._format_by_key(
+                gregorian_week_key, lambda key: f"Week {key % 100} {key // 100}"),
+            'gregorian_week_of_year_id': self._format_by_key(
+                gregorian_week_key, lambda key: f"{key // 100:04d}_{key % 100:02d}"),
+            'miladi_week_id': iso_week,
+            'miladi_week_num_in_month': miladi_week_num_in_month,
+        }
+    
+    def _build_columns(self, jy: np.ndarray, jm: np.ndarray, jd: np.ndarray,
+                       days_in_month: np.ndarray, bounds: Tuple[int, int]) -> Dict[str, np.ndarray]:
+        """
+        Build every per-day column of the dimension as NumPy arrays
         
-        # Columbus Day (2nd Monday of October)
-        columbus_day = self._nth_weekday_of_month(year, 10, 0, 2)
-        holidays[(10, columbus_day)] = 1
+        Args:
+            jy: Jalali years of the rows
+            jm: Jalali months of the rows
+            jd: Jalali days of the rows
+            days_in_month: Length of each row's Jalali month
+            bounds: First and last day number of the whole generated years
+            
+        Returns:
+            Dictionary of column name -> array, in output column order
+        """
+        jdn = jalali_to_jdn_array(jy, jm, jd)
+        gy, gm, gd = jdn_to_gregorian_array(jdn)
+        hy, hm, hd = jdn_to_hijri_array(jdn)
+        next_gy, next_gm, next_gd = jdn_to_gregorian_array(jdn + 1)
+        
+        # 1 = Saturday ... 7 = Friday
+        day_id = (jdn + 2) % 7 + 1
+        persian_day = np.array(self.persian_days, dtype=object)[day_id - 1]
+        english_day = np.array(self.english_days, dtype=object)[day_id - 1]
+        
+        # Holiday status, gathered from the compiled (month, day) index
+        event_index = get_event_index()
+        gregorian_holiday_status = (
+            event_index.is_holiday('gregorian_holidays', gm, gd)
+            | self._variable_holiday_mask(jy, gm, gd)
+        ).astype(np.int64)
+        
+        persian_holiday_status = (
+            event_index.is_holiday('persian_holidays', jm, jd)
+            | (day_id == 7)  # Friday (جمعه) - always holiday
+        ).astype(np.int64)
+        
+        hijri_holiday_status = (
+            event_index.is_holiday('hijri_holidays', hm, hd)
+            | event_index.is_holiday('hijri_official_holidays', hm, hd)
+        ).astype(np.int64)
+        
+        shamsi_date = jy*10000 + jm*100 + jd
+        shamsi_next_date = np.where(
+            jd < days_in_month, shamsi_date + 1,
+            np.where(jm < 12, jy*10000 + (jm + 1)*100 + 1, (jy + 1)*10000 + 101)
+        )
+        shamsi_day_of_year = np.where(jm <= 7, 31*(jm - 1), 186 + 30*(jm - 7)) + jd
+        shamsi_month_id = jy*100 + jm
+        gregorian_month_id = gy*100 + gm
+        hijri_month_id = hy*100 + hm
+        miladi_date = self._format_dates(gy, gm, gd, '-')
+        zeros = np.zeros(len(jdn), dtype=np.int64)
+        
+        columns = {
+            'shamsi_date': shamsi_date,
+            'miladi_date': miladi_date,
+            'miladi_day_of_week_title': english_day,
+            'shamsi_date_title': self._format_dates(jy, jm, jd, '/'),
+            'shamsi_next_date': shamsi_next_date,
+            'shamsi_month_id': shamsi_month_id,
+            'shamsi_month_title': self._format_by_key(
+                shamsi_month_id, lambda key: f"{self.persian_months[key % 100]} {key // 100}"),
+            'shamsi_month_of_year_title': np.array([None] + list(self.persian_months.values()), dtype=object)[jm],
+            'shamsi_season_id': shamsi_month_id,
+            'shamsi_season_title': self._format_by_key(
+                shamsi_month_id, lambda key: f"{self.seasons[key % 100]} {key // 100}"),
+            'shamsi_half_year_id': shamsi_month_id,
+            'shamsi_half_year_title': self._format_by_key(
+                shamsi_month_id, lambda key: f"{self.half_years[key % 100]} {key // 100}"),
+            'shamsi_year_id': jy,
+            'shamsi_month_of_year_id': jm,
+            'shamsi_day_of_month_id': jd,
+            'shamsi_day_of_year_id': shamsi_day_of_year,
+            'shamsi_day_of_week_title': persian_day,
+            'shamsi_day_of_week_id': day_id,
+            'shamsi_is_holiday': persian_holiday_status,
+            'shamsi_is_happy_holiday': persian_holiday_status,
+            'shamsi_is_sad_holiday': zeros,
+            'shamsi_is_weekend': ((day_id == 6) | (day_id == 7)).astype(np.int64),  # Thursday and Friday are weekends
+            'gregorian_next_date': self._format_dates(next_gy, next_gm, next_gd, '-'),
+            'gregorian_month_id': gregorian_month_id,
+            'gregorian_month_title': self._format_by_key(
+                gregorian_month_id, lambda key: f"{self.gregorian_months[key % 100]} {key // 100}"),
+            'gregorian_month_of_year_title': np.array([None] + list(self.gregorian_months.values()), dtype=object)[gm],
+            'gregorian_season_id': gregorian_month_id,
+            'gregorian_season_title': self._format_by_key(
+                gregorian_month_id, lambda key: f"{self.gregorian_seasons[key % 100]} {key // 100}"),
+            'gregorian_half_year_id': gregorian_month_id,
+            'gregorian_half_year_title': self._format_by_key(
+                gregorian_month_id, lambda key: f"{'H1' if key % 100 <= 6 else 'H2'} {key // 100}"),
+            'gregorian_year_id': gy,
+            'gregorian_month_of_year_id': gm,
+            'gregorian_day_of_month_id': gd,
+            'gregorian_day_of_year_id': jdn - gregorian_to_jdn_array(gy, 1, 1) + 1,
+            'gregorian_day_of_week_title': english_day,
+            'gregorian_day_of_week_id': day_id,
+            'gregorian_is_holiday': gregorian_holiday_status,
+            'gregorian_is_happy_holiday': gregorian_holiday_status,
+            'gregorian_is_sad_holiday': zeros,
+            'gregorian_is_weekend': ((day_id == 1) | (day_id == 2)).astype(np.int64),
+            'hijri_date': hy*10000 + hm*100 + hd,
+            'hijri_date_title': self._format_dates(hy, hm, hd, '/'),
+            'hijri_month_id': hijri_month_id,
+            'hijri_month_title': self._format_by_key(
+                hijri_month_id, lambda key: f"{self.hijri_months[key % 100]} {key // 100}"),
+            'hijri_month_of_year_title': np.array([None] + list(self.hijri_months.values()), dtype=object)[hm],
+            'hijri_year_id': hy,
+            'hijri_month_of_year_id': hm,
+            'hijri_day_of_month_id': hd,
+            'hijri_is_holiday': hijri_holiday_status,
+            'hijri_is_happy_holiday': hijri_holiday_status,
+            'hijri_is_sad_holiday': zeros,
+        }
         
-        # Thanksgiving Day (4th Thursday of November)
-        thanksgiving_day = self._nth_weekday_of_month(year, 11, 3, 4)
-        holidays[(11, thanksgiving_day)] = 1
+        # Add events if enabled
+        if self.config.include_events:
+            columns.update({
+                'shamsi_event_name': event_index.event_names('persian_events', jm, jd),
+                'gregorian_event_name_en': event_index.event_names('gregorian_events_en', gm, gd),
+                'gregorian_event_name_fa': event_index.event_names('gregorian_events_fa', gm, gd),
+                'hijri_event_name': event_index.event_names('hijri_events', hm, hd),
+                'hijri_event_name_en': event_index.event_names('hijri_events_en', hm, hd),
+            })
         
-        # Easter calculations
-        easter = self._calculate_easter(year)
-        good_friday = easter - timedelta(days=2)
-        easter_monday = easter + timedelta(days=1)
+        # Add week calculations if enabled
+        if self.config.include_week_calculations:
+            columns.update(self._week_columns(jdn, jy, jm, gy, gregorian_month_id, bounds))
         
-        holidays[(good_friday.month, good_friday.day)] = 1
-        holidays[(easter_monday.month, easter_monday.day)] = 1
+        return columns
+    
+    @staticmethod
+    def _to_frame(columns: Dict[str, np.ndarray], index: pd.RangeIndex, compact: bool,
+                  categories: Optional[Dict[str, List[str]]] = None) -> pd.DataFrame:
+        """
+        Assemble built columns into a DataFrame, with compact dtypes if requested
         
-        # UK Bank Holidays
-        early_may_day = self._nth_weekday_of_month(year, 5, 0, 1)
-        holidays[(5, early_may_day)] = 1
+        ``categories`` fixes the categories of compact text columns; by
+        default they are the values present in ``columns``.
+        """
+        if compact:
+            categories = categories or {}
+            columns = {
+                name: (values.astype(bool) if '_is_' in name
+                       else values.astype(COMPACT_DTYPES[name]) if name in COMPACT_DTYPES
+                       else values if name in DATE_STRING_COLUMNS
+                       else pd.Categorical(values, categories=categories.get(name)))
+                for name, values in columns.items()
+            }
+        return pd.DataFrame(columns, index=index)
+    
+    def _span_days(self) -> Tuple[DayArrays, slice, Tuple[int, int]]:
+        """
+        Enumerate the configured days
         
-        spring_bank_day = self._last_weekday_of_month(year, 5, 0)
-        holidays[(5, spring_bank_day)] = 1
+        Rows are limited to start_date..end_date when those are set.
         
-        summer_bank_day = self._last_weekday_of_month(year, 8, 0)
-        holidays[(8, summer_bank_day)] = 1
+        Returns:
+            Tuple of ((year, month, day, days in month) arrays of the span,
+            the span's rows in the full start_year..end_year table,
+            first and last day number of the full table)
+        """
+        jy, jm, jd, days_in_month = self._jalali_days(self.config.start_year, self.config.end_year)
+        bounds = (0, -1)
+        if len(jy):
+            bounds = (int(jalali_to_jdn_array(jy[0], jm[0], jd[0])), int(jalali_to_jdn_array(jy[-1], jm[-1], jd[-1])))
         
-        return holidays
+        rows = self._span_rows(jy*10000 + jm*100 + jd)
+        return (jy[rows], jm[rows], jd[rows], days_in_month[rows]), rows, bounds
     
-    def _nth_weekday_of_month(self, year: int, month: int, weekday: int, n: int) -> int:
-        """Find the nth occurrence of a weekday in a month"""
-        first_day = datetime(year, month, 1)
-        first_weekday = first_day.weekday()
-        days_to_add = (weekday - first_weekday) % 7 + (n - 1) * 7
-        target_date = first_day + timedelta(days=days_to_add)
-        return target_date.day
-    
-    def _last_weekday_of_month(self, year: int, month: int, weekday: int) -> int:
-        """Find the last occurrence of a weekday in a month"""
-        last_day = calendar.monthrange(year, month)[1]
-        last_date = datetime(year, month, last_day)
-        last_weekday = last_date.weekday()
-        days_to_subtract = (last_weekday - weekday) % 7
-        target_date = last_date - timedelta(days=days_to_subtract)
-        return target_date.day
+    def _generate(self) -> pd.DataFrame:
+        """
+        Build the date dimension table for the current config, or load it
+        from the on-disk cache when caching is enabled
+        
+        The index keeps each row's position in the full start_year..end_year table.
+        """
+        if not self.config.cache:
+            return self._build_table()
+        
+        cache = DimensionCache(self.config.cache_dir)
+        key = cache.key(self.config, type(self))
+        df = cache.load(key)
+        if df is None:
+            df = self._build_table()
+            try:
+                cache.store(key, df)
+            except OSError as e:
+                # The cache only saves work; a failed write must not fail the build
+                warnings.warn(f"Could not store the table in the dimension cache: {e}", RuntimeWarning)
+        return df
     
-    def _calculate_easter(self, year: int) -> datetime:
-        """Calculate Easter date using the algorithm"""
-        a = year % 19
-        b = year // 100
-        c = year % 100
-        d = b // 4
-        e = b % 4
-        f = (b + 8) // 25
-        g = (b - f + 1) // 3
-        h = (19 * a + b - d - g + 15) % 30
-        i = c // 4
-        k = c % 4
-        l = (32 + 2 * e + 2 * i - h - k) % 7
-        m = (a + 11 * h + 22 * l) // 451
-        month = (h + l - 7 * m + 114) // 31
-        day = ((h + l - 7 * m + 114) % 31) + 1
-        return datetime(year, month, day)
-    
-    def _assign_monthly_weeks(self, df_month: pd.DataFrame) -> pd.DataFrame:
-        """Assign week numbers within each month"""
-        df_month = df_month.sort_values('shamsi_date').copy()
-        is_saturday = (df_month['shamsi_day_of_week_id'] == 1)
-        week_break = is_saturday.astype(int)
-        if len(week_break) > 0:
-            week_break.iloc[0] = 0
-        df_month['week_num_in_month'] = 1 + week_break.cumsum()
-        df_month['shamsi_week_id'] = df_month['shamsi_month_id'].astype(str) + '_' + df_month['week_num_in_month'].astype(int).astype(str)
-        return df_month
-    
-    def _assign_yearly_weeks(self, df_year: pd.DataFrame) -> pd.DataFrame:
-        """Assign week numbers within each year"""
-        df_year = df_year.sort_values(['shamsi_month_id', 'shamsi_date']).copy()
-        is_saturday = (df_year['shamsi_day_of_week_id'] == 1)
-        week_break = is_saturday.astype(int)
-        if len(week_break) > 0:
-            week_break.iloc[0] = 0
-        df_year['week_num_in_year'] = 1 + week_break.cumsum()
-        return df_year
+    def _build_table(self) -> pd.DataFrame:
+        """Build the date dimension table for the current config"""
+        days, rows, bounds = self._span_days()
+        
+        if self.config.workers < 1:
+            raise ValueError("workers must be at least 1")
+        
+        shards = self._year_shards(days[0], self.config.workers)
+        if len(shards) <= 1:
+            columns = self._build_columns(*days, bounds)
+        else:
+            # Every column depends only on its own row and the whole-table
+            # bounds, so shards concatenate into exactly the serial result
+            with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+                parts = list(executor.map(
+                    _build_shard,
+                    [(type(self), self.config, _day_slice(days, shard), bounds) for shard in shards]
+                ))
+            columns = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+        
+        return self._to_frame(columns, pd.RangeIndex(rows.start, rows.stop), self.config.compact)
     
-    def generate(self) -> pd.DataFrame:
+    @staticmethod
+    def _year_shards(jy: np.ndarray, workers: int) -> List[slice]:
         """
-        Generate the complete date dimension table
+        Split rows into up to ``workers`` runs of whole Jalali years
         
+        Args:
+            jy: Sorted Jalali years of the rows
+            workers: Maximum number of shards
+            
         Returns:
-            DataFrame with all date dimension columns
+            List of row slices
         """
-        data = []
+        years = np.unique(jy)
+        if workers <= 1 or len(years) <= 1:
+            return [slice(0, len(jy))]
+        first_years = [group[0] for group in np.array_split(years, min(workers, len(years)))]
+        edges = np.searchsorted(jy, first_years).tolist() + [len(jy)]
+        return [slice(start, stop) for start, stop in zip(edges[:-1], edges[1:])]
+    
+    def extend(self, existing_df: pd.DataFrame, new_end_year: int, only_new: bool = False) -> pd.DataFrame:
+        """
+        Append the years after an existing table without regenerating it
+        
+        Only the missing years are built, using this generator's options.
+        The result equals a table generated for the whole span: week numbers
+        and next-date links continue across the seam, and the index continues
+        from the existing one.
         
-        for year in range(self.config.start_year, self.config.end_year + 1):
-            # Get variable holidays for this year
-            variable_holidays = self._get_variable_holidays(year)
+        Args:
+            existing_df: Table generated with the same options, ending on the
+                last day of a Jalali year
+            new_end_year: Last Jalali year of the extended table
+            only_new: Return only the new rows, e.g. to write a new partition
+            
+        Returns:
+            The extended table, or only its new rows
             
-            for month in range(1, 13):
-                days_in_month = 31 if month <= 6 else (30 if month <= 11 else (30 if is_leap_year_persian(year) else 29))
-                
-                for day in range(1, days_in_month + 1):
-                    # Convert Jalali to Gregorian
-                    gy, gm, gd = jalali_to_gregorian(year, month, day)
-                    persian_day, english_day, day_id = self._day_of_week(gy, gm, gd)
-                    greg_date = datetime(gy, gm, gd)
-                    
-                    # Convert to Hijri
-                    hy, hm, hd = gregorian_to_hijri(gy, gm, gd)
-                    
-                    # Check holiday status
-                    is_variable_holiday = variable_holidays.get((gm, gd), 0)
-                    gregorian_holiday_status = gregorian_holidays.get((gm, gd), 0) or is_variable_holiday
-                    
-                    persian_holiday_status = persian_holidays.get((month, day), 0)
-                    if day_id == 7:  # Friday (جمعه) - always holiday
-                        persian_holiday_status = 1
-                    
-                    hijri_holiday_status = hijri_holidays.get((hm, hd), 0)
-                    hijri_official_status = hijri_official_holidays.get((hm, hd), 0)
-                    hijri_holiday_status = hijri_holiday_status or hijri_official_status
-                    
-                    # Calculate day of year for Persian calendar
-                    shamsi_day_of_year = sum([
-                        31 if m <= 6 else (30 if m <= 11 else (30 if is_leap_year_persian(year) else 29))
-                        for m in range(1, month)
-                    ]) + day
-                    
-                    # Get season for Gregorian calendar
-                    get_season = lambda m: "Winter" if m in [12, 1, 2] else ("Spring" if m in [3, 4, 5] else ("Summer" if m in [6, 7, 8] else "Autumn"))
-                    
-                    row_data = {
-                        'shamsi_date': int(f"{year:04d}{month:02d}{day:02d}"),
-                        'miladi_date': f"{gy:04d}-{gm:02d}-{gd:02d}",
-                        'miladi_day_of_week_title': english_day,
-                        'shamsi_date_title': f"{year:04d}/{month:02d}/{day:02d}",
-                        'shamsi_next_date': int(f"{year:04d}{month:02d}{day+1:02d}") if day < days_in_month else (int(f"{year:04d}{month+1:02d}01") if month < 12 else int(f"{year+1:04d}0101")),
-                        'shamsi_month_id': int(f"{year:04d}{month:02d}"),
-                        'shamsi_month_title': f"{self.persian_months[month]} {year}",
-                        'shamsi_month_of_year_title': self.persian_months[month],
-                        'shamsi_season_id': int(f"{year:04d}{month:02d}"),
-                        'shamsi_season_title': f"{self.seasons[month]} {year}",
-                        'shamsi_half_year_id': int(f"{year:04d}{month:02d}"),
-                        'shamsi_half_year_title': f"{self.half_years[month]} {year}",
-                        'shamsi_year_id': year,
-                        'shamsi_month_of_year_id': month,
-                        'shamsi_day_of_month_id': day,
-                        'shamsi_day_of_year_id': shamsi_day_of_year,
-                        'shamsi_day_of_week_title': persian_day,
-                        'shamsi_day_of_week_id': day_id,
-                        'shamsi_is_holiday': persian_holiday_status,
-                        'shamsi_is_happy_holiday': persian_holiday_status,
-                        'shamsi_is_sad_holiday': 0,
-                        'shamsi_is_weekend': 1 if day_id in [6, 7] else 0,  # Thursday and Friday are weekends
-                        'gregorian_next_date': (greg_date + timedelta(days=1)).strftime('%Y-%m-%d'),
-                        'gregorian_month_id': int(f"{gy:04d}{gm:02d}"),
-                        'gregorian_month_title': f"{self.gregorian_months[gm]} {gy}",
-                        'gregorian_month_of_year_title': self.gregorian_months[gm],
-                        'gregorian_season_id': int(f"{gy:04d}{gm:02d}"),
-                        'gregorian_season_title': f"{get_season(gm)} {gy}",
-                        'gregorian_half_year_id': int(f"{gy:04d}{gm:02d}"),
-                        'gregorian_half_year_title': f"{'H1' if gm <= 6 else 'H2'} {gy}",
-                        'gregorian_year_id': gy,
-                        'gregorian_month_of_year_id': gm,
-                        'gregorian_day_of_month_id': gd,
-                        'gregorian_day_of_year_id': greg_date.timetuple().tm_yday,
-                        'gregorian_day_of_week_title': english_day,
-                        'gregorian_day_of_week_id': (greg_date.weekday() + 2) % 7 + 1,
-                        'gregorian_is_holiday': gregorian_holiday_status,
-                        'gregorian_is_happy_holiday': gregorian_holiday_status,
-                        'gregorian_is_sad_holiday': 0,
-                        'gregorian_is_weekend': 1 if greg_date.weekday() in [5, 6] else 0,
-                        'hijri_date': int(f"{hy:04d}{hm:02d}{hd:02d}"),
-                        'hijri_date_title': f"{hy:04d}/{hm:02d}/{hd:02d}",
-                        'hijri_month_id': int(f"{hy:04d}{hm:02d}"),
-                        'hijri_month_title': f"{self.hijri_months[hm]} {hy}",
-                        'hijri_month_of_year_title': self.hijri_months[hm],
-                        'hijri_year_id': hy,
-                        'hijri_month_of_year_id': hm,
-                        'hijri_day_of_month_id': hd,
-                        'hijri_is_holiday': hijri_holiday_status,
-                        'hijri_is_happy_holiday': hijri_holiday_status,
-                        'hijri_is_sad_holiday': 0,
-                    }
-                    
-                    # Add events if enabled
-                    if self.config.include_events:
-                        row_data.update({
-                            'shamsi_event_name': persian_events.get((month, day)),
-                            'gregorian_event_name_en': gregorian_events_en.get((gm, gd)),
-                            'gregorian_event_name_fa': gregorian_events_fa.get((gm, gd)),
-                            'hijri_event_name': hijri_events.get((hm, hd)),
-                            'hijri_event_name_en': hijri_events_en.get((hm, hd)),
-                        })
-                    
-                    data.append(row_data)
-        
-        # Create DataFrame
-        df = pd.DataFrame(data)
+        Example:
+            >>> df = generator.extend(df, 1411)
+        """
+        if existing_df.empty:
+            raise ValueError("Cannot extend an empty table")
+        
+        last_year = int(existing_df['shamsi_year_id'].iloc[-1])
+        if int(existing_df['shamsi_next_date'].iloc[-1]) != (last_year + 1)*10000 + 101:
+            raise ValueError("The existing table must end on the last day of a Jalali year")
+        if new_end_year <= last_year:
+            raise ValueError(f"New end year must be after {last_year}")
+        
+        jy, jm, jd, days_in_month = self._jalali_days(last_year + 1, new_end_year)
+        
+        # Year-relative context starts where the existing table's generation did
+        first_year = int(existing_df['shamsi_year_id'].iloc[0])
+        bounds = (int(jalali_to_jdn_array(first_year, 1, 1)), int(jalali_to_jdn_array(jy[-1], jm[-1], jd[-1])))
+        
+        columns = self._build_columns(jy, jm, jd, days_in_month, bounds)
+        if list(columns) != list(existing_df.columns):
+            raise ValueError("The existing table was generated with different options")
+        
+        first_row = int(existing_df.index[-1]) + 1
+        new_df = self._to_frame(columns, pd.RangeIndex(first_row, first_row + len(jy)), self.config.compact)
+        if only_new:
+            return new_df
+        
+        df = pd.concat([existing_df, new_df])
+        for name in df.columns:
+            # Keep compact categoricals categorical, with the categories a
+            # whole-span build would have
+            if isinstance(existing_df[name].dtype, pd.CategoricalDtype):
+                df[name] = union_categoricals([existing_df[name], new_df[name]], sort_categories=True)
+        return df
+    
+    def iter_chunks(self, chunk_days: int = 10000) -> Iterator[pd.DataFrame]:
+        """
+        Generate the date dimension table one window of days at a time
         
-        # Add week calculations if enabled
-        if self.config.include_week_calculations:
-            df = df.sort_values(['shamsi_month_id', 'shamsi_date']).groupby('shamsi_month_id', group_keys=False).apply(self._assign_monthly_weeks)
-            df = df.groupby('shamsi_year_id', group_keys=False).apply(self._assign_yearly_weeks)
-            df['shamsi_week_title'] = df.apply(lambda row: f"هفته {int(row['week_num_in_year'])} سال {int(row['shamsi_year_id'])}", axis=1)
-            df['shamsi_week_of_year_id'] = df.apply(lambda row: f"{int(row['shamsi_year_id']):04d}_{int(row['week_num_in_year']):02d}", axis=1)
+        Only one chunk is held in memory, and the concatenated chunks equal
+        :meth:`generate`, including week numbers across chunk borders. In
+        compact mode every chunk shares the categories of the whole span,
+        which takes an extra pass over the chunks to collect.
+        
+        Args:
+            chunk_days: Maximum number of rows per chunk
             
-            # Gregorian week calculations
-            dates = pd.to_datetime(df['miladi_date'])
-            iso = dates.dt.isocalendar()
-            df['gregorian_week_id'] = iso['week'].astype(int)
-            df['gregorian_week_title'] = df.apply(lambda row: f"Week {row['gregorian_week_id']} {row['gregorian_year_id']}", axis=1)
-            df['gregorian_week_of_year_id'] = df.apply(lambda row: f"{int(row['gregorian_year_id']):04d}_{int(row['gregorian_week_id']):02d}", axis=1)
-            df['miladi_week_id'] = iso['week'].astype(int)
-            df['miladi_week_num_in_month'] = df.groupby(dates.dt.to_period('M').astype(str))['miladi_week_id'].transform(lambda s: s.rank(method='dense').astype(int))
+        Yields:
+            DataFrames of consecutive rows (a single empty one for an empty span)
         
-        return df
+        Raises:
+            ValueError: If chunk_days is less than 1, when called
+        
+        Example:
+            >>> for chunk in generator.iter_chunks(chunk_days=3650):
+            ...     load(chunk)
+        """
+        return self._iter_chunks(chunk_days, shared_categories=True)
     
-    def to_excel(self, filename: Optional[str] = None) -> str:
+    def _iter_chunks(self, chunk_days: int, shared_categories: bool) -> Iterator[pd.DataFrame]:
+        """
+        Generate chunks, optionally with the span's categories on every chunk
+        
+        Exports write chunks one by one and skip the extra pass that
+        collecting the shared categories needs. chunk_days is checked here,
+        before the generator starts, so a bad value fails at the call site.
+        """
+        if chunk_days < 1:
+            raise ValueError("chunk_days must be at least 1")
+        return self._generate_chunks(chunk_days, shared_categories)
+    
+    def _generate_chunks(self, chunk_days: int, shared_categories: bool) -> Iterator[pd.DataFrame]:
+        """Generator behind :meth:`_iter_chunks`"""
+        days, rows, bounds = self._span_days()
+        categories = None
+        if shared_categories and self.config.compact and len(days[0]) > chunk_days:
+            values: Dict[str, set] = {}
+            for frame in self._chunk_frames(days, rows, bounds, chunk_days):
+                for name in frame.columns:
+                    if isinstance(frame[name].dtype, pd.CategoricalDtype):
+                        values.setdefault(name, set()).update(frame[name].cat.categories)
+            categories = {name: sorted(names) for name, names in values.items()}
+        
+        yield from self._chunk_frames(days, rows, bounds, chunk_days, categories)
+    
+    def _chunk_frames(self, days: DayArrays, rows: slice, bounds: Tuple[int, int],
+                      chunk_days: int, categories: Optional[Dict[str, List[str]]] = None) -> Iterator[pd.DataFrame]:
+        """Build the span's frames of up to ``chunk_days`` rows"""
+        for start in range(0, max(len(days[0]), 1), chunk_days):
+            chunk = slice(start, start + chunk_days)
+            columns = self._build_columns(*_day_slice(days, chunk), bounds)
+            first_row = rows.start + start
+            index = pd.RangeIndex(first_row, first_row + len(columns['shamsi_date']))
+            yield self._to_frame(columns, index, self.config.compact, categories)
+    
+    def _is_cached(self) -> bool:
+        """Whether a table for the current config has already been generated"""
+        return self._cached_table is not None and self._cached_config == astuple(self.config)
+    
+    def _export_chunks(self, chunk_days: int) -> Iterator[pd.DataFrame]:
+        """Chunks to export: the whole table if it is cached, else generated windows"""
+        if self._is_cached() or self.config.cache:
+            return iter([self._table()])
+        return self._iter_chunks(chunk_days, shared_categories=False)
+    
+    def _table(self) -> pd.DataFrame:
+        """Generated table for the current config, rebuilt when the config changes"""
+        config = astuple(self.config)
+        if not self._is_cached():
+            self._cached_table = self._generate()
+            self._cached_config = config
+        return self._cached_table
+    
+    def refresh(self) -> None:
+        """Discard the cached table so the next call generates it again"""
+        self._cached_table = None
+        self._cached_config = None
+    
+    def generate(self) -> pd.DataFrame:
+        """
+        Generate the complete date dimension table
+        
+        The table is built once per configuration and reused by the export
+        methods; each call returns a copy that is safe to modify.
+        
+        Returns:
+            DataFrame with all date dimension columns
+        """
+        return self._table().copy()
+    
+    def to_excel(self, filename: Optional[str] = None, streaming: bool = False,
+                 engine: Optional[str] = None, chunk_days: int = 10000) -> str:
         """
         Export date dimension to Excel file
         
+        The streaming mode writes rows through a constant-memory writer
+        and starts a new sheet past Excel's row limit; unless the table has
+        already been generated, it is also generated chunk by chunk.
+        
         Args:
             filename: Output filename (optional)
+            streaming: Use the constant-memory writer
+            engine: Streaming engine, 'xlsxwriter' or 'openpyxl' (default: xlsxwriter if installed)
+            chunk_days: Maximum number of rows generated at a time when streaming
             
         Returns:
             Path to created Excel file
         """
-        df = self.generate()
-        
         if filename is None:
             filename = f"date_dimension_{self.config.start_year}_{self.config.end_year}.xlsx"
         
+        if streaming:
+            return write_excel(self._export_chunks(chunk_days), filename, 'Date_Dimension', engine=engine)
+        
+        df = self._table()
         with pd.ExcelWriter(filename, engine='openpyxl') as writer:
             df.to_excel(writer, sheet_name='Date_Dimension', index=False)
         
         return filename
     
-    def to_csv(self, filename: Optional[str] = None) -> str:
+    def to_csv(self, filename: Optional[str] = None, chunk_days: int = 10000) -> str:
         """
         Export date dimension to CSV file
         
+        Unless the table has already been generated, rows are written chunk
+        by chunk so the full table is never held in memory.
+        
         Args:
             filename: Output filename (optional)
+            chunk_days: Maximum number of rows generated at a time
             
         Returns:
             Path to created CSV file
         """
-        df = self.generate()
-        
         if filename is None:
             filename = f"date_dimension_{self.config.start_year}_{self.config.end_year}.csv"
         
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
+            for number, chunk in enumerate(self._export_chunks(chunk_days)):
+                chunk.to_csv(f, index=False, header=number == 0)
         
         return filename
     
+    def to_parquet(self, filename: Optional[str] = None, chunk_days: int = 10000,
+                   compression: Optional[str] = 'snappy') -> str:
+        """
+        Export date dimension to Parquet file (requires pyarrow)
+        
+        Title and event columns are dictionary-encoded. Unless the table has
+        already been generated, rows are written chunk by chunk.
+        
+        Args:
+            filename: Output filename (optional)
+            chunk_days: Maximum number of rows generated at a time
+            compression: Parquet compression codec
+            
+        Returns:
+            Path to created Parquet file
+        """
+        if filename is None:
+            filename = f"date_dimension_{self.config.start_year}_{self.config.end_year}.parquet"
+        
+        return write_parquet(self._export_chunks(chunk_days), filename, compression=compression)
+    
+    def to_arrow(self, filename: Optional[str] = None, compression: Optional[str] = None) -> str:
+        """
+        Export date dimension to Arrow IPC (Feather v2) file (requires pyarrow)
+        
+        Title and event columns are dictionary-encoded.
+        
+        Args:
+            filename: Output filename (optional)
+            compression: 'lz4', 'zstd', or None for pyarrow's default
+            
+        Returns:
+            Path to created Arrow file
+        """
+        if filename is None:
+            filename = f"date_dimension_{self.config.start_year}_{self.config.end_year}.arrow"
+        
+        return write_arrow(self._table(), filename, compression=compression)
+    
     def to_dataframe(self) -> pd.DataFrame:
         """
         Get date dimension as DataFrame
@@ -397,3 +808,16 @@ class DateDimensionGenerator:
             DataFrame with date dimension data
         """
         return self.generate()
+
+
+def _day_slice(days: DayArrays, rows: slice) -> DayArrays:
+    """Rows of each day array"""
+    jy, jm, jd, days_in_month = days
+    return jy[rows], jm[rows], jd[rows], days_in_month[rows]
+
+
+def _build_shard(task: Tuple[Type[DateDimensionGenerator], DateDimensionConfig, DayArrays, Tuple[int, int]]
+                 ) -> Dict[str, np.ndarray]:
+    """Build the columns of one year shard in a worker process"""
+    generator_class, config, days, bounds = task
+    return generator_class(config)._build_columns(*days, bounds)
@@ -0,0 +1,218 @@
+"""
+Export helpers for date dimension tables
+خروجی Parquet، Arrow و Excel برای جداول Date Dimension
+
+pyarrow is an optional dependency, installed with
+``pip install multi-calendar-dimension[parquet]``. Streaming Excel output
+uses xlsxwriter when it is installed and openpyxl otherwise.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+# Rows per worksheet allowed by Excel, including the header row
+EXCEL_MAX_ROWS = 1048576
+
+# Per-day date strings are unique on every row and gain nothing from a dictionary
+DATE_STRING_COLUMNS = frozenset({
+    'miladi_date', 'shamsi_date_title', 'gregorian_next_date', 'hijri_date_title'
+})
+
+
+def _require_pyarrow() -> None:
+    """Check that pyarrow is installed or explain how to install it"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Parquet and Arrow output require pyarrow. "
+            "Install it with: pip install multi-calendar-dimension[parquet]"
+        ) from e
+
+
+def _is_text(values: pd.Series) -> bool:
+    return (values.dtype == object or isinstance(values.dtype, pd.CategoricalDtype)
+            or pd.api.types.is_string_dtype(values.dtype))
+
+
+def to_arrow_table(df: pd.DataFrame) -> 'pyarrow.Table':
+    """
+    Convert a date dimension DataFrame to a pyarrow Table
+
+    Text columns are typed as strings even when every value is missing, and
+    all of them except the per-day date strings are dictionary-encoded, so
+    repetitive titles such as ``shamsi_month_title`` are stored once.
+
+    Args:
+        df: Date dimension table
+
+    Returns:
+        pyarrow.Table with the same columns
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+
+    arrays = []
+    for name in df.columns:
+        values = df[name]
+        if _is_text(values):
+            array = pa.array(values.to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+            if name not in DATE_STRING_COLUMNS:
+                array = array.dictionary_encode()
+        else:
+            array = pa.array(values.to_numpy())
+        arrays.append(array)
+
+    return pa.Table.from_arrays(arrays, names=[str(name) for name in df.columns])
+
+
+def write_parquet(chunks: Iterable[pd.DataFrame], filename: str,
+                  compression: Optional[str] = 'snappy') -> str:
+    """
+    Write date dimension DataFrames to a single Parquet file
+
+    Args:
+        chunks: DataFrames with identical columns, written in order
+        filename: Output filename
+        compression: Parquet compression codec
+
+    Returns:
+        Path to created Parquet file
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = to_arrow_table(chunk)
+            if writer is None:
+                writer = pq.ParquetWriter(filename, table.schema, compression=compression)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return filename
+
+
+def write_arrow(df: pd.DataFrame, filename: str, compression: Optional[str] = None) -> str:
+    """
+    Write a date dimension DataFrame to an Arrow IPC (Feather v2) file
+
+    Args:
+        df: Date dimension table
+        filename: Output filename
+        compression: 'lz4', 'zstd', or None for pyarrow's default
+
+    Returns:
+        Path to created Arrow file
+    """
+    _require_pyarrow()
+    import pyarrow.feather as feather
+
+    feather.write_feather(to_arrow_table(df), filename, compression=compression)
+    return filename
+
+
+def _cell_values(values: pd.Series) -> list:
+    """Native Python cell values of a column, with None for missing text"""
+    if _is_text(values):
+        # Categorical and string columns report missing values as NaN,
+        # which xlsxwriter refuses to write
+        cells: list = values.astype(object).where(values.notna(), None).tolist()
+    else:
+        cells = values.tolist()
+    return cells
+
+
+def _excel_engine(engine: Optional[str]) -> str:
+    """Resolve the streaming Excel engine, preferring xlsxwriter when installed"""
+    if engine is None:
+        try:
+            import xlsxwriter  # noqa: F401
+        except ImportError:
+            return 'openpyxl'
+        return 'xlsxwriter'
+    if engine not in ('xlsxwriter', 'openpyxl'):
+        raise ValueError(f"Unsupported Excel engine: {engine}")
+    return engine
+
+
+def write_excel(chunks: Iterable[pd.DataFrame], filename: str, sheet_name: str,
+                engine: Optional[str] = None, max_rows: int = EXCEL_MAX_ROWS) -> str:
+    """
+    Stream date dimension DataFrames into an xlsx file
+
+    Rows are written once and never kept by the writer (xlsxwriter in
+    constant_memory mode or an openpyxl write-only workbook). A new sheet,
+    named ``<sheet_name>_2``, ``<sheet_name>_3``..., is started with its own
+    header whenever a sheet reaches ``max_rows`` rows.
+
+    Args:
+        chunks: DataFrames with identical columns, written in order
+        filename: Output filename
+        sheet_name: Name of the first sheet
+        engine: 'xlsxwriter', 'openpyxl', or None to pick automatically
+        max_rows: Maximum rows per sheet, including the header
+
+    Returns:
+        Path to created Excel file
+    """
+    engine = _excel_engine(engine)
+    if max_rows < 2:
+        raise ValueError("max_rows must leave room for a header and a data row")
+
+    if engine == 'xlsxwriter':
+        import xlsxwriter
+        workbook = xlsxwriter.Workbook(filename, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
+        add_sheet = workbook.add_worksheet
+
+        def write_row(sheet: Any, row_number: int, values: List[Any]) -> None:
+            sheet.write_row(row_number, 0, values)
+
+        def close() -> None:
+            workbook.close()
+    else:
+        from openpyxl import Workbook
+        workbook = Workbook(write_only=True)
+        add_sheet = workbook.create_sheet
+
+        def write_row(sheet: Any, row_number: int, values: List[Any]) -> None:
+            sheet.append(values)
+
+        def close() -> None:
+            workbook.save(filename)
+
+    sheet = None
+    sheet_count = 0
+    sheet_rows = 0
+    header = None
+    for chunk in chunks:
+        header = [str(name) for name in chunk.columns]
+        # Column-wise conversion yields native Python values for the writers
+        for values in zip(*(_cell_values(chunk[name]) for name in chunk.columns)):
+            if sheet is None or sheet_rows == max_rows - 1:
+                sheet_count += 1
+                sheet = add_sheet(sheet_name if sheet_count == 1 else f"{sheet_name}_{sheet_count}")
+                write_row(sheet, 0, header)
+                sheet_rows = 0
+            sheet_rows += 1
+            write_row(sheet, sheet_rows, list(values))
+
+    if sheet is None:
+        sheet = add_sheet(sheet_name)
+        if header is not None:
+            write_row(sheet, 0, header)
+
+    close()
+    return filename
@@ -6,10 +6,11 @@ Date Range Generator for monthly date ranges
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Optional, Union, List, Tuple, Dict
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
 from enum import Enum
 
 from .dimension import DateDimensionGenerator, DateDimensionConfig
+from .export import write_arrow, write_excel, write_parquet
 from ..converters.jalali import jalali_to_gregorian, gregorian_to_jalali, is_leap_year_persian
 from ..converters.hijri import gregorian_to_hijri, hijri_to_gregorian
 from ..converters.cross import jalali_to_hijri, hijri_to_jalali
@@ -33,7 +34,11 @@ class DateRangeConfig:
     include_events: bool = True
     include_holidays: bool = True
     include_week_calculations: bool = True
-    output_format: str = 'dataframe'  # 'dataframe', 'excel', 'csv'
+    output_format: str = 'dataframe'  # 'dataframe', 'excel', 'csv', 'parquet', 'arrow'
+    workers: int = 1  # processes used to build year shards in parallel
+    compact: bool = False  # small integer, bool and categorical dtypes
+    cache: bool = False  # reuse tables stored in the on-disk cache
+    cache_dir: Optional[str] = None  # default: ~/.cache/multi_calendar_dimension
 
 
 class DateRangeGenerator:
@@ -53,6 +58,8 @@ class DateRangeGenerator:
         """
         self.config = config
         self._validate_config()
+        self._cached_table: Optional[pd.DataFrame] = None
+        self._cached_config: Optional[tuple] = None
     
     def _validate_config(self):
         """Validate the configuration parameters"""
@@ -145,69 +152,87 @@ class DateRangeGenerator:
         
         return months
     
-    def generate(self) -> pd.DataFrame:
-        """
-        Generate the date dimension table for the specified range
-        
-        Returns:
-            DataFrame with date dimension data for the specified range
-        """
+    def _generate(self) -> pd.DataFrame:
+        """Build the date dimension table for the configured range"""
         months = self._get_month_range()
         
         if not months:
             return pd.DataFrame()
         
-        # Get the full year range
-        start_year = months[0][0]
-        end_year = months[-1][0]
+        start_year, start_month = months[0]
+        end_year, end_month = months[-1]
         
-        # Create a temporary config for the full year range
+        # Only the requested months are built; the surrounding years bound
+        # the context of year-relative columns
         temp_config = DateDimensionConfig(
             start_year=start_year,
             end_year=end_year,
             include_events=self.config.include_events,
             include_holidays=self.config.include_holidays,
             include_week_calculations=self.config.include_week_calculations,
-            output_format=self.config.output_format
+            output_format=self.config.output_format,
+            start_date=start_year*10000 + start_month*100 + 1,
+            end_date=end_year*10000 + end_month*100 + 31,
+            workers=self.config.workers,
+            compact=self.config.compact,
+            cache=self.config.cache,
+            cache_dir=self.config.cache_dir
         )
         
-        # Generate the full table
         generator = DateDimensionGenerator(temp_config)
         df = generator.generate()
         
-        # Filter to only include the specified months
-        month_filters = []
-        for year, month in months:
-            month_filters.append(
-                (df['shamsi_year_id'] == year) & (df['shamsi_month_of_year_id'] == month)
-            )
+        return df
+    
+    def _table(self) -> pd.DataFrame:
+        """Generated table for the current config, rebuilt when the config changes"""
+        config = astuple(self.config)
+        if self._cached_table is None or self._cached_config != config:
+            self._validate_config()
+            self._cached_table = self._generate()
+            self._cached_config = config
+        return self._cached_table
+    
+    def refresh(self) -> None:
+        """Discard the cached table so the next call generates it again"""
+        self._cached_table = None
+        self._cached_config = None
+    
+    def generate(self) -> pd.DataFrame:
+        """
+        Generate the date dimension table for the specified range
         
-        if month_filters:
-            # Combine all filters with OR
-            combined_filter = month_filters[0]
-            for filter_condition in month_filters[1:]:
-                combined_filter = combined_filter | filter_condition
-            
-            df = df[combined_filter]
+        The table is built once per configuration and reused by the export
+        methods and :meth:`get_summary`; each call returns a copy that is
+        safe to modify.
         
-        return df
+        Returns:
+            DataFrame with date dimension data for the specified range
+        """
+        return self._table().copy()
     
-    def to_excel(self, filename: Optional[str] = None) -> str:
+    def to_excel(self, filename: Optional[str] = None, streaming: bool = False,
+                 engine: Optional[str] = None) -> str:
         """
         Export date range to Excel file
         
         Args:
             filename: Output filename (optional)
+            streaming: Use the constant-memory writer, splitting sheets past Excel's row limit
+            engine: Streaming engine, 'xlsxwriter' or 'openpyxl' (default: xlsxwriter if installed)
             
         Returns:
             Path to created Excel file
         """
-        df = self.generate()
+        df = self._table()
         
         if filename is None:
             calendar_name = self.config.calendar_type.value
             filename = f"date_range_{calendar_name}_{self.config.start_year}_{self.config.start_month}_{self.config.end_year}_{self.config.end_month}.xlsx"
         
+        if streaming:
+            return write_excel([df], filename, 'Date_Range', engine=engine)
+        
         with pd.ExcelWriter(filename, engine='openpyxl') as writer:
             df.to_excel(writer, sheet_name='Date_Range', index=False)
         
@@ -223,7 +248,7 @@ class DateRangeGenerator:
         Returns:
             Path to created CSV file
         """
-        df = self.generate()
+        df = self._table()
         
         if filename is None:
             calendar_name = self.config.calendar_type.value
@@ -233,6 +258,40 @@ class DateRangeGenerator:
         
         return filename
     
+    def to_parquet(self, filename: Optional[str] = None, compression: Optional[str] = 'snappy') -> str:
+        """
+        Export date range to Parquet file (requires pyarrow)
+        
+        Args:
+            filename: Output filename (optional)
+            compression: Parquet compression codec
+            
+        Returns:
+            Path to created Parquet file
+        """
+        if filename is None:
+            calendar_name = self.config.calendar_type.value
+            filename = f"date_range_{calendar_name}_{self.config.start_year}_{self.config.start_month}_{self.config.end_year}_{self.config.end_month}.parquet"
+        
+        return write_parquet([self._table()], filename, compression=compression)
+    
+    def to_arrow(self, filename: Optional[str] = None, compression: Optional[str] = None) -> str:
+        """
+        Export date range to Arrow IPC (Feather v2) file (requires pyarrow)
+        
+        Args:
+            filename: Output filename (optional)
+            compression: 'lz4', 'zstd', or None for pyarrow's default
+            
+        Returns:
+            Path to created Arrow file
+        """
+        if filename is None:
+            calendar_name = self.config.calendar_type.value
+            filename = f"date_range_{calendar_name}_{self.config.start_year}_{self.config.start_month}_{self.config.end_year}_{self.config.end_month}.arrow"
+        
+        return write_arrow(self._table(), filename, compression=compression)
+    
     def to_dataframe(self) -> pd.DataFrame:
         """
         Get date range as DataFrame
@@ -249,7 +308,7 @@ class DateRangeGenerator:
         Returns:
             Dictionary with summary statistics
         """
-        df = self.generate()
+        df = self._table()
         
         if df.empty:
             return {
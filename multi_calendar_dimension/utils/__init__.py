@@ -2,9 +2,16 @@
 Utility functions and helpers
 """
 
-from .holiday_checker import is_iranian_holiday, get_all_holidays_for_jalali_date
+from .holiday_checker import (
+    is_iranian_holiday, get_all_holidays_for_jalali_date, is_iranian_holiday_batch, HOLIDAY_TYPES
+)
+from .business_days import BusinessCalendar, get_business_calendar
 
 __all__ = [
     'is_iranian_holiday',
-    'get_all_holidays_for_jalali_date'
+    'get_all_holidays_for_jalali_date',
+    'is_iranian_holiday_batch',
+    'HOLIDAY_TYPES',
+    'BusinessCalendar',
+    'get_business_calendar'
 ]
@@ -0,0 +1,216 @@
+"""
+Iranian business-day calendar
+تقویم روزهای کاری ایران
+
+Working days are precomputed once over the conversion table window: a day
+is a holiday when it is a weekend day, a fixed Persian holiday or an
+official Hijri holiday. A cumulative count of working days then answers
+date offsets and day counts with a few array lookups instead of walking
+the calendar day by day.
+"""
+
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ..converters.table import ConversionTable, get_conversion_table
+from ..events.index import get_event_index
+
+
+# Day of week IDs (1 = Saturday ... 7 = Friday)
+FRIDAY = 7
+
+
+class BusinessCalendar:
+    """
+    Working days over the supported date window
+
+    Dates are (year, month, day) tuples in the calendar named by the
+    ``calendar`` argument ('jalali' by default); the ``*_array`` methods take
+    and return packed YYYYMMDD integers. Use :func:`get_business_calendar`
+    to share the default calendar.
+
+    Example:
+        >>> calendar = get_business_calendar()
+        >>> calendar.add_business_days((1403, 1, 1), 1)
+        (1403, 1, 5)
+        >>> calendar.business_days_between((1403, 1, 1), (1403, 2, 1))
+        19
+    """
+
+    def __init__(self, weekend: Iterable[int] = (FRIDAY,), extra_holidays: Iterable[int] = (),
+                 table: Optional[ConversionTable] = None):
+        """
+        Build the working day index
+
+        Args:
+            weekend: Day of week IDs that are never working days (default: Friday)
+            extra_holidays: Additional closures as packed Jalali YYYYMMDD dates
+            table: Conversion table to build on (default: the shared table)
+        """
+        self.table = table or get_conversion_table()
+        self.weekend = tuple(weekend)
+        event_index = get_event_index()
+
+        _, jm, jd = self.table.columns['jalali']
+        _, hm, hd = self.table.columns['hijri']
+        holiday = (
+            np.isin(self.table.day_of_week_ids, self.weekend)
+            | event_index.is_holiday('persian_holidays', jm, jd)
+            | event_index.is_holiday('hijri_official_holidays', hm, hd)
+        )
+        extra_holidays = list(extra_holidays)
+        if extra_holidays:
+            holiday[self.table.index_array('jalali', extra_holidays)] = True
+
+        self.is_working: np.ndarray = ~holiday
+        # Working days before each row; the extra last entry counts the whole window
+        self._cumulative = np.concatenate(([0], np.cumsum(self.is_working)))
+        self._working_rows = np.flatnonzero(self.is_working)
+        # Plain Python copies for scalar lookups
+        self._cumulative_list: List[int] = self._cumulative.tolist()
+        self._working_rows_list: List[int] = self._working_rows.tolist()
+
+    def _offset_rows(self, rows: ArrayLike, n: ArrayLike) -> np.ndarray:
+        """Rows of the nth working day after (or, for negative n, before) each row"""
+        row_array, offsets = np.broadcast_arrays(np.asarray(rows, dtype=np.int64), np.asarray(n, dtype=np.int64))
+        # Working days strictly before the row, and up to and including it
+        position: np.ndarray = np.where(offsets > 0, self._cumulative[row_array + 1] + offsets - 1,
+                                        self._cumulative[row_array] + offsets)
+        if np.any((position < 0) | (position >= len(self._working_rows))):
+            raise ValueError("Result falls outside the supported date window")
+        return self._working_rows.take(position)
+
+    def _offset_row(self, row: int, n: int) -> int:
+        """Scalar :meth:`_offset_rows`"""
+        position = self._cumulative_list[row + 1] + n - 1 if n > 0 else self._cumulative_list[row] + n
+        if not 0 <= position < len(self._working_rows_list):
+            raise ValueError("Result falls outside the supported date window")
+        return self._working_rows_list[position]
+
+    def _date(self, calendar: str, row: int) -> Tuple[int, int, int]:
+        return self.table._scalar_lookup(calendar)[2][row]
+
+    def _packed(self, calendar: str, rows: np.ndarray) -> np.ndarray:
+        y, m, d = self.table.columns[calendar]
+        packed: np.ndarray = y[rows].astype(np.int64)*10000 + m[rows].astype(np.int64)*100 + d[rows]
+        return packed
+
+    def is_business_day(self, date: Tuple[int, int, int], calendar: str = 'jalali') -> bool:
+        """
+        Check whether a date is a working day
+
+        Args:
+            date: (year, month, day) tuple
+            calendar: 'gregorian', 'jalali', or 'hijri'
+
+        Returns:
+            True if the date is a working day
+        """
+        return bool(self.is_working[self.table.index(calendar, *date)])
+
+    def add_business_days(self, date: Tuple[int, int, int], n: int,
+                          calendar: str = 'jalali') -> Tuple[int, int, int]:
+        """
+        Move a date by a number of working days
+
+        The date itself is never counted: ``n = 1`` is the first working day
+        after it, ``n = -1`` the last one before it, and ``n = 0`` returns the
+        date if it is a working day or else the next working day.
+
+        Args:
+            date: (year, month, day) tuple
+            n: Number of working days, negative to move backwards
+            calendar: 'gregorian', 'jalali', or 'hijri'
+
+        Returns:
+            Resulting (year, month, day) tuple in the same calendar
+
+        Raises:
+            ValueError: If the date or the result is outside the supported window
+        """
+        row = self.table.index(calendar, *date)
+        return self._date(calendar, self._offset_row(row, n))
+
+    def next_business_day(self, date: Tuple[int, int, int], calendar: str = 'jalali') -> Tuple[int, int, int]:
+        """Get the first working day after a date"""
+        return self.add_business_days(date, 1, calendar)
+
+    def previous_business_day(self, date: Tuple[int, int, int], calendar: str = 'jalali') -> Tuple[int, int, int]:
+        """Get the last working day before a date"""
+        return self.add_business_days(date, -1, calendar)
+
+    def business_days_between(self, start: Tuple[int, int, int], end: Tuple[int, int, int],
+                              calendar: str = 'jalali') -> int:
+        """
+        Count working days from ``start`` (inclusive) to ``end`` (exclusive)
+
+        Args:
+            start: (year, month, day) tuple
+            end: (year, month, day) tuple
+            calendar: 'gregorian', 'jalali', or 'hijri'
+
+        Returns:
+            Number of working days, negative if ``end`` is before ``start``
+        """
+        start_row = self.table.index(calendar, *start)
+        end_row = self.table.index(calendar, *end)
+        return self._cumulative_list[end_row] - self._cumulative_list[start_row]
+
+    def is_business_day_array(self, dates: ArrayLike, calendar: str = 'jalali') -> np.ndarray:
+        """
+        Vectorized :meth:`is_business_day`
+
+        Args:
+            dates: Packed YYYYMMDD dates
+            calendar: 'gregorian', 'jalali', or 'hijri'
+
+        Returns:
+            Boolean array
+        """
+        return self.is_working.take(self.table.index_array(calendar, dates))
+
+    def add_business_days_array(self, dates: ArrayLike, n: ArrayLike, calendar: str = 'jalali') -> np.ndarray:
+        """
+        Vectorized :meth:`add_business_days`
+
+        Args:
+            dates: Packed YYYYMMDD dates
+            n: Number of working days, a scalar or one per date
+            calendar: 'gregorian', 'jalali', or 'hijri'
+
+        Returns:
+            int64 array of packed YYYYMMDD dates
+        """
+        rows = self.table.index_array(calendar, dates)
+        return self._packed(calendar, self._offset_rows(rows, n))
+
+    def business_days_between_array(self, start: ArrayLike, end: ArrayLike,
+                                    calendar: str = 'jalali') -> np.ndarray:
+        """
+        Vectorized :meth:`business_days_between`
+
+        Args:
+            start: Packed YYYYMMDD dates (inclusive)
+            end: Packed YYYYMMDD dates (exclusive)
+            calendar: 'gregorian', 'jalali', or 'hijri'
+
+        Returns:
+            int64 array of working day counts
+        """
+        start_rows = self.table.index_array(calendar, start)
+        end_rows = self.table.index_array(calendar, end)
+        return self._cumulative.take(end_rows) - self._cumulative.take(start_rows)
+
+
+@lru_cache(maxsize=None)
+def get_business_calendar() -> BusinessCalendar:
+    """
+    Get the shared default :class:`BusinessCalendar`, building it on first use
+
+    Returns:
+        The process-wide business calendar (Friday weekend, no extra holidays)
+    """
+    return BusinessCalendar()
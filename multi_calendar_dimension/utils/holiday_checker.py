@@ -2,10 +2,28 @@
 Utility functions for checking holidays across different calendars
 """
 
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
 from ..converters.jalali import jalali_to_gregorian
 from ..converters.hijri import gregorian_to_hijri
+from ..converters.jdn import _date_arrays, jalali_to_jdn_array, jdn_to_hijri_array, MCJDN_OFFSET
+from ..converters.ummalqura_data import UMMALQURA_ARRAY
 from ..events import persian_holidays, hijri_official_holidays, gregorian_holidays
+from ..events.index import get_event_index
+
+
+# Holiday type codes returned by is_iranian_holiday_batch; HOLIDAY_TYPES[code] is the type name
+HOLIDAY_NONE = 0
+HOLIDAY_PERSIAN = 1
+HOLIDAY_HIJRI = 2
+HOLIDAY_FRIDAY = 3
+HOLIDAY_TYPES = (None, 'persian', 'hijri', 'friday')
+
+# JDN modulo 7 of a Friday
+FRIDAY = 4
 
 
 def is_iranian_holiday(jalali_year: int, jalali_month: int, jalali_day: int) -> Dict[str, Any]:
@@ -101,3 +119,46 @@ def get_all_holidays_for_jalali_date(jalali_year: int, jalali_month: int, jalali
     
     return result
 
+
+def is_iranian_holiday_batch(jalali_year: ArrayLike, jalali_month: Optional[ArrayLike] = None,
+                             jalali_day: Optional[ArrayLike] = None,
+                             include_friday: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized :func:`is_iranian_holiday` for many Jalali dates.
+    
+    Persian holidays take precedence over Hijri holidays, which take
+    precedence over Fridays. Dates outside the Umm al-Qura table are only
+    checked against Persian holidays and Fridays.
+    
+    Args:
+        jalali_year: Persian years, or packed YYYYMMDD dates (array, list or
+            pandas Series) when month and day are omitted
+        jalali_month: Persian months (1-12)
+        jalali_day: Persian days (1-31)
+        include_friday: Whether Fridays count as holidays
+        
+    Returns:
+        Tuple of (is_holiday bool array, holiday type code int8 array), where
+        ``HOLIDAY_TYPES[code]`` is 'persian', 'hijri', 'friday' or None
+        
+    Example:
+        >>> is_iranian_holiday_batch([14030101, 14030102, 14030110])
+        (array([ True,  True,  True]), array([1, 1, 3], dtype=int8))
+    """
+    jy, jm, jd = _date_arrays(jalali_year, jalali_month, jalali_day)
+    jdn = jalali_to_jdn_array(jy, jm, jd)
+    event_index = get_event_index()
+    
+    codes = np.zeros(jdn.shape, dtype=np.int8)
+    if include_friday:
+        codes[jdn % 7 == FRIDAY] = HOLIDAY_FRIDAY
+    
+    mcjdn = jdn - MCJDN_OFFSET
+    in_table = (mcjdn >= UMMALQURA_ARRAY[0]) & (mcjdn < UMMALQURA_ARRAY[-1])
+    _, hm, hd = jdn_to_hijri_array(jdn[in_table])
+    hijri = np.zeros(jdn.shape, dtype=bool)
+    hijri[in_table] = event_index.is_holiday('hijri_official_holidays', hm, hd)
+    codes[hijri] = HOLIDAY_HIJRI
+    
+    codes[event_index.is_holiday('persian_holidays', jm, jd)] = HOLIDAY_PERSIAN
+    return codes != HOLIDAY_NONE, codes
@@ -56,6 +56,12 @@ setup(
             "flake8>=5.0.0",
             "mypy>=1.0.0",
         ],
+        "parquet": [
+            "pyarrow>=10.0.0",
+        ],
+        "excel": [
+            "xlsxwriter>=3.0.0",
+        ],
         "docs": [
             "sphinx>=5.0.0",
             "sphinx-rtd-theme>=1.0.0",
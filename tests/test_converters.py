@@ -4,14 +4,26 @@ Test suite for converters module
 """
 
 import pytest
+import numpy as np
+from datetime import date, timedelta
 from multi_calendar_dimension.converters.jalali import (
-    jalali_to_gregorian, gregorian_to_jalali, is_leap_year_persian
+    jalali_to_gregorian, gregorian_to_jalali, is_leap_year_persian,
+    jalali_to_gregorian_array, gregorian_to_jalali_array
 )
 from multi_calendar_dimension.converters.hijri import (
-    gregorian_to_hijri, hijri_to_gregorian, is_hijri_leap
+    gregorian_to_hijri, hijri_to_gregorian, is_hijri_leap,
+    gregorian_to_hijri_array, hijri_to_gregorian_array
+)
+from multi_calendar_dimension.converters.ummalqura_data import (
+    UMMALQURA_DATA, get_index, get_index_array
 )
 from multi_calendar_dimension.converters.cross import (
-    jalali_to_hijri, hijri_to_jalali
+    jalali_to_hijri, hijri_to_jalali, jalali_to_hijri_array, hijri_to_jalali_array
+)
+from multi_calendar_dimension.converters.table import ConversionTable, get_conversion_table
+from multi_calendar_dimension.converters.jdn import (
+    gregorian_to_jdn, jdn_to_gregorian, jalali_to_jdn, jdn_to_jalali, hijri_to_jdn, jdn_to_hijri,
+    jdn_to_gregorian_array, jdn_to_jalali_array, jdn_to_hijri_array
 )
 
 
@@ -63,6 +75,56 @@ class TestJalaliConverters:
         assert gm == 4
         assert gd == 20
 
+    def test_jalali_to_gregorian_20th_century(self):
+        """Test conversion of dates before 2000"""
+        # 22 Bahman 1357
+        assert jalali_to_gregorian(1357, 11, 22) == (1979, 2, 11)
+        assert jalali_to_gregorian(1329, 1, 1) == (1950, 3, 21)
+
+
+class TestVectorizedJalaliConverters:
+    """Test array-based Jalali conversion functions"""
+    
+    @staticmethod
+    def _gregorian_days(start, end):
+        days = [start + timedelta(days=i) for i in range((end - start).days)]
+        return (np.array([d.year for d in days]),
+                np.array([d.month for d in days]),
+                np.array([d.day for d in days]))
+    
+    def test_gregorian_to_jalali_array_matches_scalar(self):
+        """Test that the array version agrees with the scalar version"""
+        gy, gm, gd = self._gregorian_days(date(1900, 1, 1), date(2100, 1, 1))
+        jy, jm, jd = gregorian_to_jalali_array(gy, gm, gd)
+        
+        expected = [gregorian_to_jalali(*g) for g in zip(gy.tolist(), gm.tolist(), gd.tolist())]
+        assert list(zip(jy.tolist(), jm.tolist(), jd.tolist())) == expected
+    
+    def test_jalali_to_gregorian_array_roundtrip(self):
+        """Test roundtrip conversion over two centuries"""
+        gy, gm, gd = self._gregorian_days(date(1900, 1, 1), date(2100, 1, 1))
+        ry, rm, rd = jalali_to_gregorian_array(*gregorian_to_jalali_array(gy, gm, gd))
+        assert np.array_equal(ry, gy)
+        assert np.array_equal(rm, gm)
+        assert np.array_equal(rd, gd)
+    
+    def test_packed_dates(self):
+        """Test packed YYYYMMDD input"""
+        gy, gm, gd = jalali_to_gregorian_array(np.array([14030101, 14031230, 13571122]))
+        assert gy.tolist() == [2024, 2025, 1979]
+        assert gm.tolist() == [3, 3, 2]
+        assert gd.tolist() == [20, 20, 11]
+        
+        jy, jm, jd = gregorian_to_jalali_array([20240320, 20250320])
+        assert jy.tolist() == [1403, 1403]
+        assert jm.tolist() == [1, 12]
+        assert jd.tolist() == [1, 30]
+    
+    def test_missing_components(self):
+        """Test that a partial set of components is rejected"""
+        with pytest.raises(ValueError):
+            jalali_to_gregorian_array(np.array([1403]), np.array([1]))
+
 
 class TestHijriConverters:
     """Test Hijri calendar conversion functions"""
@@ -101,6 +163,65 @@ class TestHijriConverters:
         assert 1 <= hd <= 30
 
 
+class TestVectorizedHijriConverters:
+    """Test array-based Hijri conversion functions"""
+    
+    def test_gregorian_to_hijri_array_matches_scalar(self):
+        """Test that the array version agrees with the scalar version"""
+        days = [date(1940, 1, 1) + timedelta(days=i) for i in range(0, 50000, 3)]
+        gy = np.array([d.year for d in days])
+        gm = np.array([d.month for d in days])
+        gd = np.array([d.day for d in days])
+        hy, hm, hd = gregorian_to_hijri_array(gy, gm, gd)
+        
+        expected = [gregorian_to_hijri(d.year, d.month, d.day) for d in days]
+        assert list(zip(hy.tolist(), hm.tolist(), hd.tolist())) == expected
+    
+    def test_hijri_to_gregorian_array_matches_scalar(self):
+        """Test conversion of the first day of every Hijri month"""
+        hy = np.repeat(np.arange(1360, 1500), 12)
+        hm = np.tile(np.arange(1, 13), 140)
+        gy, gm, gd = hijri_to_gregorian_array(hy, hm, np.ones_like(hy))
+        
+        expected = [hijri_to_gregorian(y, m, 1) for y, m in zip(hy.tolist(), hm.tolist())]
+        assert list(zip(gy.tolist(), gm.tolist(), gd.tolist())) == expected
+    
+    def test_packed_dates(self):
+        """Test packed YYYYMMDD input"""
+        hy, hm, hd = gregorian_to_hijri_array(np.array([20230719]))
+        assert (hy[0], hm[0], hd[0]) == (1445, 1, 1)
+        
+        gy, gm, gd = hijri_to_gregorian_array(np.array([14450101]))
+        assert (gy[0], gm[0], gd[0]) == (2023, 7, 19)
+    
+    def test_out_of_range(self):
+        """Test dates outside the Umm al-Qura table"""
+        with pytest.raises(ValueError):
+            gregorian_to_hijri_array(np.array([1900]), np.array([1]), np.array([1]))
+        with pytest.raises(ValueError):
+            hijri_to_gregorian_array(np.array([1600]), np.array([1]), np.array([1]))
+
+
+class TestUmmAlQuraIndex:
+    """Test Umm al-Qura table lookups"""
+    
+    def test_get_index_matches_linear_scan(self):
+        """Test that the binary search finds the first greater entry"""
+        for mcjdn in range(UMMALQURA_DATA[0] - 5, UMMALQURA_DATA[0] + 400):
+            expected = next(i for i, v in enumerate(UMMALQURA_DATA) if v > mcjdn)
+            assert get_index(mcjdn) == expected
+    
+    def test_get_index_past_end(self):
+        """Test lookups past the end of the table"""
+        assert get_index(UMMALQURA_DATA[-1]) is None
+        assert get_index_array(np.array([UMMALQURA_DATA[-1]]))[0] == len(UMMALQURA_DATA)
+    
+    def test_get_index_array_matches_scalar(self):
+        """Test that batch lookups agree with scalar lookups"""
+        mcjdn = np.arange(UMMALQURA_DATA[0], UMMALQURA_DATA[-1], 7)
+        assert get_index_array(mcjdn).tolist() == [get_index(int(m)) for m in mcjdn]
+
+
 class TestCrossConverters:
     """Test cross-calendar conversion functions"""
     
@@ -136,6 +257,107 @@ class TestCrossConverters:
         assert abs(jm - original_jalali[1]) <= 1
         assert abs(jd - original_jalali[2]) <= 1
 
+    def test_cross_conversion_roundtrip(self):
+        """Test exact Jalali <-> Hijri roundtrips"""
+        assert jalali_to_hijri(1403, 1, 1) == gregorian_to_hijri(2024, 3, 20)
+        assert hijri_to_jalali(*jalali_to_hijri(1403, 1, 1)) == (1403, 1, 1)
+    
+    def test_cross_conversion_arrays(self):
+        """Test array cross conversions against the scalar versions"""
+        jy, jm, jd = jdn_to_jalali_array(np.arange(2430000, 2470000, 11))
+        hy, hm, hd = jalali_to_hijri_array(jy, jm, jd)
+        expected = [jalali_to_hijri(*j) for j in zip(jy.tolist(), jm.tolist(), jd.tolist())]
+        assert list(zip(hy.tolist(), hm.tolist(), hd.tolist())) == expected
+        
+        ry, rm, rd = hijri_to_jalali_array(hy, hm, hd)
+        assert np.array_equal(ry, jy) and np.array_equal(rm, jm) and np.array_equal(rd, jd)
+
+
+class TestJulianDayNumbers:
+    """Test the integer day-number kernel"""
+    
+    def test_gregorian_matches_ordinal(self):
+        """Test Gregorian day numbers against datetime ordinals"""
+        for d in [date(1600, 1, 1), date(1937, 3, 14), date(2000, 2, 29), date(2024, 3, 20)]:
+            jdn = gregorian_to_jdn(d.year, d.month, d.day)
+            assert jdn == d.toordinal() + 1721425
+            assert jdn_to_gregorian(jdn) == (d.year, d.month, d.day)
+    
+    def test_known_values(self):
+        """Test the same day in all calendars"""
+        assert gregorian_to_jdn(2024, 3, 20) == 2460390
+        assert jalali_to_jdn(1403, 1, 1) == 2460390
+        assert jdn_to_jalali(2460390) == (1403, 1, 1)
+        assert hijri_to_jdn(*jdn_to_hijri(2460390)) == 2460390
+    
+    def test_arrays_match_scalars(self):
+        """Test that array transforms agree with scalar transforms"""
+        jdn = np.arange(2428700, 2479000, 5)
+        for array_fn, scalar_fn in [(jdn_to_gregorian_array, jdn_to_gregorian),
+                                    (jdn_to_jalali_array, jdn_to_jalali),
+                                    (jdn_to_hijri_array, jdn_to_hijri)]:
+            y, m, d = array_fn(jdn)
+            assert list(zip(y.tolist(), m.tolist(), d.tolist())) == [scalar_fn(int(j)) for j in jdn]
+    
+    def test_date_arithmetic(self):
+        """Test that day numbers make date differences exact"""
+        assert jalali_to_jdn(1404, 1, 1) - jalali_to_jdn(1403, 1, 1) == 366
+        assert jdn_to_jalali(jalali_to_jdn(1403, 12, 30) + 1) == (1404, 1, 1)
+
+
+class TestConversionTable:
+    """Test the precomputed conversion table"""
+    
+    def test_shared_instance(self):
+        """Test that the table is built once and shared"""
+        assert get_conversion_table() is get_conversion_table()
+        assert isinstance(get_conversion_table(), ConversionTable)
+    
+    def test_scalar_lookups_match_converters(self):
+        """Test table lookups against the arithmetic converters"""
+        table = get_conversion_table()
+        assert table.gregorian_to_jalali(2024, 3, 20) == gregorian_to_jalali(2024, 3, 20)
+        assert table.jalali_to_gregorian(1357, 11, 22) == jalali_to_gregorian(1357, 11, 22)
+        assert table.gregorian_to_hijri(2023, 7, 19) == gregorian_to_hijri(2023, 7, 19)
+        assert table.hijri_to_gregorian(1445, 9, 10) == hijri_to_gregorian(1445, 9, 10)
+        assert table.jalali_to_hijri(1403, 1, 1) == jalali_to_hijri(1403, 1, 1)
+        assert table.hijri_to_jalali(1445, 9, 10) == hijri_to_jalali(1445, 9, 10)
+    
+    def test_every_row(self):
+        """Test that every day in the table round-trips through its own index"""
+        table = get_conversion_table()
+        jdn = np.arange(table.first_jdn, table.last_jdn + 1)
+        for calendar, from_jdn in [('gregorian', jdn_to_gregorian_array),
+                                   ('jalali', jdn_to_jalali_array),
+                                   ('hijri', jdn_to_hijri_array)]:
+            y, m, d = from_jdn(jdn)
+            assert np.array_equal(table.index_array(calendar, y, m, d), np.arange(table.size))
+    
+    def test_batch_conversion(self):
+        """Test batch conversion by fancy indexing"""
+        table = get_conversion_table()
+        gy, gm, gd = table.convert_array('jalali', 'gregorian', np.array([14030101, 13571122]))
+        assert gy.tolist() == [2024, 1979]
+        assert gm.tolist() == [3, 2]
+        assert gd.tolist() == [20, 11]
+    
+    def test_day_of_week(self):
+        """Test weekday IDs (1 = Saturday ... 7 = Friday)"""
+        table = get_conversion_table()
+        assert table.day_of_week_id('gregorian', 2024, 3, 16) == 1
+        assert table.day_of_week_id('jalali', 1403, 1, 3) == 7
+    
+    def test_invalid_dates(self):
+        """Test invalid and out-of-range dates"""
+        table = get_conversion_table()
+        for date_parts in [(1403, 1, 32), (1403, 13, 1), (1403, 2, 0), (1200, 1, 1)]:
+            with pytest.raises(ValueError):
+                table.jalali_to_gregorian(*date_parts)
+        with pytest.raises(ValueError):
+            table.convert_array('jalali', 'gregorian', np.array([1403, 1403]), np.array([1, 1]), np.array([1, 32]))
+        with pytest.raises(ValueError):
+            table.convert('julian', 'jalali', 2024, 1, 1)
+
 
 class TestConverterEdgeCases:
     """Test edge cases and error conditions"""
@@ -3,8 +3,11 @@ Test suite for current date module
 تست‌های ماژول current date
 """
 
+import dataclasses
+import pickle
+import sys
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from multi_calendar_dimension.current.now import CurrentDate, DateInfo, CurrentDateInfo
 
 
@@ -48,6 +51,70 @@ class TestCurrentDate:
         assert isinstance(today.jalali, DateInfo)
         assert isinstance(today.hijri, DateInfo)
     
+    def test_now_cached_per_day(self, monkeypatch):
+        """Test that now() reuses today's information until the day ends"""
+        monkeypatch.setattr(CurrentDate, '_today_cache', {})
+        clock_time = [1710880200.0 - 60]  # 2024-03-19 23:59 in Tehran
+        current = CurrentDate(clock=lambda: clock_time[0])
+        
+        first = current.now()
+        second = CurrentDate(clock=lambda: clock_time[0]).now()
+        assert second.jalali is first.jalali
+        assert (first.jalali.year, first.jalali.month, first.jalali.day) == (1402, 12, 29)
+        
+        clock_time[0] += 120
+        rolled = current.now()
+        assert (rolled.jalali.year, rolled.jalali.month, rolled.jalali.day) == (1403, 1, 1)
+        assert rolled.timestamp.timestamp() == clock_time[0]
+        assert current.now(language='en').jalali is not rolled.jalali
+    
+    def test_now_cache_cannot_be_corrupted(self, monkeypatch):
+        """Test that callers cannot modify the shared per-day information"""
+        monkeypatch.setattr(CurrentDate, '_today_cache', {})
+        clock = lambda: 1710880200.0  # 1403/01/01 in Tehran
+        today = CurrentDate(clock=clock).now()
+        events = today.jalali.events
+        assert events
+        
+        with pytest.raises(AttributeError):
+            today.jalali.events.append("changed")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            today.jalali.events = []
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            today.jalali = None
+        
+        assert CurrentDate(clock=clock).now().jalali.events == events
+    
+    def test_now_time_zone(self):
+        """Test that the current day follows the time zone"""
+        clock = lambda: 1710880200.0  # 2024-03-20 00:00 in Tehran, 2024-03-19 20:30 UTC
+        tehran = CurrentDate(clock=clock).now()
+        utc = CurrentDate(tz='UTC', clock=clock).now()
+        assert tehran.jalali.date_string == "1403/01/01"
+        assert utc.jalali.date_string == "1402/12/29"
+        assert tehran.timestamp.utcoffset() == timedelta(hours=3, minutes=30)
+        assert tehran.timestamp == utc.timestamp
+        
+        with pytest.raises(ValueError):
+            CurrentDate(tz='Not/AZone')
+    
+    def test_time_zone_fallback(self, monkeypatch):
+        """Test that Asia/Tehran falls back to fixed +03:30 without a tz database"""
+        from multi_calendar_dimension.current.now import TEHRAN_STANDARD_TIME, resolve_timezone
+        zoneinfo = pytest.importorskip('zoneinfo')
+        
+        def missing(key):
+            raise zoneinfo.ZoneInfoNotFoundError(key)
+        
+        monkeypatch.setattr(zoneinfo, 'ZoneInfo', missing)
+        assert resolve_timezone() is TEHRAN_STANDARD_TIME
+        assert CurrentDate(clock=lambda: 1710880200.0).now().jalali.date_string == "1403/01/01"
+        with pytest.raises(ValueError):
+            resolve_timezone('UTC')
+        
+        monkeypatch.setitem(sys.modules, 'zoneinfo', None)
+        assert resolve_timezone('Asia/Tehran') is TEHRAN_STANDARD_TIME
+    
     def test_get_date_info_jalali(self):
         """Test get_date_info() with Jalali calendar"""
         current = CurrentDate()
@@ -61,7 +128,7 @@ class TestCurrentDate:
         assert isinstance(date_info.is_leap_year, bool)
         assert isinstance(date_info.is_holiday, bool)
         assert isinstance(date_info.is_weekend, bool)
-        assert isinstance(date_info.events, list)
+        assert isinstance(date_info.events, tuple)
     
     def test_get_date_info_gregorian(self):
         """Test get_date_info() with Gregorian calendar"""
@@ -76,7 +143,7 @@ class TestCurrentDate:
         assert isinstance(date_info.is_leap_year, bool)
         assert isinstance(date_info.is_holiday, bool)
         assert isinstance(date_info.is_weekend, bool)
-        assert isinstance(date_info.events, list)
+        assert isinstance(date_info.events, tuple)
     
     def test_get_date_info_hijri(self):
         """Test get_date_info() with Hijri calendar"""
@@ -90,7 +157,7 @@ class TestCurrentDate:
         assert isinstance(date_info.is_leap_year, bool)
         assert isinstance(date_info.is_holiday, bool)
         assert isinstance(date_info.is_weekend, bool)
-        assert isinstance(date_info.events, list)
+        assert isinstance(date_info.events, tuple)
     
     def test_format_date_full(self):
         """Test format_date() with full format"""
@@ -185,9 +252,41 @@ class TestCurrentDate:
         
         # Test Persian New Year (should have event)
         date_info = current.get_date_info(1403, 1, 1, 'jalali', 'fa')
-        assert isinstance(date_info.events, list)
+        assert isinstance(date_info.events, tuple)
         # Note: The event might be None or empty depending on the data
     
+    def test_get_date_info_batch(self):
+        """Test that get_date_info_batch() matches get_date_info()"""
+        current = CurrentDate()
+        dates = [(1403, 1, day) for day in range(1, 15)] + [(1403, 12, 30), (1404, 7, 15)]
+        years, months, days = zip(*dates)
+        batch = current.get_date_info_batch(years, months, days, 'jalali', 'fa')
+        
+        assert len(batch) == len(dates)
+        for i, (year, month, day) in enumerate(dates):
+            assert batch[i] == current.get_date_info(year, month, day, 'jalali', 'fa')
+        
+        frame = batch.to_frame()
+        assert len(frame) == len(dates)
+        assert frame['month_name'].iloc[0] == "فروردین"
+        assert frame['is_holiday'].tolist() == batch.is_holiday.tolist()
+        assert frame['event'].isna().tolist() == (batch.event_codes < 0).tolist()
+    
+    def test_get_date_info_batch_calendars(self):
+        """Test get_date_info_batch() with packed Gregorian and Hijri dates"""
+        current = CurrentDate()
+        batch = current.get_date_info_batch([20240101, 20241225], calendar_type='gregorian', language='en')
+        assert batch[1] == current.get_date_info(2024, 12, 25, 'gregorian', 'en')
+        assert batch.is_leap_year.all()
+        
+        batch = current.get_date_info_batch([14450110], calendar_type='hijri')
+        assert batch[0] == current.get_date_info(1445, 1, 10, 'hijri', 'fa')
+        
+        with pytest.raises(ValueError):
+            current.get_date_info_batch([14031232], calendar_type='jalali')
+        with pytest.raises(ValueError):
+            current.get_date_info_batch([14030101], calendar_type='invalid')
+    
     def test_invalid_calendar_type(self):
         """Test invalid calendar type"""
         current = CurrentDate()
@@ -237,7 +336,23 @@ class TestDateInfo:
         assert date_info.is_leap_year == True
         assert date_info.is_holiday == True
         assert date_info.is_weekend == False
-        assert date_info.events == ["عید نوروز"]
+        assert date_info.events == ("عید نوروز",)
+    
+    def test_date_info_immutable(self):
+        """Test that DateInfo is frozen, hashable, slotted and picklable"""
+        current = CurrentDate()
+        date_info = current.get_date_info(1403, 1, 1, 'jalali', 'fa')
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            date_info.year = 1404
+        assert not hasattr(date_info, '__dict__')
+        assert {date_info: 1}[current.get_date_info(1403, 1, 1, 'jalali', 'fa')] == 1
+        assert pickle.loads(pickle.dumps(date_info)) == date_info
+        
+        fixed = CurrentDate(clock=lambda: 1710880200.0)
+        today = fixed.now()
+        assert hash(today) == hash(fixed.now())
+        assert pickle.loads(pickle.dumps(today)) == today
 
 
 class TestCurrentDateInfo:
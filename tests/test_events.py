@@ -7,8 +7,11 @@ import pytest
 from multi_calendar_dimension.events import (
     persian_events, persian_holidays, hijri_official_holidays,
     gregorian_events_en, gregorian_events_fa, gregorian_holidays,
-    hijri_events, hijri_events_en, hijri_holidays
+    hijri_events, hijri_events_en, hijri_holidays,
+    EventIndex, get_event_index,
+    easter_date, easter_dates, get_variable_holidays, variable_holiday_keys
 )
+from multi_calendar_dimension.events.index import EVENT_TABLES, HOLIDAY_TABLES
 
 
 class TestPersianEvents:
@@ -304,5 +307,69 @@ class TestEventsConsistency:
             assert 1 <= day <= 30
 
 
+class TestEventIndex:
+    """Test the compiled event and holiday index"""
+    
+    def test_event_names_match_tables(self):
+        """Test that every (month, day) resolves to the table's text or None"""
+        index = get_event_index()
+        months = [month for month in range(1, 13) for day in range(1, 32)]
+        days = [day for month in range(1, 13) for day in range(1, 32)]
+        
+        for name, table in EVENT_TABLES.items():
+            expected = [table.get((month, day)) for month, day in zip(months, days)]
+            assert index.event_names(name, months, days).tolist() == expected
+        
+        for name, table in HOLIDAY_TABLES.items():
+            expected = [table.get((month, day), 0) != 0 for month, day in zip(months, days)]
+            assert index.is_holiday(name, months, days).tolist() == expected
+    
+    def test_string_pool(self):
+        """Test that event texts are stored once"""
+        index = get_event_index()
+        texts = set()
+        for table in EVENT_TABLES.values():
+            texts.update(table.values())
+        
+        assert len(index.pool) == len(texts) + 1
+        assert index.pool[-1] is None
+        assert index.event_codes('persian_events', [1], [5]).tolist() == [-1]
+    
+    def test_shared_instance(self):
+        """Test that the index is compiled once"""
+        assert get_event_index() is get_event_index()
+        assert isinstance(get_event_index(), EventIndex)
+
+
+class TestVariableHolidays:
+    """Test the variable-date holiday rules"""
+    
+    def test_known_dates(self):
+        """Test rules against known holiday dates"""
+        holidays_2024 = get_variable_holidays(2024)
+        assert (1, 15) in holidays_2024  # Martin Luther King Jr. Day
+        assert (5, 27) in holidays_2024  # Memorial Day and Spring Bank Holiday
+        assert (11, 28) in holidays_2024  # Thanksgiving
+        assert (3, 29) in holidays_2024  # Good Friday
+        assert (4, 1) in holidays_2024  # Easter Monday
+        assert len(holidays_2024) == 10
+        assert isinstance(holidays_2024, frozenset)
+    
+    def test_easter(self):
+        """Test scalar and vectorized Easter"""
+        assert easter_date(2024) == (3, 31)
+        assert easter_date(2025) == (4, 20)
+        months, days = easter_dates([2024, 2025, 2038])
+        assert months.tolist() == [3, 4, 4]
+        assert days.tolist() == [31, 20, 25]
+    
+    def test_keys_match_sets(self):
+        """Test that vectorized keys match the per-year sets"""
+        years = list(range(1990, 2031))
+        keys = variable_holiday_keys(years)
+        for year, year_keys in zip(years, keys.tolist()):
+            assert {(key // 32, key % 32) for key in year_keys} == get_variable_holidays(year)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
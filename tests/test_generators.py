@@ -3,9 +3,12 @@ Test suite for generators module
 تست‌های ماژول generators
 """
 
+import os
+import shutil
+
 import pytest
 import pandas as pd
-from multi_calendar_dimension.generator.dimension import DateDimensionGenerator, DateDimensionConfig
+from multi_calendar_dimension.generator.dimension import DateDimensionGenerator, DateDimensionConfig, COMPACT_DTYPES
 from multi_calendar_dimension.generator.range_generator import DateRangeGenerator, DateRangeConfig, CalendarType
 
 
@@ -99,6 +102,47 @@ class TestDateDimensionGenerator:
         assert filename == "test_output.xlsx"
         # Note: In a real test, you would check if the file exists
     
+    @pytest.mark.parametrize('engine', ['openpyxl', 'xlsxwriter'])
+    def test_to_excel_streaming(self, tmp_path, engine):
+        """Test that the streaming Excel writer matches the pandas writer"""
+        if engine == 'xlsxwriter':
+            pytest.importorskip('xlsxwriter')
+        config = DateDimensionConfig(start_year=1403, end_year=1403)
+        expected = pd.read_excel(DateDimensionGenerator(config).to_excel(str(tmp_path / 'pandas.xlsx')))
+        
+        filename = DateDimensionGenerator(config).to_excel(
+            str(tmp_path / 'streamed.xlsx'), streaming=True, engine=engine, chunk_days=100)
+        pd.testing.assert_frame_equal(pd.read_excel(filename), expected)
+    
+    @pytest.mark.parametrize('engine', ['openpyxl', 'xlsxwriter'])
+    def test_to_excel_streaming_compact(self, tmp_path, engine):
+        """Test that compact categoricals with missing values stream to Excel"""
+        if engine == 'xlsxwriter':
+            pytest.importorskip('xlsxwriter')
+        expected = pd.read_excel(DateDimensionGenerator(DateDimensionConfig(start_year=1402, end_year=1402)).to_excel(
+            str(tmp_path / 'full.xlsx'), streaming=True, engine=engine))
+        
+        filename = DateDimensionGenerator(DateDimensionConfig(start_year=1402, end_year=1402, compact=True)).to_excel(
+            str(tmp_path / 'compact.xlsx'), streaming=True, engine=engine, chunk_days=100)
+        actual = pd.read_excel(filename)
+        text_columns = [name for name in expected.columns
+                        if not pd.api.types.is_numeric_dtype(expected[name]) and name not in COMPACT_DTYPES]
+        assert 'shamsi_event_name' in text_columns
+        pd.testing.assert_frame_equal(actual[text_columns], expected[text_columns])
+    
+    def test_excel_sheet_split(self, tmp_path):
+        """Test that streamed Excel output continues on new sheets past the row limit"""
+        from multi_calendar_dimension.generator.export import write_excel
+        
+        df = DateDimensionGenerator(DateDimensionConfig(start_year=1403, end_year=1403)).generate()
+        filename = write_excel([df[:200], df[200:]], str(tmp_path / 'split.xlsx'), 'Date_Dimension',
+                               engine='openpyxl', max_rows=151)
+        
+        sheets = pd.read_excel(filename, sheet_name=None)
+        assert list(sheets) == ['Date_Dimension', 'Date_Dimension_2', 'Date_Dimension_3']
+        assert [len(sheet) for sheet in sheets.values()] == [150, 150, 66]
+        assert pd.concat(sheets.values())['shamsi_date'].tolist() == df['shamsi_date'].tolist()
+    
     def test_to_csv(self):
         """Test CSV export"""
         config = DateDimensionConfig(
@@ -179,6 +223,302 @@ class TestDateDimensionGenerator:
         
         assert all(thursdays['shamsi_is_weekend'] == 1)
         assert all(fridays['shamsi_is_weekend'] == 1)
+    
+    def test_columns_match_scalar_converters(self):
+        """Test generated calendar columns against the scalar converters"""
+        from datetime import date
+        from multi_calendar_dimension.converters.jalali import jalali_to_gregorian
+        from multi_calendar_dimension.converters.hijri import gregorian_to_hijri
+        
+        config = DateDimensionConfig(start_year=1356, end_year=1357, include_week_calculations=False)
+        df = DateDimensionGenerator(config).generate()
+        
+        for row in df.itertuples():
+            gy, gm, gd = jalali_to_gregorian(row.shamsi_year_id, row.shamsi_month_of_year_id, row.shamsi_day_of_month_id)
+            assert row.miladi_date == f"{gy:04d}-{gm:02d}-{gd:02d}"
+            assert (row.hijri_year_id, row.hijri_month_of_year_id, row.hijri_day_of_month_id) == gregorian_to_hijri(gy, gm, gd)
+            assert row.gregorian_day_of_year_id == date(gy, gm, gd).timetuple().tm_yday
+            assert row.miladi_day_of_week_title == date(gy, gm, gd).strftime('%A')
+    
+    def test_row_values(self):
+        """Test the values of a single generated row"""
+        config = DateDimensionConfig(start_year=1403, end_year=1403)
+        df = DateDimensionGenerator(config).generate()
+        row = df[df['shamsi_date'] == 14030101].iloc[0]
+        
+        assert row['miladi_date'] == '2024-03-20'
+        assert row['shamsi_next_date'] == 14030102
+        assert row['shamsi_month_title'] == 'فروردین 1403'
+        assert row['shamsi_season_title'] == 'بهار 1403'
+        assert row['gregorian_season_title'] == 'Spring 2024'
+        assert row['gregorian_half_year_title'] == 'H1 2024'
+        assert row['gregorian_next_date'] == '2024-03-21'
+        assert row['gregorian_day_of_year_id'] == 80
+        assert row['hijri_date'] == 14450910
+        assert row['shamsi_day_of_week_id'] == 5
+        assert row['shamsi_event_name'] == 'عید نوروز'
+        assert df['shamsi_next_date'].iloc[-1] == 14040101
+    
+    def test_week_numbering(self):
+        """Test Saturday-based Persian weeks and ISO Gregorian weeks"""
+        config = DateDimensionConfig(start_year=1403, end_year=1403, include_events=False)
+        df = DateDimensionGenerator(config).generate()
+        
+        # 1403/01/01 is a Wednesday, so the first Saturday starts week 2
+        farvardin = df[df['shamsi_month_id'] == 140301]
+        assert farvardin['week_num_in_month'].tolist()[:5] == [1, 1, 1, 2, 2]
+        assert farvardin['shamsi_week_id'].iloc[3] == '140301_2'
+        
+        # Weeks restart with every month
+        first_days = df[df['shamsi_day_of_month_id'] == 1]
+        assert (first_days['week_num_in_month'] == 1).all()
+        assert df['week_num_in_year'].max() == 53
+        
+        row = df[df['shamsi_date'] == 14031011].iloc[0]  # 2024-12-31
+        assert row['shamsi_week_title'] == f"هفته {row['week_num_in_year']} سال 1403"
+        assert row['gregorian_week_id'] == 1
+        assert row['gregorian_week_title'] == 'Week 1 2024'
+        assert row['gregorian_week_of_year_id'] == '2024_01'
+        # ISO week 1 at the end of December ranks first within the month
+        assert row['miladi_week_num_in_month'] == 1
+    
+    def test_date_span(self):
+        """Test that start_date/end_date select rows of the full-year table"""
+        full = DateDimensionGenerator(DateDimensionConfig(start_year=1402, end_year=1403)).generate()
+        config = DateDimensionConfig(start_year=1402, end_year=1403,
+                                     start_date=14021115, end_date=14030210)
+        df = DateDimensionGenerator(config).generate()
+        
+        assert df['shamsi_date'].iloc[0] == 14021115
+        assert df['shamsi_date'].iloc[-1] == 14030210
+        pd.testing.assert_frame_equal(df, full.loc[df.index])
+    
+    def test_generate_is_cached(self):
+        """Test that generation is reused until the config changes or refresh()"""
+        config = DateDimensionConfig(start_year=1403, end_year=1403)
+        generator = DateDimensionGenerator(config)
+        calls = []
+        build = generator._generate
+        generator._generate = lambda: calls.append(1) or build()
+        
+        df = generator.generate()
+        df['shamsi_date'] = 0  # callers get a copy
+        assert (generator.to_dataframe()['shamsi_date'] > 0).all()
+        assert len(calls) == 1
+        
+        config.end_year = 1404
+        assert len(generator.generate()) == 366 + 365
+        assert len(calls) == 2
+        
+        generator.refresh()
+        generator.generate()
+        assert len(calls) == 3
+    
+    def test_parallel_generation(self):
+        """Test that year shards built in worker processes match serial generation"""
+        serial = DateDimensionGenerator(DateDimensionConfig(
+            start_year=1402, end_year=1408, start_date=14020505)).generate()
+        parallel = DateDimensionGenerator(DateDimensionConfig(
+            start_year=1402, end_year=1408, start_date=14020505, workers=3)).generate()
+        
+        pd.testing.assert_frame_equal(parallel, serial)
+    
+    def test_iter_chunks(self):
+        """Test that chunks concatenate to the generated table"""
+        config = DateDimensionConfig(start_year=1402, end_year=1404)
+        chunks = list(DateDimensionGenerator(config).iter_chunks(chunk_days=100))
+        
+        assert len(chunks) == 11
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        pd.testing.assert_frame_equal(pd.concat(chunks), DateDimensionGenerator(config).generate())
+    
+    def test_iter_chunks_rejects_bad_chunk_size(self):
+        """Test that an invalid chunk size fails before any chunk is requested"""
+        generator = DateDimensionGenerator(DateDimensionConfig(start_year=1402, end_year=1402))
+        
+        with pytest.raises(ValueError):
+            generator.iter_chunks(0)
+    
+    def test_iter_chunks_compact(self):
+        """Test that compact chunks share categories and concatenate to the generated table"""
+        config = DateDimensionConfig(start_year=1402, end_year=1404, compact=True)
+        chunks = list(DateDimensionGenerator(config).iter_chunks(chunk_days=100))
+        
+        combined = pd.concat(chunks)
+        assert isinstance(combined['shamsi_month_title'].dtype, pd.CategoricalDtype)
+        assert isinstance(combined['shamsi_event_name'].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(combined, DateDimensionGenerator(config).generate())
+    
+    def test_chunked_csv(self, tmp_path):
+        """Test that the streamed CSV matches the CSV of the cached table"""
+        config = DateDimensionConfig(start_year=1403, end_year=1404)
+        streamed = DateDimensionGenerator(config).to_csv(str(tmp_path / 'streamed.csv'), chunk_days=50)
+        
+        generator = DateDimensionGenerator(config)
+        generator.generate()
+        cached = generator.to_csv(str(tmp_path / 'cached.csv'))
+        
+        with open(streamed, 'rb') as a, open(cached, 'rb') as b:
+            assert a.read() == b.read()
+    
+    def test_to_parquet_and_arrow(self, tmp_path):
+        """Test columnar exports with dictionary-encoded titles"""
+        pa = pytest.importorskip('pyarrow')
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+        
+        config = DateDimensionConfig(start_year=1403, end_year=1404)
+        expected = DateDimensionGenerator(config).generate()
+        
+        parquet_file = DateDimensionGenerator(config).to_parquet(str(tmp_path / 'dim.parquet'), chunk_days=100)
+        arrow_file = DateDimensionGenerator(config).to_arrow(str(tmp_path / 'dim.arrow'))
+        
+        for table in (pq.read_table(parquet_file), feather.read_table(arrow_file)):
+            assert table.num_rows == len(expected)
+            assert table.column_names == list(expected.columns)
+            assert pa.types.is_dictionary(table.schema.field('shamsi_month_title').type)
+            assert pa.types.is_dictionary(table.schema.field('miladi_day_of_week_title').type)
+            assert pa.types.is_string(table.schema.field('miladi_date').type)
+            assert pa.types.is_dictionary(table.schema.field('shamsi_event_name').type)
+            assert table.column('shamsi_date').to_pylist() == expected['shamsi_date'].tolist()
+            assert table.column('shamsi_month_title').to_pylist() == expected['shamsi_month_title'].tolist()
+    
+    def test_compact(self):
+        """Test compact dtypes carry the same values"""
+        full = DateDimensionGenerator(DateDimensionConfig(start_year=1402, end_year=1403)).generate()
+        compact = DateDimensionGenerator(DateDimensionConfig(start_year=1402, end_year=1403, compact=True)).generate()
+        
+        assert list(compact.columns) == list(full.columns)
+        assert compact['shamsi_date'].dtype == 'int32'
+        assert compact['shamsi_day_of_month_id'].dtype == 'int8'
+        assert compact['shamsi_is_holiday'].dtype == bool
+        assert isinstance(compact['shamsi_month_title'].dtype, pd.CategoricalDtype)
+        assert compact.memory_usage(deep=True).sum() * 4 < full.memory_usage(deep=True).sum()
+        
+        # Week ids are integers instead of strings such as '1403_05'
+        row = compact[compact['shamsi_date'] == 14030210].iloc[0]
+        full_row = full[full['shamsi_date'] == 14030210].iloc[0]
+        assert full_row['shamsi_week_of_year_id'] == f"{row['shamsi_week_of_year_id'] // 100}_{row['shamsi_week_of_year_id'] % 100:02d}"
+        assert full_row['shamsi_week_id'] == f"{row['shamsi_week_id'] // 100}_{row['shamsi_week_id'] % 100}"
+        
+        week_ids = {'shamsi_week_id', 'shamsi_week_of_year_id', 'gregorian_week_of_year_id'}
+        for name in full.columns:
+            if name not in week_ids:
+                assert (compact[name].astype(object).fillna('').tolist()
+                        == full[name].astype(object).fillna('').tolist()), name
+    
+    def test_extend(self):
+        """Test that extending a table equals generating the whole span"""
+        expected = DateDimensionGenerator(DateDimensionConfig(start_year=1405, end_year=1409)).generate()
+        generator = DateDimensionGenerator(DateDimensionConfig(start_year=1405, end_year=1406))
+        existing = generator.generate()
+        
+        pd.testing.assert_frame_equal(generator.extend(existing, 1409), expected)
+        
+        new_rows = generator.extend(existing, 1409, only_new=True)
+        assert new_rows['shamsi_date'].iloc[0] == 14070101
+        pd.testing.assert_frame_equal(new_rows, expected.iloc[len(existing):])
+        
+        with pytest.raises(ValueError):
+            generator.extend(existing, 1406)
+        with pytest.raises(ValueError):
+            generator.extend(existing.iloc[:-1], 1409)
+    
+    def test_invalid_workers(self):
+        """Test that a non-positive worker count is rejected"""
+        generator = DateDimensionGenerator(DateDimensionConfig(start_year=1403, end_year=1403, workers=0))
+        with pytest.raises(ValueError):
+            generator.generate()
+
+
+class TestDimensionCache:
+    """Test the on-disk dimension cache"""
+    
+    def test_generate_uses_disk_cache(self, tmp_path):
+        """Test that a second generator loads the stored table"""
+        config = DateDimensionConfig(start_year=1402, end_year=1403, cache=True, cache_dir=str(tmp_path))
+        expected = DateDimensionGenerator(config).generate()
+        
+        generator = DateDimensionGenerator(config)
+        generator._build_table = lambda: pytest.fail("table should come from the disk cache")
+        pd.testing.assert_frame_equal(generator.generate(), expected)
+        pd.testing.assert_frame_equal(expected, DateDimensionGenerator(
+            DateDimensionConfig(start_year=1402, end_year=1403)).generate())
+    
+    def test_compact_round_trip(self, tmp_path):
+        """Test that compact dtypes and categoricals survive the cache"""
+        config = DateDimensionConfig(start_year=1403, end_year=1403, compact=True, cache=True, cache_dir=str(tmp_path))
+        expected = DateDimensionGenerator(config).generate()
+        pd.testing.assert_frame_equal(DateDimensionGenerator(config).generate(), expected)
+    
+    def test_store_keeps_concurrent_entry(self, tmp_path, monkeypatch):
+        """Test that storing a key another process has just stored keeps that entry"""
+        from multi_calendar_dimension.generator import cache as cache_module
+        
+        cache = cache_module.DimensionCache(str(tmp_path))
+        first = DateDimensionGenerator(DateDimensionConfig(start_year=1403, end_year=1403)).generate()
+        cache.store('key', first)
+        
+        # The existing entry survives the removal, as if another writer recreated it
+        entry = os.path.join(str(tmp_path), 'key')
+        rmtree = shutil.rmtree
+        monkeypatch.setattr(cache_module.shutil, 'rmtree',
+                            lambda path, ignore_errors=False: None if path == entry else rmtree(path, ignore_errors))
+        cache.store('key', first[:10])
+        
+        assert cache.load('key')['shamsi_date'].tolist() == first['shamsi_date'].tolist()
+        assert os.listdir(str(tmp_path)) == ['key']
+    
+    def test_load_from_read_only_cache(self, tmp_path, monkeypatch):
+        """Test that a cache hit does not need to update the entry's last use"""
+        from multi_calendar_dimension.generator import cache as cache_module
+        
+        cache = cache_module.DimensionCache(str(tmp_path))
+        expected = DateDimensionGenerator(DateDimensionConfig(start_year=1403, end_year=1403)).generate()
+        cache.store('key', expected)
+        
+        def utime(path, *args, **kwargs):
+            raise PermissionError(13, "Read-only file system", path)
+        
+        monkeypatch.setattr(cache_module.os, 'utime', utime)
+        assert cache.load('key')['shamsi_date'].tolist() == expected['shamsi_date'].tolist()
+    
+    def test_failed_store_does_not_fail_generate(self, tmp_path, monkeypatch):
+        """Test that a cache write error only warns"""
+        from multi_calendar_dimension.generator.cache import DimensionCache
+        
+        def store(self, key, df):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(DimensionCache, 'store', store)
+        config = DateDimensionConfig(start_year=1403, end_year=1403, cache=True, cache_dir=str(tmp_path))
+        with pytest.warns(RuntimeWarning):
+            df = DateDimensionGenerator(config).generate()
+        assert len(df) > 0
+    
+    def test_key(self):
+        """Test that only content settings change the key"""
+        from multi_calendar_dimension.generator.cache import DimensionCache
+        
+        cache = DimensionCache()
+        key = cache.key(DateDimensionConfig(start_year=1403, end_year=1403))
+        assert key == cache.key(DateDimensionConfig(start_year=1403, end_year=1403, workers=4, cache=True))
+        assert key != cache.key(DateDimensionConfig(start_year=1403, end_year=1403, include_events=False))
+    
+    def test_eviction_and_clear(self, tmp_path):
+        """Test LRU eviction past the size limit, stats and clear"""
+        from multi_calendar_dimension.generator.cache import DimensionCache
+        
+        cache = DimensionCache(str(tmp_path), max_bytes=1)
+        df = DateDimensionGenerator(DateDimensionConfig(start_year=1403, end_year=1403)).generate()
+        cache.store('first', df)
+        cache.store('second', df)
+        
+        assert cache.load('first') is None
+        assert cache.load('second') is not None
+        assert cache.stats()['entries'] == 1
+        assert cache.clear() == 1
+        assert cache.stats()['entries'] == 0
 
 
 class TestDateRangeGenerator:
@@ -272,6 +612,21 @@ class TestDateRangeGenerator:
         assert isinstance(df, pd.DataFrame)
         assert len(df) > 0
     
+    def test_range_matches_full_years(self):
+        """Test that a range equals the same months of the full-year dimension"""
+        full = DateDimensionGenerator(DateDimensionConfig(start_year=1403, end_year=1404)).generate()
+        config = DateRangeConfig(
+            calendar_type=CalendarType.GREGORIAN,
+            start_year=2024,
+            start_month=12,
+            end_year=2025,
+            end_month=4
+        )
+        df = DateRangeGenerator(config).generate()
+        
+        expected = full[(full['shamsi_month_id'] >= 140309) & (full['shamsi_month_id'] <= 140402)]
+        pd.testing.assert_frame_equal(df, expected)
+    
     def test_get_summary(self):
         """Test summary generation"""
         config = DateRangeConfig(
@@ -291,6 +646,44 @@ class TestDateRangeGenerator:
         assert 'calendar_type' in summary
         assert summary['calendar_type'] == 'jalali'
     
+    def test_summary_reuses_generation(self):
+        """Test that exports and summaries share one cached generation"""
+        config = DateRangeConfig(
+            calendar_type=CalendarType.JALALI,
+            start_year=1403,
+            start_month=1,
+            end_year=1403,
+            end_month=3
+        )
+        generator = DateRangeGenerator(config)
+        calls = []
+        build = generator._generate
+        generator._generate = lambda: calls.append(1) or build()
+        
+        df = generator.to_dataframe()
+        summary = generator.get_summary()
+        assert summary['total_days'] == len(df) == 93
+        assert len(calls) == 1
+        
+        config.end_month = 1
+        assert generator.get_summary()['total_days'] == 31
+        assert len(calls) == 2
+    
+    def test_range_to_parquet(self, tmp_path):
+        """Test Parquet export of a date range"""
+        pytest.importorskip('pyarrow')
+        import pyarrow.parquet as pq
+        
+        config = DateRangeConfig(
+            calendar_type=CalendarType.JALALI,
+            start_year=1403,
+            start_month=1,
+            end_year=1403,
+            end_month=3
+        )
+        filename = DateRangeGenerator(config).to_parquet(str(tmp_path / 'range.parquet'))
+        assert pq.read_table(filename).num_rows == 93
+    
     def test_empty_range(self):
         """Test empty range handling"""
         config = DateRangeConfig(
@@ -3,6 +3,9 @@ Test suite for main module
 تست‌های ماژول اصلی
 """
 
+import subprocess
+import sys
+
 import pytest
 from multi_calendar_dimension import (
     DateDimensionGenerator, DateRangeGenerator, CurrentDate,
@@ -65,6 +68,28 @@ class TestMainModuleImports:
         current = CurrentDate()
         assert current is not None
 
+    def test_converters_import_without_pandas(self):
+        """Test that importing converters loads neither pandas nor the event tables"""
+        code = (
+            "import sys\n"
+            "from multi_calendar_dimension import gregorian_to_jalali\n"
+            "assert gregorian_to_jalali(2024, 3, 20) == (1403, 1, 1)\n"
+            "assert 'pandas' not in sys.modules\n"
+            "assert 'multi_calendar_dimension.events' not in sys.modules\n"
+            "import multi_calendar_dimension\n"
+            "assert multi_calendar_dimension.persian_holidays[(1, 1)] == 1\n"
+            "assert 'pandas' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+    
+    def test_lazy_names_resolve(self):
+        """Test that every name in __all__ resolves"""
+        import multi_calendar_dimension
+        for name in multi_calendar_dimension.__all__:
+            assert getattr(multi_calendar_dimension, name) is not None
+        with pytest.raises(AttributeError):
+            multi_calendar_dimension.not_a_name
+
 
 class TestMainModuleFunctionality:
     """Test main module functionality"""
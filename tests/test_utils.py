@@ -0,0 +1,92 @@
+"""
+Test suite for utils module
+تست‌های ماژول utils
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from multi_calendar_dimension.utils import (
+    is_iranian_holiday, is_iranian_holiday_batch, HOLIDAY_TYPES,
+    BusinessCalendar, get_business_calendar
+)
+
+
+class TestHolidayBatch:
+    """Test the vectorized holiday checker"""
+    
+    def test_matches_scalar_checker(self):
+        """Test that batch results match is_iranian_holiday"""
+        dates = [(1403, month, day) for month in (1, 3, 5, 12) for day in range(1, 30)]
+        years, months, days = (np.array(part) for part in zip(*dates))
+        is_holiday, codes = is_iranian_holiday_batch(years, months, days, include_friday=False)
+        for (year, month, day), flag, code in zip(dates, is_holiday, codes):
+            result = is_iranian_holiday(year, month, day)
+            assert flag == result['is_holiday']
+            assert HOLIDAY_TYPES[code] == result['holiday_type']
+    
+    def test_packed_series_and_fridays(self):
+        """Test packed dates, Series input and Friday detection"""
+        dates = pd.Series([14030101, 14030110, 14030111, 14030120])
+        is_holiday, codes = is_iranian_holiday_batch(dates)
+        assert is_holiday.tolist() == [True, True, False, False]
+        assert [HOLIDAY_TYPES[code] for code in codes] == ['persian', 'friday', None, None]
+
+
+class TestBusinessCalendar:
+    """Test the business-day calendar"""
+    
+    def _is_working(self, year, month, day):
+        return not is_iranian_holiday_batch(year, month, day)[0]
+    
+    def test_add_business_days(self):
+        """Test offsets across the Nowruz holidays"""
+        calendar = get_business_calendar()
+        assert calendar.next_business_day((1403, 1, 1)) == (1403, 1, 5)
+        assert calendar.add_business_days((1403, 1, 1), 0) == (1403, 1, 5)
+        assert calendar.add_business_days((1403, 1, 5), 0) == (1403, 1, 5)
+        assert calendar.previous_business_day((1403, 1, 5)) == (1402, 12, 28)
+        assert calendar.add_business_days((2024, 3, 20), 1, calendar='gregorian') == (2024, 3, 24)
+    
+    def test_matches_day_by_day_count(self):
+        """Test counts and offsets against a day-by-day walk"""
+        calendar = get_business_calendar()
+        days = [(1403, 1, day) for day in range(1, 32)] + [(1403, 2, day) for day in range(1, 32)]
+        working = [day for day in days if self._is_working(*day)]
+        assert calendar.business_days_between(days[0], days[-1]) == len(working) - self._is_working(*days[-1])
+        assert calendar.business_days_between(days[-1], days[0]) == -calendar.business_days_between(days[0], days[-1])
+        for n, day in enumerate(working, start=1):
+            assert calendar.add_business_days(days[0], n) == day
+    
+    def test_array_methods(self):
+        """Test that array methods match the scalar methods"""
+        calendar = get_business_calendar()
+        dates = np.array([14030101, 14030110, 14030320, 14031229])
+        shifted = calendar.add_business_days_array(dates, [1, -1, 5, 2])
+        expected = [calendar.add_business_days((d // 10000, d // 100 % 100, d % 100), n)
+                    for d, n in zip(dates.tolist(), [1, -1, 5, 2])]
+        assert [(d // 10000, d // 100 % 100, d % 100) for d in shifted.tolist()] == expected
+        assert calendar.business_days_between_array(14030101, [14030201, 14040101]).tolist() == [
+            calendar.business_days_between((1403, 1, 1), (1403, 2, 1)),
+            calendar.business_days_between((1403, 1, 1), (1404, 1, 1)),
+        ]
+        assert calendar.is_business_day_array([14030101, 14030105]).tolist() == [False, True]
+    
+    def test_custom_weekend_and_closures(self):
+        """Test Thursday weekends and extra closures"""
+        calendar = BusinessCalendar(weekend=(6, 7), extra_holidays=[14030105])
+        assert not calendar.is_business_day((1403, 1, 5))
+        assert not calendar.is_business_day((1403, 1, 9))  # Thursday
+        assert calendar.next_business_day((1403, 1, 1)) == (1403, 1, 6)
+    
+    def test_outside_window(self):
+        """Test errors outside the supported window"""
+        calendar = get_business_calendar()
+        with pytest.raises(ValueError):
+            calendar.add_business_days((1456, 8, 20), 100)
+        with pytest.raises(ValueError):
+            calendar.is_business_day((1200, 1, 1))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])